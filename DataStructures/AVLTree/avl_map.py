@@ -0,0 +1,265 @@
+from typing import Any, Iterator, List, Optional, Tuple
+
+try:
+    from .avl_tree import AVLTree, CountingAVLTree, Node
+except ImportError:  # Run as a script from this directory
+    from avl_tree import AVLTree, CountingAVLTree, Node
+
+_MISSING = object()
+
+
+class MapNode(Node):
+    """
+    Node structure for AVLMap: an AVL Tree node that also holds
+    - value: The value associated with the key
+    - size: Number of nodes in the subtree rooted at this node, for rank/select
+    """
+    __slots__ = ("value", "size")
+
+    def __init__(self, key, value):
+        super().__init__(key)
+        self.value = value
+        self.size = 1
+
+
+def _size(node: Optional[MapNode]) -> int:
+    return node.size if node else 0
+
+
+class AVLMap(AVLTree):
+    """
+    A sorted map (key -> value) backed by an AVL Tree.
+
+    Insertion, deletion and lookup walk down the tree in a loop and keep the
+    path on a list, then rebalance bottom-up along that path, so no operation
+    recurses. Every node also stores the size of its subtree, which gives
+    rank (position of a key) and select (key at a position) in O(log n).
+
+    Keys are unique: setting an existing key replaces its value.
+    """
+    node_class = MapNode  # Subclasses that augment the nodes override it
+
+    def __init__(self, items=()):
+        self.root: Optional[MapNode] = None
+        for key, value in items:
+            self[key] = value
+
+    def __setitem__(self, key, value) -> None:
+        """Inserts or replaces the value of a key in O(log n)."""
+        path: List[MapNode] = []
+        node = self.root
+        while node:
+            if key == node.key:
+                node.value = value
+                return
+            path.append(node)
+            node = node.left if key < node.key else node.right
+
+        new_node = self.node_class(key, value)
+        if not path:
+            self.root = new_node
+            return
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+        self._rebalance_path(path)
+
+    def __getitem__(self, key):
+        node = self._find(key)
+        if node is None:
+            raise KeyError(key)
+        return node.value
+
+    def __delitem__(self, key) -> None:
+        """Removes a key in O(log n); raises KeyError if it is missing."""
+        path: List[MapNode] = []
+        node = self.root
+        while node and key != node.key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        if node is None:
+            raise KeyError(key)
+
+        if node.left and node.right:
+            # Replace the node's entry with its successor's, then unlink the successor
+            path.append(node)
+            successor = node.right
+            while successor.left:
+                path.append(successor)
+                successor = successor.left
+            node.key, node.value = successor.key, successor.value
+            node = successor
+
+        child = node.left or node.right
+        if not path:
+            self.root = child
+            return
+        parent = path[-1]
+        if parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+        self._rebalance_path(path)
+
+    def get(self, key, default=None):
+        """Returns the value of a key, or default if it is missing."""
+        node = self._find(key)
+        return default if node is None else node.value
+
+    def pop(self, key, default=_MISSING):
+        """Removes a key and returns its value (or default if it is missing)."""
+        node = self._find(key)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        value = node.value
+        del self[key]
+        return value
+
+    def rank(self, key) -> int:
+        """Returns the number of keys smaller than key, whether or not key is present."""
+        rank = 0
+        node = self.root
+        while node:
+            if key <= node.key:
+                node = node.left
+            else:
+                rank += _size(node.left) + 1
+                node = node.right
+        return rank
+
+    def select(self, index: int):
+        """Returns the key at a position of the sorted order (negative positions count from the end)."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Index out of range.")
+        node = self.root
+        while True:
+            left_size = _size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node.key
+            else:
+                index -= left_size + 1
+                node = node.right
+
+    def items(self, low=None, high=None) -> Iterator[Tuple[Any, Any]]:
+        """
+        Lazily yields the (key, value) pairs with low <= key < high, in key order.
+
+        Either bound may be None for an open range. Subtrees outside the range
+        are skipped, so a scan costs O(log n + number of pairs yielded).
+        """
+        stack: List[MapNode] = []
+        node = self.root
+        while stack or node:
+            while node:
+                if low is not None and node.key < low:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if high is not None and node.key >= high:
+                return
+            yield node.key, node.value
+            node = node.right
+
+    def range(self, low=None, high=None) -> Iterator[Any]:
+        """Lazily yields the keys with low <= key < high, in order."""
+        for key, _ in self.items(low, high):
+            yield key
+
+    def keys(self) -> Iterator[Any]:
+        return self.range()
+
+    def values(self) -> Iterator[Any]:
+        for _, value in self.items():
+            yield value
+
+    def __contains__(self, key) -> bool:
+        return self._find(key) is not None
+
+    def __len__(self) -> int:
+        return _size(self.root)
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.range()
+
+    def __repr__(self) -> str:
+        return f"AVLMap({list(self.items())})"
+
+    def rotate_right(self, y):
+        x = super().rotate_right(y)
+        y.size = 1 + _size(y.left) + _size(y.right)
+        x.size = 1 + _size(x.left) + _size(x.right)
+        return x
+
+    def rotate_left(self, x):
+        y = super().rotate_left(x)
+        x.size = 1 + _size(x.left) + _size(x.right)
+        y.size = 1 + _size(y.left) + _size(y.right)
+        return y
+
+    def _find(self, key) -> Optional[MapNode]:
+        node = self.root
+        while node:
+            if key == node.key:
+                return node
+            node = node.left if key < node.key else node.right
+        return None
+
+    def _rebalance(self, node: MapNode) -> MapNode:
+        """
+        Updates the height and size of a node and rotates it if unbalanced.
+        Returns the new root of the subtree.
+        """
+        node.height = 1 + max(self.get_height(node.left), self.get_height(node.right))
+        node.size = 1 + _size(node.left) + _size(node.right)
+        balance = self.get_balance(node)
+        if balance > 1:
+            if self.get_balance(node.left) < 0:
+                node.left = self.rotate_left(node.left)  # Left Right Case
+            return self.rotate_right(node)
+        if balance < -1:
+            if self.get_balance(node.right) > 0:
+                node.right = self.rotate_right(node.right)  # Right Left Case
+            return self.rotate_left(node)
+        return node
+
+    def _rebalance_path(self, path: List[MapNode]) -> None:
+        """Rebalances the nodes of a root-to-leaf path bottom-up, relinking rotated subtrees."""
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            subtree = self._rebalance(node)
+            if subtree is not node:
+                if depth == 0:
+                    self.root = subtree
+                elif path[depth - 1].left is node:
+                    path[depth - 1].left = subtree
+                else:
+                    path[depth - 1].right = subtree
+
+
+class CountingAVLMap(CountingAVLTree, AVLMap):
+    """An AVLMap that counts its rotations in counters["rotations"], for benchmarks."""
+
+
+# Example usage
+if __name__ == "__main__":
+    prices = AVLMap()
+    for day, price in [(5, 10.5), (1, 9.0), (3, 9.75), (8, 11.2), (2, 9.25)]:
+        prices[day] = price
+
+    print(prices[3])  # Output: 9.75
+    print(list(prices.items(2, 6)))  # Output: [(2, 9.25), (3, 9.75), (5, 10.5)]
+    print(prices.rank(5), prices.select(0))  # Output: 3 1
+    del prices[1]
+    print(len(prices), prices.select(0))  # Output: 4 2
@@ -0,0 +1,161 @@
+import bisect
+import importlib.util
+import math
+import os
+import random
+import sys
+import time
+
+from avl_map import AVLMap
+
+# SkipList lives in a sibling directory: load it from its file
+_spec = importlib.util.spec_from_file_location(
+    "skiplist", os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "SkipList", "skiplist.py")
+)
+_skiplist = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_skiplist)
+SkipList = _skiplist.SkipList
+
+SCAN_LENGTH = 100
+
+
+class SortedListMap:
+    """Baseline: parallel sorted lists of keys and values searched with bisect."""
+
+    def __init__(self):
+        self.keys = []
+        self.values = []
+
+    def insert(self, key, value):
+        index = bisect.bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            self.values[index] = value
+        else:
+            self.keys.insert(index, key)  # O(n) memmove
+            self.values.insert(index, value)
+
+    def get(self, key):
+        index = bisect.bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            return self.values[index]
+        return None
+
+    def delete(self, key):
+        index = bisect.bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            del self.keys[index]
+            del self.values[index]
+
+    def scan(self, key, count):
+        index = bisect.bisect_left(self.keys, key)
+        return self.keys[index:index + count]
+
+
+def skiplist_scan(skiplist, key, count):
+    """SkipList has no range query: descend to the first key >= key, then follow level 0."""
+    current = skiplist.head
+    for level in range(skiplist.level, -1, -1):
+        while current.forward[level] and current.forward[level].key < key:
+            current = current.forward[level]
+    keys = []
+    current = current.forward[0]
+    while current and len(keys) < count:
+        keys.append(current.key)
+        current = current.forward[0]
+    return keys
+
+
+def make_workload(n, operations):
+    """Even keys are loaded; the mix reads, inserts odd keys, deletes loaded keys and scans."""
+    keys = list(range(0, 2 * n, 2))
+    random.shuffle(keys)
+    workload = []
+    for _ in range(operations):
+        roll = random.random()
+        if roll < 0.5:
+            workload.append(("get", random.randrange(0, 2 * n, 2)))
+        elif roll < 0.7:
+            workload.append(("insert", random.randrange(1, 2 * n, 2)))
+        elif roll < 0.9:
+            workload.append(("delete", random.randrange(0, 2 * n, 2)))
+        else:
+            workload.append(("scan", random.randrange(2 * n)))
+    return keys, workload
+
+
+def run_avl(keys, workload):
+    tree = AVLMap()
+    start = time.perf_counter()
+    for key in keys:
+        tree[key] = key
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for operation, key in workload:
+        if operation == "get":
+            tree.get(key)
+        elif operation == "insert":
+            tree[key] = key
+        elif operation == "delete":
+            tree.pop(key, None)
+        else:
+            for _ in zip(range(SCAN_LENGTH), tree.items(key)):
+                pass
+    return build, time.perf_counter() - start
+
+
+def run_sorted_list(keys, workload):
+    sorted_map = SortedListMap()
+    start = time.perf_counter()
+    for key in keys:
+        sorted_map.insert(key, key)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for operation, key in workload:
+        if operation == "get":
+            sorted_map.get(key)
+        elif operation == "insert":
+            sorted_map.insert(key, key)
+        elif operation == "delete":
+            sorted_map.delete(key)
+        else:
+            sorted_map.scan(key, SCAN_LENGTH)
+    return build, time.perf_counter() - start
+
+
+def run_skiplist(keys, workload):
+    skiplist = SkipList(max_level=max(1, int(math.log2(len(keys)))), p=0.5)
+    start = time.perf_counter()
+    for key in keys:
+        skiplist.insert(key)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for operation, key in workload:
+        if operation == "get":
+            skiplist.search(key)
+        elif operation == "insert":
+            if not skiplist.search(key):  # SkipList keeps duplicates
+                skiplist.insert(key)
+        elif operation == "delete":
+            skiplist.delete(key)
+        else:
+            skiplist_scan(skiplist, key, SCAN_LENGTH)
+    return build, time.perf_counter() - start
+
+
+#############
+# Benchmark #
+#############
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    operations = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+    keys, workload = make_workload(n, operations)
+
+    print(f"{n} random inserts, then {operations} operations: 50% get, 20% insert, 20% delete, "
+          f"10% scan of {SCAN_LENGTH} keys")
+    print(f"{'structure':>20} {'build (s)':>10} {'mixed (s)':>10} {'mixed ops/sec':>14}")
+    for name, runner in (("AVLMap", run_avl), ("bisect sorted list", run_sorted_list), ("SkipList", run_skiplist)):
+        build, mixed = runner(keys, workload)
+        print(f"{name:>20} {build:>10.2f} {mixed:>10.2f} {operations / mixed:>14,.0f}")
@@ -1,4 +1,9 @@
+from collections import Counter
+
+
 class Node:
+    __slots__ = ("key", "left", "right", "height")
+
     def __init__(self, key):
         """
         Node structure for AVL Tree.
@@ -109,11 +114,29 @@ class AVLTree:
         return root  # Return the unchanged root if no rotation is needed
 
 
-# Example usage
-tree = AVLTree()
-root = None
+class CountingAVLTree(AVLTree):
+    """An AVLTree that counts its rotations in counters["rotations"]."""
+
+    def __init__(self, *args, **kwargs):
+        # Before the base initializer, which may insert initial items (AVLMap)
+        self.counters = Counter()
+        super().__init__(*args, **kwargs)
 
-# Insert elements into the AVL Tree
-elements = [10, 20, 30, 40, 50, 25]
-for elem in elements:
-    root = tree.insert(root, elem)
+    def rotate_right(self, y):
+        self.counters["rotations"] += 1
+        return super().rotate_right(y)
+
+    def rotate_left(self, x):
+        self.counters["rotations"] += 1
+        return super().rotate_left(x)
+
+
+# Example usage
+if __name__ == "__main__":
+    tree = AVLTree()
+    root = None
+
+    # Insert elements into the AVL Tree
+    elements = [10, 20, 30, 40, 50, 25]
+    for elem in elements:
+        root = tree.insert(root, elem)
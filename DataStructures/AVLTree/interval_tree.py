@@ -0,0 +1,153 @@
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from .avl_map import AVLMap, MapNode, _size
+except ImportError:  # Run as a script from this directory
+    from avl_map import AVLMap, MapNode, _size
+
+
+class IntervalNode(MapNode):
+    """
+    Node structure for IntervalTree: an AVLMap node that also holds
+    - max_end: The largest interval end in the subtree rooted at this node
+    """
+    __slots__ = ("max_end",)
+
+    def __init__(self, key, value):
+        super().__init__(key, value)
+        self.max_end = key[1]
+
+
+def _update(node: IntervalNode) -> None:
+    """Recomputes max_end of a node from its own interval and its children."""
+    max_end = node.key[1]
+    if node.left and node.left.max_end > max_end:
+        max_end = node.left.max_end
+    if node.right and node.right.max_end > max_end:
+        max_end = node.right.max_end
+    node.max_end = max_end
+
+
+class IntervalTree(AVLMap):
+    """
+    An interval tree: an AVLMap keyed by intervals, ordered by start.
+
+    An interval is a tuple whose first two items are its start and end,
+    both included: (start, end), or (start, end, weight) as used by
+    weighted interval scheduling. Extra items tell apart intervals with the
+    same bounds, such as two reservations of the same slot.
+
+    Every node also stores the largest end in its subtree. A query skips
+    any subtree whose largest end is before the query, and stops at the
+    first start after it. Inserting, deleting and rotating keep that
+    augmentation up to date in O(1) per node of the rebalanced path.
+    """
+    node_class = IntervalNode
+
+    def __setitem__(self, interval, value) -> None:
+        """Inserts an interval (or replaces its value) in O(log n)."""
+        if interval[0] > interval[1]:
+            raise ValueError(f"The interval {interval} ends before it starts.")
+        super().__setitem__(interval, value)
+
+    def add(self, interval, value=None) -> None:
+        """Inserts an interval, with an optional value attached to it."""
+        self[interval] = value
+
+    @classmethod
+    def from_sorted(cls, items: Iterable[Tuple[Any, Any]]) -> "IntervalTree":
+        """
+        Builds a balanced tree from (interval, value) pairs sorted by unique intervals, in O(n).
+
+        Sorting a batch of reservations once and bulk building is much faster
+        than inserting them one by one.
+        """
+        items = list(items)
+        tree = cls()
+
+        def build(low: int, high: int) -> Optional[IntervalNode]:
+            # Recursion depth is the tree height, O(log n)
+            if low >= high:
+                return None
+            middle = (low + high) // 2
+            interval, value = items[middle]
+            if interval[0] > interval[1]:
+                raise ValueError(f"The interval {interval} ends before it starts.")
+            node = IntervalNode(interval, value)
+            node.left = build(low, middle)
+            node.right = build(middle + 1, high)
+            node.height = 1 + max(tree.get_height(node.left), tree.get_height(node.right))
+            node.size = 1 + _size(node.left) + _size(node.right)
+            _update(node)
+            return node
+
+        tree.root = build(0, len(items))
+        return tree
+
+    def overlap_items(self, low, high) -> Iterator[Tuple[Any, Any]]:
+        """
+        Lazily yields the (interval, value) pairs that overlap [low, high], by start.
+
+        An interval (start, end) overlaps when start <= high and end >= low.
+        Every node visited either overlaps or is an ancestor of one that does,
+        so a query costs O(log n) plus O(log n) per interval yielded at worst,
+        and close to O(log n + k) when the overlapping intervals are clustered.
+        """
+        stack: List[IntervalNode] = []
+        node = self.root
+        while stack or node:
+            while node and node.max_end >= low:  # Otherwise nothing in the subtree reaches low
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.key[0] > high:
+                return  # Every later interval starts after high
+            if node.key[1] >= low:
+                yield node.key, node.value
+            node = node.right
+
+    def overlap(self, low, high) -> Iterator[Any]:
+        """Lazily yields the intervals that overlap [low, high], by start."""
+        for interval, _ in self.overlap_items(low, high):
+            yield interval
+
+    def stab(self, point) -> Iterator[Any]:
+        """Lazily yields the intervals that contain a point, by start."""
+        return self.overlap(point, point)
+
+    def __repr__(self) -> str:
+        return f"IntervalTree({list(self.items())})"
+
+    def rotate_right(self, y):
+        x = super().rotate_right(y)
+        _update(y)  # y is now the child of x
+        _update(x)
+        return x
+
+    def rotate_left(self, x):
+        y = super().rotate_left(x)
+        _update(x)
+        _update(y)
+        return y
+
+    def _rebalance(self, node: IntervalNode) -> IntervalNode:
+        _update(node)
+        return super()._rebalance(node)
+
+
+# Example usage
+if __name__ == "__main__":
+    reservations = IntervalTree()
+    for interval in [(5, 8, 150), (1, 3, 50), (2, 5, 20), (4, 6, 100), (6, 7, 200)]:
+        reservations.add(interval)
+
+    print(list(reservations.overlap(3, 4)))  # Output: [(1, 3, 50), (2, 5, 20), (4, 6, 100)]
+    print(list(reservations.stab(6)))  # Output: [(4, 6, 100), (5, 8, 150), (6, 7, 200)]
+    del reservations[(4, 6, 100)]
+    print(list(reservations.stab(6)))  # Output: [(5, 8, 150), (6, 7, 200)]
+
+    # Bulk build from sorted intervals
+    hours = IntervalTree.from_sorted(((hour, hour + 2), f"slot {hour}") for hour in range(0, 24, 2))
+    print(list(hours.overlap_items(9, 10)))  # Output: [((8, 10), 'slot 8'), ((10, 12), 'slot 10')]
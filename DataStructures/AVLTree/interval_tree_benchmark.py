@@ -0,0 +1,64 @@
+import random
+import sys
+import time
+
+from interval_tree import IntervalTree
+
+DAY = 24 * 60  # Reservations are minutes over a year
+HORIZON = 365 * DAY
+
+
+def make_reservations(n):
+    """(start, end, id) intervals of 15 minutes to 4 hours, spread over the horizon."""
+    reservations = []
+    for reservation_id in range(n):
+        start = random.randrange(HORIZON)
+        reservations.append((start, start + random.randrange(15, 4 * 60), reservation_id))
+    return reservations
+
+
+def linear_overlap(intervals, low, high):
+    return [interval for interval in intervals if interval[0] <= high and interval[1] >= low]
+
+
+#############
+# Benchmark #
+#############
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    reservations = make_reservations(n)
+    windows = []
+    for _ in range(queries):
+        low = random.randrange(HORIZON)
+        windows.append((low, low + 60))  # One-hour windows
+
+    print(f"{n} reservations, {queries} overlap queries of one hour")
+
+    start = time.perf_counter()
+    tree = IntervalTree()
+    for interval in reservations:
+        tree[interval] = None
+    print(f"IntervalTree inserts:    {n / (time.perf_counter() - start):>12,.0f} intervals/sec")
+
+    start = time.perf_counter()
+    built = IntervalTree.from_sorted((interval, None) for interval in sorted(reservations))
+    print(f"sort + from_sorted:      {n / (time.perf_counter() - start):>12,.0f} intervals/sec")
+
+    start = time.perf_counter()
+    found = sum(len(list(tree.overlap(low, high))) for low, high in windows)
+    tree_rate = queries / (time.perf_counter() - start)
+    print(f"IntervalTree queries:    {tree_rate:>12,.0f} queries/sec ({found / queries:.1f} results each)")
+
+    linear_queries = windows[:max(1, queries // 100)]
+    start = time.perf_counter()
+    for low, high in linear_queries:
+        linear_overlap(reservations, low, high)
+    linear_rate = len(linear_queries) / (time.perf_counter() - start)
+    print(f"linear scan queries:     {linear_rate:>12,.0f} queries/sec")
+    print(f"speedup: {tree_rate / linear_rate:,.0f}x")
+
+    start = time.perf_counter()
+    for interval in random.sample(reservations, min(n, 100_000)):
+        del tree[interval]
+    print(f"IntervalTree deletes:    {min(n, 100_000) / (time.perf_counter() - start):>12,.0f} intervals/sec")
@@ -0,0 +1,316 @@
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+_MISSING = object()
+
+
+class Leaf:
+    """A leaf node: sorted keys, their values, and the next leaf in key order."""
+    __slots__ = ("keys", "values", "next")
+
+    def __init__(self, keys: List[Any], values: List[Any]) -> None:
+        self.keys = keys
+        self.values = values
+        self.next: Optional[Leaf] = None
+
+
+class Internal:
+    """
+    An internal node: children[i] holds the keys < keys[i], and
+    children[i + 1] the keys >= keys[i].
+    """
+    __slots__ = ("keys", "children")
+
+    def __init__(self, keys: List[Any], children: List[Any]) -> None:
+        self.keys = keys
+        self.children = children
+
+
+class BTree:
+    """
+    An in-memory B-tree ordered map (in its B+tree variant).
+
+    Each node holds up to `order` sorted keys in a plain list, searched with
+    bisect, so a lookup costs O(log n / log order) node hops instead of the
+    O(log n) pointer hops of a binary tree, and the comparisons run in C.
+    Values live in the leaves only, and leaves are linked in key order: a
+    range scan finds its first leaf once, then yields list slices leaf by
+    leaf.
+
+    Every node but the root holds at least order // 2 keys.
+    """
+
+    def __init__(self, items: Iterable[Tuple[Any, Any]] = (), order: int = 64) -> None:
+        """
+        Initialize the tree.
+
+        Args:
+            items: Initial (key, value) pairs, in any order.
+            order: Maximum number of keys per node (the fanout is order + 1).
+        """
+        if order < 3:
+            raise ValueError("order must be at least 3.")
+        self.order = order
+        self.root: Any = Leaf([], [])
+        self._size = 0
+        for key, value in items:
+            self[key] = value
+
+    @classmethod
+    def from_sorted(cls, items: Iterable[Tuple[Any, Any]], order: int = 64) -> "BTree":
+        """
+        Builds a tree bottom-up from (key, value) pairs sorted by unique keys, in O(n).
+
+        Nodes are filled to capacity (the last ones share what remains), which
+        makes later range scans touch the fewest leaves.
+        """
+        tree = cls(order=order)
+        keys, values = [], []
+        for key, value in items:
+            keys.append(key)
+            values.append(value)
+        if not keys:
+            return tree
+        tree._size = len(keys)
+
+        # Leaves, then each internal level, until a single node remains
+        level = []
+        for start, stop in _chunks(len(keys), order):
+            leaf = Leaf(keys[start:stop], values[start:stop])
+            if level:
+                level[-1].next = leaf
+            level.append(leaf)
+        low_keys = [leaf.keys[0] for leaf in level]  # Smallest key under each node
+        while len(level) > 1:
+            parents, parent_low_keys = [], []
+            for start, stop in _chunks(len(level), order + 1):
+                parents.append(Internal(low_keys[start + 1:stop], level[start:stop]))
+                parent_low_keys.append(low_keys[start])
+            level, low_keys = parents, parent_low_keys
+        tree.root = level[0]
+        return tree
+
+    def __getitem__(self, key: Any) -> Any:
+        leaf = self._find_leaf(key)
+        index = bisect_left(leaf.keys, key)
+        if index < len(leaf.keys) and leaf.keys[index] == key:
+            return leaf.values[index]
+        raise KeyError(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Returns the value of a key, or default if it is missing."""
+        leaf = self._find_leaf(key)
+        index = bisect_left(leaf.keys, key)
+        if index < len(leaf.keys) and leaf.keys[index] == key:
+            return leaf.values[index]
+        return default
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """Inserts or replaces the value of a key, splitting full nodes on the way back up."""
+        path = []  # (internal node, index of the child taken)
+        node = self.root
+        while isinstance(node, Internal):
+            index = bisect_right(node.keys, key)
+            path.append((node, index))
+            node = node.children[index]
+
+        index = bisect_left(node.keys, key)
+        if index < len(node.keys) and node.keys[index] == key:
+            node.values[index] = value
+            return
+        node.keys.insert(index, key)
+        node.values.insert(index, value)
+        self._size += 1
+        if len(node.keys) <= self.order:
+            return
+
+        # Split the leaf, then every internal node that overflows in turn
+        middle = len(node.keys) // 2
+        right = Leaf(node.keys[middle:], node.values[middle:])
+        del node.keys[middle:], node.values[middle:]
+        right.next, node.next = node.next, right
+        separator = right.keys[0]
+        while path:
+            parent, index = path.pop()
+            parent.keys.insert(index, separator)
+            parent.children.insert(index + 1, right)
+            if len(parent.keys) <= self.order:
+                return
+            middle = len(parent.keys) // 2
+            separator = parent.keys[middle]
+            right = Internal(parent.keys[middle + 1:], parent.children[middle + 1:])
+            del parent.keys[middle:], parent.children[middle + 1:]
+            node = parent
+        self.root = Internal([separator], [node, right])  # The root split: grow by one level
+
+    def __delitem__(self, key: Any) -> None:
+        """Removes a key, borrowing from or merging with a sibling when a node underflows."""
+        path = []
+        node = self.root
+        while isinstance(node, Internal):
+            index = bisect_right(node.keys, key)
+            path.append((node, index))
+            node = node.children[index]
+
+        index = bisect_left(node.keys, key)
+        if index == len(node.keys) or node.keys[index] != key:
+            raise KeyError(key)
+        del node.keys[index], node.values[index]
+        self._size -= 1
+
+        minimum = self.order // 2
+        while path and len(node.keys) < minimum:
+            parent, index = path.pop()
+            if isinstance(node, Leaf):
+                self._rebalance_leaf(parent, index, node)
+            else:
+                self._rebalance_internal(parent, index, node)
+            node = parent
+        if isinstance(self.root, Internal) and not self.root.keys:
+            self.root = self.root.children[0]  # The root lost its last separator: shrink by one level
+
+    def pop(self, key: Any, default: Any = _MISSING) -> Any:
+        """Removes a key and returns its value (or default if it is missing)."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        del self[key]
+        return value
+
+    def items(self, low: Any = None, high: Any = None) -> Iterator[Tuple[Any, Any]]:
+        """
+        Lazily yields the (key, value) pairs with low <= key < high, in key order.
+
+        Either bound may be None for an open range. The scan descends once to
+        the first leaf, then follows the leaf links, yielding slices.
+        """
+        if low is None:
+            leaf = self.root
+            while isinstance(leaf, Internal):
+                leaf = leaf.children[0]
+            start = 0
+        else:
+            leaf = self._find_leaf(low)
+            start = bisect_left(leaf.keys, low)
+        while leaf is not None:
+            keys = leaf.keys
+            if high is not None and keys and keys[-1] >= high:
+                stop = bisect_left(keys, high, start)
+                yield from zip(keys[start:stop], leaf.values[start:stop])
+                return
+            yield from zip(keys[start:], leaf.values[start:])
+            leaf = leaf.next
+            start = 0
+
+    def range(self, low: Any = None, high: Any = None) -> Iterator[Any]:
+        """Lazily yields the keys with low <= key < high, in order."""
+        for key, _ in self.items(low, high):
+            yield key
+
+    def keys(self) -> Iterator[Any]:
+        return self.range()
+
+    def values(self) -> Iterator[Any]:
+        for _, value in self.items():
+            yield value
+
+    def height(self) -> int:
+        """Returns the number of levels of the tree."""
+        height = 1
+        node = self.root
+        while isinstance(node, Internal):
+            node = node.children[0]
+            height += 1
+        return height
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.range()
+
+    def __repr__(self) -> str:
+        return f"BTree({list(self.items())})"
+
+    def _find_leaf(self, key: Any) -> Leaf:
+        node = self.root
+        while isinstance(node, Internal):
+            node = node.children[bisect_right(node.keys, key)]
+        return node
+
+    def _rebalance_leaf(self, parent: Internal, index: int, leaf: Leaf) -> None:
+        """Refills an underflowing leaf from a sibling, or merges it into one."""
+        minimum = self.order // 2
+        left = parent.children[index - 1] if index > 0 else None
+        right = parent.children[index + 1] if index + 1 < len(parent.children) else None
+        if left is not None and len(left.keys) > minimum:
+            leaf.keys.insert(0, left.keys.pop())
+            leaf.values.insert(0, left.values.pop())
+            parent.keys[index - 1] = leaf.keys[0]
+        elif right is not None and len(right.keys) > minimum:
+            leaf.keys.append(right.keys.pop(0))
+            leaf.values.append(right.values.pop(0))
+            parent.keys[index] = right.keys[0]
+        elif left is not None:
+            left.keys += leaf.keys
+            left.values += leaf.values
+            left.next = leaf.next
+            del parent.keys[index - 1], parent.children[index]
+        else:
+            leaf.keys += right.keys
+            leaf.values += right.values
+            leaf.next = right.next
+            del parent.keys[index], parent.children[index + 1]
+
+    def _rebalance_internal(self, parent: Internal, index: int, node: Internal) -> None:
+        """Refills an underflowing internal node through its parent, or merges it with a sibling."""
+        minimum = self.order // 2
+        left = parent.children[index - 1] if index > 0 else None
+        right = parent.children[index + 1] if index + 1 < len(parent.children) else None
+        if left is not None and len(left.keys) > minimum:
+            # Rotate right: the parent separator comes down, the left sibling's last key goes up
+            node.keys.insert(0, parent.keys[index - 1])
+            node.children.insert(0, left.children.pop())
+            parent.keys[index - 1] = left.keys.pop()
+        elif right is not None and len(right.keys) > minimum:
+            node.keys.append(parent.keys[index])
+            node.children.append(right.children.pop(0))
+            parent.keys[index] = right.keys.pop(0)
+        elif left is not None:
+            left.keys += [parent.keys[index - 1]] + node.keys
+            left.children += node.children
+            del parent.keys[index - 1], parent.children[index]
+        else:
+            node.keys += [parent.keys[index]] + right.keys
+            node.children += right.children
+            del parent.keys[index], parent.children[index + 1]
+
+
+def _chunks(length: int, capacity: int) -> Iterator[Tuple[int, int]]:
+    """Splits range(length) into the fewest slices of at most capacity items, of near-equal sizes."""
+    count = -(-length // capacity)
+    for chunk in range(count):
+        yield length * chunk // count, length * (chunk + 1) // count
+
+
+##################
+# Example usage: #
+##################
+if __name__ == "__main__":
+    tree = BTree(order=4)
+    for key in [50, 20, 80, 10, 30, 60, 90, 40, 70]:
+        tree[key] = str(key)
+
+    print(tree[30], tree.get(35))  # Output: 30 None
+    print(list(tree.range(25, 65)))  # Output: [30, 40, 50, 60]
+    del tree[20]
+    print(len(tree), tree.height())  # Output: 8 2
+
+    # Bulk load from sorted input
+    big = BTree.from_sorted(((key, key * key) for key in range(1_000_000)), order=128)
+    print(big.height(), big[999_999])  # Output: 3 999998000001
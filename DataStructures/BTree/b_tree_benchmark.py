@@ -0,0 +1,109 @@
+import itertools
+import math
+import os
+import random
+import sys
+import time
+
+from b_tree import BTree
+
+# The other trees live in sibling directories
+_data_structures = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for _directory in ("BinaryTree", "AVLTree", "RedBlackTree", "SkipList"):
+    sys.path.append(os.path.join(_data_structures, _directory))
+
+from avl_map import AVLMap
+from binary_tree import BinarySearchTree
+from red_black_tree import RedBlackTree
+from skiplist import SkipList
+
+SCAN_LENGTH = 100
+
+
+def skiplist_scan(skiplist, key, count):
+    """SkipList has no range query: descend to the first key >= key, then follow level 0."""
+    current = skiplist.head
+    for level in range(skiplist.level, -1, -1):
+        while current.forward[level] and current.forward[level].key < key:
+            current = current.forward[level]
+    current = current.forward[0]
+    for _ in range(count):
+        if current is None:
+            return
+        current = current.forward[0]
+
+
+def make_skiplist(n):
+    return SkipList(max_level=max(1, int(math.log2(n))), p=0.5)
+
+
+# name: (constructor, insert, lookup, scan of SCAN_LENGTH keys from a start key)
+STRUCTURES = {
+    "BTree": (
+        lambda n: BTree(order=64),
+        lambda tree, key: tree.__setitem__(key, key),
+        lambda tree, key: tree.get(key),
+        lambda tree, key: list(itertools.islice(tree.items(key), SCAN_LENGTH)),
+    ),
+    "BinarySearchTree": (
+        lambda n: BinarySearchTree(),
+        lambda tree, key: tree.insert(key),
+        lambda tree, key: tree.search(key),
+        lambda tree, key: list(itertools.islice(tree.range(key, math.inf), SCAN_LENGTH)),
+    ),
+    "AVLMap": (
+        lambda n: AVLMap(),
+        lambda tree, key: tree.__setitem__(key, key),
+        lambda tree, key: tree.get(key),
+        lambda tree, key: list(itertools.islice(tree.items(key), SCAN_LENGTH)),
+    ),
+    "RedBlackTree": (
+        lambda n: RedBlackTree(),
+        lambda tree, key: tree.insert(key, key),
+        lambda tree, key: tree.get(key),
+        lambda tree, key: list(itertools.islice(tree.items(key), SCAN_LENGTH)),
+    ),
+    "SkipList": (
+        make_skiplist,
+        lambda skiplist, key: skiplist.insert(key),
+        lambda skiplist, key: skiplist.search(key),
+        lambda skiplist, key: skiplist_scan(skiplist, key, SCAN_LENGTH),
+    ),
+}
+
+
+def throughput(operation, structure, keys):
+    start = time.perf_counter()
+    for key in keys:
+        operation(structure, key)
+    return len(keys) / (time.perf_counter() - start)
+
+
+def run(n, lookups=200_000, scans=10_000):
+    keys = list(range(n))
+    random.shuffle(keys)
+    lookup_keys = [random.randrange(n) for _ in range(lookups)]
+    scan_keys = [random.randrange(n) for _ in range(scans)]
+
+    print(f"{n} keys inserted in random order (operations/sec; scans of {SCAN_LENGTH} keys)")
+    print(f"{'structure':>18} {'insert':>10} {'lookup':>10} {'scan':>10}")
+    for name, (constructor, insert, lookup, scan) in STRUCTURES.items():
+        structure = constructor(n)
+        results = (
+            throughput(insert, structure, keys),
+            throughput(lookup, structure, lookup_keys),
+            throughput(scan, structure, scan_keys),
+        )
+        print(f"{name:>18} {results[0]:>10,.0f} {results[1]:>10,.0f} {results[2]:>10,.0f}")
+        del structure
+
+    start = time.perf_counter()
+    BTree.from_sorted((key, key) for key in range(n))
+    print(f"BTree.from_sorted: {n / (time.perf_counter() - start):,.0f} keys/sec")
+
+
+#############
+# Benchmark #
+#############
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,473 @@
+import mmap
+import os
+import struct
+import zlib
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from .b_tree import _chunks
+except ImportError:  # Run as a script from this directory
+    from b_tree import _chunks
+
+MAGIC = b"PSBT"
+VERSION = 1
+# Page 0: magic, version, page size, key size, value size, root page, page count, number of keys
+HEADER = struct.Struct("<4sIIIIQQQ")
+# Every node page starts with: kind, number of keys, next leaf page (0 for none)
+NODE_HEADER = struct.Struct("<BHI")
+LEAF, INTERNAL = 1, 2
+# Write-ahead log: (page number, page image) records, then a commit record
+WAL_RECORD = struct.Struct("<Q")
+WAL_COMMIT = struct.Struct("<4sQI")  # b"DONE", number of records, crc32 of the records
+WAL_DONE = b"DONE"
+
+_MISSING = object()
+
+
+class DiskNode:
+    """A node decoded from its page: sorted keys, plus values (leaf) or child page numbers (internal)."""
+    __slots__ = ("page", "kind", "keys", "values", "children", "next")
+
+    def __init__(self, page: int, kind: int) -> None:
+        self.page = page
+        self.kind = kind
+        self.keys: List[bytes] = []
+        self.values: List[bytes] = []
+        self.children: List[int] = []
+        self.next = 0  # Next leaf page, 0 for the last leaf
+
+
+class DiskBTree:
+    """
+    A B+tree index stored in fixed-size pages of a single file, read through mmap.
+
+    Keys and values are fixed-width byte strings (encode integers big-endian
+    so that byte order matches numeric order). Leaves are linked for range
+    scans. Decoded pages are kept in a page cache with LRU eviction; pages
+    modified since the last commit are held apart from it, so they are never
+    evicted before being written.
+
+    commit() makes changes durable and crash-consistent with a write-ahead
+    log: the images of every modified page are appended to "<path>-wal" and
+    fsynced before any page of the main file is overwritten. Opening a file
+    whose log holds a complete commit replays it; an incomplete log is
+    discarded, leaving the last committed state untouched.
+
+    Deleting keys does not merge pages: bulk load into a new file to compact.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        key_size: Optional[int] = None,
+        value_size: Optional[int] = None,
+        page_size: int = 4096,
+        cache_pages: int = 1024,
+    ) -> None:
+        """
+        Open an index file, creating it when it does not exist.
+
+        Args:
+            path: Path of the index file.
+            key_size: Width of the keys in bytes (required to create a file).
+            value_size: Width of the values in bytes (required to create a file).
+            page_size: Size of a page when creating the file.
+            cache_pages: Number of decoded pages kept in memory.
+        """
+        self.path = path
+        self.wal_path = path + "-wal"
+        self.cache_pages = cache_pages
+        self._cache: "OrderedDict[int, DiskNode]" = OrderedDict()  # Clean pages, least recently used first
+        self._dirty: Dict[int, DiskNode] = {}  # Pages modified since the last commit
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            if key_size is None or value_size is None:
+                raise ValueError("key_size and value_size are required to create an index.")
+            with open(path, "wb") as file:
+                file.write(HEADER.pack(MAGIC, VERSION, page_size, key_size, value_size, 0, 0, 0).ljust(page_size, b"\0"))
+        self._file = open(path, "r+b")
+        self._recover()
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+        magic, version, self.page_size, self.key_size, self.value_size, self.root, self.page_count, self.size = (
+            HEADER.unpack_from(self._map, 0)
+        )
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not an index file.")
+        if (key_size, value_size) != (None, None) and (key_size, value_size) != (self.key_size, self.value_size):
+            raise ValueError("key_size and value_size do not match the existing index.")
+
+        self.leaf_capacity = (self.page_size - NODE_HEADER.size) // (self.key_size + self.value_size)
+        self.internal_capacity = (self.page_size - NODE_HEADER.size - 4) // (self.key_size + 4)
+        if min(self.leaf_capacity, self.internal_capacity) < 3:
+            raise ValueError("page_size is too small for the key and value sizes.")
+
+        if self.root == 0:  # New file: page 0 is the header, the root starts as an empty leaf
+            self.page_count = 1
+            self.root = self._allocate(LEAF).page
+            self.commit()
+
+    def get(self, key: bytes, default=None):
+        """Returns the value of a key, or default if it is missing."""
+        leaf = self._find_leaf(key)
+        index = bisect_left(leaf.keys, key)
+        if index < len(leaf.keys) and leaf.keys[index] == key:
+            return leaf.values[index]
+        return default
+
+    def __getitem__(self, key: bytes) -> bytes:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: bytes, value: bytes) -> None:
+        """Inserts or replaces the value of a key; the change is durable after commit()."""
+        self._check(key, self.key_size, "key")
+        self._check(value, self.value_size, "value")
+        path = []
+        node = self._node(self.root)
+        while node.kind == INTERNAL:
+            index = bisect_right(node.keys, key)
+            path.append((node, index))
+            node = self._node(node.children[index])
+
+        index = bisect_left(node.keys, key)
+        self._mark_dirty(node)
+        if index < len(node.keys) and node.keys[index] == key:
+            node.values[index] = value
+            return
+        node.keys.insert(index, key)
+        node.values.insert(index, value)
+        self.size += 1
+        if len(node.keys) <= self.leaf_capacity:
+            return
+
+        # Split the leaf, then every internal node that overflows in turn
+        middle = len(node.keys) // 2
+        right = self._allocate(LEAF)
+        right.keys, right.values = node.keys[middle:], node.values[middle:]
+        del node.keys[middle:], node.values[middle:]
+        right.next, node.next = node.next, right.page
+        separator = right.keys[0]
+        while path:
+            parent, index = path.pop()
+            self._mark_dirty(parent)
+            parent.keys.insert(index, separator)
+            parent.children.insert(index + 1, right.page)
+            if len(parent.keys) <= self.internal_capacity:
+                return
+            middle = len(parent.keys) // 2
+            separator = parent.keys[middle]
+            right = self._allocate(INTERNAL)
+            right.keys, right.children = parent.keys[middle + 1:], parent.children[middle + 1:]
+            del parent.keys[middle:], parent.children[middle + 1:]
+            node = parent
+        root = self._allocate(INTERNAL)  # The root split: grow by one level
+        root.keys, root.children = [separator], [node.page, right.page]
+        self.root = root.page
+
+    def __delitem__(self, key: bytes) -> None:
+        """Removes a key from its leaf; emptied pages stay in the file."""
+        leaf = self._find_leaf(key)
+        index = bisect_left(leaf.keys, key)
+        if index == len(leaf.keys) or leaf.keys[index] != key:
+            raise KeyError(key)
+        del leaf.keys[index], leaf.values[index]
+        self._mark_dirty(leaf)
+        self.size -= 1
+
+    def items(self, low: Optional[bytes] = None, high: Optional[bytes] = None) -> Iterator[Tuple[bytes, bytes]]:
+        """Lazily yields the (key, value) pairs with low <= key < high, following the leaf links."""
+        if low is None:
+            leaf = self._node(self.root)
+            while leaf.kind == INTERNAL:
+                leaf = self._node(leaf.children[0])
+            start = 0
+        else:
+            leaf = self._find_leaf(low)
+            start = bisect_left(leaf.keys, low)
+        while True:
+            keys = leaf.keys
+            if high is not None and keys and keys[-1] >= high:
+                stop = bisect_left(keys, high, start)
+                yield from zip(keys[start:stop], leaf.values[start:stop])
+                return
+            yield from zip(keys[start:], leaf.values[start:])
+            if not leaf.next:
+                return
+            leaf = self._node(leaf.next)
+            start = 0
+
+    def range(self, low: Optional[bytes] = None, high: Optional[bytes] = None) -> Iterator[bytes]:
+        """Lazily yields the keys with low <= key < high, in order."""
+        for key, _ in self.items(low, high):
+            yield key
+
+    def bulk_load(self, items: Iterable[Tuple[bytes, bytes]]) -> None:
+        """
+        Fills an empty index from (key, value) pairs in strictly increasing key order, in O(n).
+
+        The input is streamed: full leaves are written sequentially after the
+        last page, then each internal level, so memory holds only one key per
+        page. The last two leaves are evened out, and each internal level is
+        cut into nodes of near-equal sizes, so no node is less than half full. The new pages are unreachable until the header is committed, so
+        a crash during the load leaves the empty index intact.
+        """
+        if self.size:
+            raise ValueError("bulk_load needs an empty index.")
+        self.commit()
+        first_page = self.page_count
+        page = first_page
+        level: List[Tuple[bytes, int]] = []  # (smallest key, page) of each node of the level being built
+        leaf = DiskNode(page, LEAF)
+        previous = None  # The last full leaf, written once the next one is known
+        count = 0
+        previous_key = None
+        self._file.seek(page * self.page_size)
+        for key, value in items:
+            self._check(key, self.key_size, "key")
+            self._check(value, self.value_size, "value")
+            if previous_key is not None and key <= previous_key:
+                raise ValueError("bulk_load needs strictly increasing keys.")
+            previous_key = key
+            if len(leaf.keys) == self.leaf_capacity:
+                if previous is not None:
+                    self._file.write(self._encode(previous))
+                leaf.next = page + 1
+                level.append((leaf.keys[0], page))
+                previous = leaf
+                page += 1
+                leaf = DiskNode(page, LEAF)
+            leaf.keys.append(key)
+            leaf.values.append(value)
+            count += 1
+        if previous is not None:
+            if len(leaf.keys) < self.leaf_capacity // 2:
+                # Share the keys of the last two leaves; the smallest key of the first one is unchanged
+                keys, values = previous.keys + leaf.keys, previous.values + leaf.values
+                middle = len(keys) // 2
+                previous.keys, leaf.keys = keys[:middle], keys[middle:]
+                previous.values, leaf.values = values[:middle], values[middle:]
+            self._file.write(self._encode(previous))
+        level.append((leaf.keys[0] if leaf.keys else b"", page))
+        self._file.write(self._encode(leaf))
+        page += 1
+
+        # Internal levels, bottom-up, until one node remains
+        while len(level) > 1:
+            parents = []
+            for start, end in _chunks(len(level), self.internal_capacity + 1):
+                children = level[start:end]
+                node = DiskNode(page, INTERNAL)
+                node.keys = [low_key for low_key, _ in children[1:]]
+                node.children = [child for _, child in children]
+                parents.append((children[0][0], page))
+                self._file.write(self._encode(node))
+                page += 1
+            level = parents
+
+        # Make the pages durable, then switch the root with a logged header update
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._map.close()
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self.root = level[0][1]
+        self.page_count = page
+        self.size = count
+        self.commit()
+
+    def commit(self) -> None:
+        """Makes every change since the last commit durable, through the write-ahead log."""
+        pages = [(page, self._encode(node)) for page, node in sorted(self._dirty.items())]
+        header = HEADER.pack(
+            MAGIC, VERSION, self.page_size, self.key_size, self.value_size, self.root, self.page_count, self.size
+        ).ljust(self.page_size, b"\0")
+        if not pages and header == self._map[:self.page_size]:
+            return
+        pages.append((0, header))
+
+        # 1. Log the page images and fsync the log: from here on, the commit survives a crash
+        records = b"".join(WAL_RECORD.pack(page) + image for page, image in pages)
+        with open(self.wal_path, "wb") as wal:
+            wal.write(records)
+            wal.write(WAL_COMMIT.pack(WAL_DONE, len(pages), zlib.crc32(records)))
+            wal.flush()
+            os.fsync(wal.fileno())
+
+        # 2. Apply the pages to the main file, then drop the log
+        self._write_pages(pages)
+        os.remove(self.wal_path)
+        self._cache.update(self._dirty)
+        self._dirty.clear()
+        self._evict()
+
+    def rollback(self) -> None:
+        """Discards every change since the last commit."""
+        self._dirty.clear()
+        _, _, _, _, _, self.root, self.page_count, self.size = HEADER.unpack_from(self._map, 0)
+
+    def close(self) -> None:
+        """Closes the file; uncommitted changes are lost."""
+        self._cache.clear()
+        self._dirty.clear()
+        self._map.close()
+        self._file.close()
+
+    def __contains__(self, key: bytes) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self.range()
+
+    def __enter__(self) -> "DiskBTree":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # Commit on success, discard on error
+        if exc_type is None:
+            self.commit()
+        self.close()
+
+    def _find_leaf(self, key: bytes) -> DiskNode:
+        node = self._node(self.root)
+        while node.kind == INTERNAL:
+            node = self._node(node.children[bisect_right(node.keys, key)])
+        return node
+
+    def _node(self, page: int) -> DiskNode:
+        """Returns a page from the cache, decoding it from the map on a miss."""
+        node = self._dirty.get(page)
+        if node is not None:
+            self.cache_hits += 1
+            return node
+        node = self._cache.get(page)
+        if node is not None:
+            self._cache.move_to_end(page)
+            self.cache_hits += 1
+            return node
+        self.cache_misses += 1
+        node = self._decode(page)
+        self._cache[page] = node
+        self._evict()
+        return node
+
+    def _allocate(self, kind: int) -> DiskNode:
+        """Creates a node on a new page at the end of the file, dirty until committed."""
+        node = DiskNode(self.page_count, kind)
+        self.page_count += 1
+        self._dirty[node.page] = node
+        return node
+
+    def _mark_dirty(self, node: DiskNode) -> None:
+        """Moves a node being modified out of the cache, even if the descent already evicted it."""
+        self._cache.pop(node.page, None)
+        self._dirty[node.page] = node
+
+    def _evict(self) -> None:
+        """Drops least recently used clean pages until the cache fits."""
+        while len(self._cache) > self.cache_pages:
+            self._cache.popitem(last=False)
+
+    def _decode(self, page: int) -> DiskNode:
+        offset = page * self.page_size
+        kind, count, next_page = NODE_HEADER.unpack_from(self._map, offset)
+        node = DiskNode(page, kind)
+        node.next = next_page
+        key_size = self.key_size
+        start = offset + NODE_HEADER.size
+        data = self._map[start:start + count * key_size]
+        node.keys = [data[index:index + key_size] for index in range(0, len(data), key_size)]
+        if kind == LEAF:
+            value_size = self.value_size
+            start += self.leaf_capacity * key_size
+            data = self._map[start:start + count * value_size]
+            node.values = [data[index:index + value_size] for index in range(0, len(data), value_size)]
+        else:
+            start += self.internal_capacity * key_size
+            node.children = list(struct.unpack_from(f"<{count + 1}I", self._map, start))
+        return node
+
+    def _encode(self, node: DiskNode) -> bytes:
+        page = bytearray(self.page_size)
+        NODE_HEADER.pack_into(page, 0, node.kind, len(node.keys), node.next)
+        start = NODE_HEADER.size
+        keys = b"".join(node.keys)
+        page[start:start + len(keys)] = keys
+        if node.kind == LEAF:
+            start += self.leaf_capacity * self.key_size
+            values = b"".join(node.values)
+            page[start:start + len(values)] = values
+        else:
+            start += self.internal_capacity * self.key_size
+            struct.pack_into(f"<{len(node.children)}I", page, start, *node.children)
+        return bytes(page)
+
+    def _write_pages(self, pages: List[Tuple[int, bytes]]) -> None:
+        """Writes page images into the map, growing the file as needed, and flushes them to disk."""
+        needed = (max(page for page, _ in pages) + 1) * self.page_size
+        if needed > len(self._map):
+            self._map.close()
+            self._file.truncate(max(needed, 2 * os.path.getsize(self.path)))  # Grow geometrically
+            self._map = mmap.mmap(self._file.fileno(), 0)
+        for page, image in pages:
+            self._map[page * self.page_size:(page + 1) * self.page_size] = image
+        self._map.flush()
+
+    def _recover(self) -> None:
+        """Replays a complete write-ahead log left by a crash, and discards an incomplete one."""
+        if not os.path.exists(self.wal_path):
+            return
+        with open(self.wal_path, "rb") as wal:
+            log = wal.read()
+        page_size = HEADER.unpack_from(self._file.read(HEADER.size))[2]
+        if len(log) >= WAL_COMMIT.size:
+            records = log[:-WAL_COMMIT.size]
+            done, count, checksum = WAL_COMMIT.unpack(log[-WAL_COMMIT.size:])
+            record_size = WAL_RECORD.size + page_size
+            if done == WAL_DONE and len(records) == count * record_size and zlib.crc32(records) == checksum:
+                for offset in range(0, len(records), record_size):
+                    (page,) = WAL_RECORD.unpack_from(records, offset)
+                    self._file.seek(page * page_size)
+                    self._file.write(records[offset + WAL_RECORD.size:offset + record_size])
+                self._file.flush()
+                os.fsync(self._file.fileno())
+        os.remove(self.wal_path)
+
+    @staticmethod
+    def _check(data: bytes, size: int, name: str) -> None:
+        if len(data) != size:
+            raise ValueError(f"The {name} must be exactly {size} bytes long.")
+
+
+##################
+# Example usage: #
+##################
+if __name__ == "__main__":
+    import tempfile
+
+    def encode(number):
+        return number.to_bytes(8, "big")  # Big-endian: byte order matches numeric order
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "offsets.idx")
+
+        # Bulk load a key -> offset index from sorted input
+        with DiskBTree(path, key_size=8, value_size=8) as index:
+            index.bulk_load((encode(key), encode(key * 100)) for key in range(0, 100_000, 2))
+            index[encode(7)] = encode(700)
+            index.commit()
+            index[encode(9)] = encode(900)
+            index.rollback()  # Never committed
+
+        with DiskBTree(path) as index:
+            print(len(index), int.from_bytes(index[encode(7)], "big"))  # Output: 50001 700
+            print(encode(9) in index)  # Output: False
+            print([int.from_bytes(key, "big") for key in index.range(encode(4), encode(10))])  # Output: [4, 6, 7, 8]
@@ -0,0 +1,80 @@
+import os
+import random
+import sys
+import tempfile
+import time
+
+from disk_b_tree import DiskBTree
+
+SCAN_LENGTH = 100
+
+
+def encode(number):
+    return number.to_bytes(8, "big")
+
+
+def bulk_load(path, n):
+    start = time.perf_counter()
+    with DiskBTree(path, key_size=8, value_size=8) as index:
+        index.bulk_load((encode(key), encode(key)) for key in range(0, 2 * n, 2))
+    return n / (time.perf_counter() - start)
+
+
+def random_inserts(path, keys, commit_every):
+    """Inserts odd keys in random order, committing every commit_every inserts."""
+    start = time.perf_counter()
+    with DiskBTree(path) as index:
+        for count, key in enumerate(keys, 1):
+            index[encode(key)] = encode(key)
+            if count % commit_every == 0:
+                index.commit()
+    return len(keys) / (time.perf_counter() - start)
+
+
+def lookups(path, keys, cache_pages):
+    """Returns lookups/sec and the page cache hit ratio, starting from a cold cache."""
+    with DiskBTree(path, cache_pages=cache_pages) as index:
+        start = time.perf_counter()
+        for key in keys:
+            index.get(encode(key))
+        elapsed = time.perf_counter() - start
+        hit_ratio = index.cache_hits / (index.cache_hits + index.cache_misses)
+    return len(keys) / elapsed, hit_ratio
+
+
+def scans(path, keys):
+    with DiskBTree(path) as index:
+        start = time.perf_counter()
+        for key in keys:
+            for _ in zip(range(SCAN_LENGTH), index.items(encode(key))):
+                pass
+    return len(keys) / (time.perf_counter() - start)
+
+
+#############
+# Benchmark #
+#############
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    operations = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.idx")
+        print(f"8-byte keys and values, 4 KiB pages, {n} keys bulk loaded")
+        print(f"bulk_load: {bulk_load(path, n):,.0f} keys/sec, file size {os.path.getsize(path) / 2**20:.1f} MiB")
+
+        for commit_every in (1, 100, 10_000):
+            # Odd keys fall between the loaded even keys: there are only n of them
+            count = min(operations, n, 10_000) if commit_every == 1 else min(operations, n)
+            inserts = random.sample(range(1, 2 * n, 2), count)
+            rate = random_inserts(path, inserts, commit_every)
+            print(f"random inserts, commit every {commit_every:>6}: {rate:>10,.0f} inserts/sec")
+
+        lookup_keys = [random.randrange(2 * n) for _ in range(operations)]
+        for cache_pages in (16, 256, 16_384):
+            rate, hit_ratio = lookups(path, lookup_keys, cache_pages)
+            print(f"random lookups, {cache_pages:>6} cached pages: {rate:>10,.0f} lookups/sec, "
+                  f"hit ratio {hit_ratio:.2f}")
+
+        scan_keys = [random.randrange(2 * n) for _ in range(operations // 10)]
+        print(f"scans of {SCAN_LENGTH} keys: {scans(path, scan_keys):,.0f} scans/sec")
@@ -1,7 +1,9 @@
-from typing import Optional, List
+from typing import Iterable, Iterator, List, Optional
 
 class Node:
     """Represents a single node in the binary search tree."""
+    __slots__ = ("value", "left", "right")
+
     def __init__(self, value: int) -> None:
         self.value: int = value  # The value stored in the node
         self.left: Optional[Node] = None  # Pointer to the left child node
@@ -11,39 +13,69 @@ class BinarySearchTree:
     """Represents the binary search tree structure.
 
     Ensures that all nodes follow the binary search tree property:
-    for each node, all values in its left subtree are less, and all values in its right subtree are greater or equal.
+    for each node, all values in its left subtree are less or equal, and all values in its right subtree are greater or equal.
+    Search stops at the first equal value and range scans descend left on an equal value, so duplicates may sit on either side.
+
+    Every operation walks the tree with a loop or an explicit stack instead of
+    recursion, so a degenerate tree (built from sorted insertions) is slow but
+    never exceeds the recursion limit.
     """
     def __init__(self) -> None:
         self.root: Optional[Node] = None  # The root node of the binary search tree (initially empty)
+        self._size = 0
 
-    def insert(self, value: int) -> None:
-        """Inserts a value into the binary search tree.
+    @classmethod
+    def from_sorted(cls, values: Iterable[int]) -> "BinarySearchTree":
+        """Builds a perfectly balanced tree from values in ascending order, in O(n).
 
         Args:
-            value (int): The value to insert into the tree.
+            values (Iterable[int]): The values to store, sorted in ascending order.
+
+        Returns:
+            BinarySearchTree: A tree of height ceil(log2(n + 1)), duplicates included.
         """
-        if self.root is None:
-            self.root = Node(value)  # Set the root to a new node if the tree is empty
-        else:
-            self._insert(self.root, value)
+        values = list(values)
+        tree = cls()
+        tree._size = len(values)
+
+        def build(low: int, high: int) -> Optional[Node]:
+            # Recursion depth is the tree height, O(log n)
+            if low >= high:
+                return None
+            # Always the middle index, even among duplicates, so that runs of
+            # equal values are split evenly instead of forming a right chain
+            middle = (low + high) // 2
+            node = Node(values[middle])
+            node.left = build(low, middle)
+            node.right = build(middle + 1, high)
+            return node
+
+        tree.root = build(0, len(values))
+        return tree
 
-    def _insert(self, current: Node, value: int) -> None:
-        """Recursively inserts a value into the correct position in the tree.
+    def insert(self, value: int) -> None:
+        """Inserts a value into the binary search tree.
 
         Args:
-            current (Node): The current node being examined.
             value (int): The value to insert into the tree.
         """
-        if value < current.value:
-            if current.left is None:
-                current.left = Node(value)  # Create a new node if the left child is empty
-            else:
-                self._insert(current.left, value)  # Recur to the left subtree
-        else:
-            if current.right is None:
-                current.right = Node(value)  # Create a new node if the right child is empty
+        self._size += 1
+        if self.root is None:
+            self.root = Node(value)  # Set the root to a new node if the tree is empty
+            return
+
+        current = self.root
+        while True:
+            if value < current.value:
+                if current.left is None:
+                    current.left = Node(value)  # Create a new node if the left child is empty
+                    return
+                current = current.left  # Continue in the left subtree
             else:
-                self._insert(current.right, value)  # Recur to the right subtree
+                if current.right is None:
+                    current.right = Node(value)  # Create a new node if the right child is empty
+                    return
+                current = current.right  # Continue in the right subtree
 
     def inorder(self) -> List[int]:
         """Performs an in-order traversal of the tree.
@@ -51,20 +83,35 @@ class BinarySearchTree:
         Returns:
             List[int]: A list of node values in ascending order.
         """
-        return self._inorder(self.root)
+        return list(self)
 
-    def _inorder(self, node: Optional[Node]) -> List[int]:
-        """Recursively performs an in-order traversal.
+    def range(self, low: int, high: int) -> Iterator[int]:
+        """Lazily yields the values v with low <= v < high, in ascending order.
 
-        Args:
-            node (Optional[Node]): The current node being examined.
+        Subtrees entirely outside the range are skipped, so a scan costs
+        O(height + number of values yielded).
 
-        Returns:
-            List[int]: A list of node values in ascending order.
+        Args:
+            low (int): The smallest value to yield.
+            high (int): The bound above the largest value to yield.
         """
-        if node is None:
-            return []
-        return self._inorder(node.left) + [node.value] + self._inorder(node.right)
+        stack: List[Node] = []
+        current = self.root
+        while stack or current:
+            # Descend left, skipping left subtrees that are entirely below low
+            while current:
+                if current.value < low:
+                    current = current.right
+                else:
+                    stack.append(current)
+                    current = current.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.value >= high:
+                return
+            yield node.value
+            current = node.right
 
     def search(self, value: int) -> bool:
         """Searches for a value in the binary search tree.
@@ -75,26 +122,30 @@ class BinarySearchTree:
         Returns:
             bool: True if the value exists in the tree, False otherwise.
         """
-        return self._search(self.root, value)
-
-    def _search(self, current: Optional[Node], value: int) -> bool:
-        """Recursively searches for a value in the tree.
-
-        Args:
-            current (Optional[Node]): The current node being examined.
-            value (int): The value to search for.
-
-        Returns:
-            bool: True if the value is found, False otherwise.
-        """
-        if current is None:
-            return False  # Value not found
-        if value == current.value:
-            return True  # Value found
-        elif value < current.value:
-            return self._search(current.left, value)  # Search in the left subtree
-        else:
-            return self._search(current.right, value)  # Search in the right subtree
+        current = self.root
+        while current is not None:
+            if value == current.value:
+                return True  # Value found
+            current = current.left if value < current.value else current.right
+        return False  # Value not found
+
+    def __contains__(self, value: int) -> bool:
+        return self.search(value)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[int]:
+        """Lazily yields the values in ascending order, with a stack as deep as the tree."""
+        stack: List[Node] = []
+        current = self.root
+        while stack or current:
+            while current:
+                stack.append(current)
+                current = current.left
+            node = stack.pop()
+            yield node.value
+            current = node.right
 
 #################
 # Example usage #
@@ -113,3 +164,8 @@ if __name__ == "__main__":
     # Search for specific values in the tree
     print(bst.search(7))   # Output: True (7 exists in the tree)
     print(bst.search(3))   # Output: False (3 does not exist in the tree)
+
+    # Sorted data: a balanced tree built in O(n), scanned lazily
+    big = BinarySearchTree.from_sorted(range(1_000_000))
+    print(list(big.range(10, 15)))  # Output: [10, 11, 12, 13, 14]
+    print(len(big), 999_999 in big)  # Output: 1000000 True
@@ -55,16 +55,15 @@ class BloomFilter:
 ##################
 # Example usage: # 
 ##################
+if __name__ == "__main__":
+    bloom = BloomFilter(1000, 0.01)
 
-bloom = BloomFilter(1000, 0.01)
 
+    bloom.add("apple")
+    bloom.add("banana")
+    bloom.add("cherry")
 
-bloom.add("apple")
-bloom.add("banana")
-bloom.add("cherry")
-
-
-print(bloom.contains("apple"))    # True
-print(bloom.contains("banana"))   # True
-print(bloom.contains("date"))     # False (probably)
 
+    print(bloom.contains("apple"))    # True
+    print(bloom.contains("banana"))   # True
+    print(bloom.contains("date"))     # False (probably)
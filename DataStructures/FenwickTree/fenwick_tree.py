@@ -64,39 +64,41 @@ class FenwickTree:
             tree.update(i, val)
         return tree
     
-# Test case 1: Basic operations
-print("Test Case 1: Basic Operations")
-arr = [3, 2, 5, 1, 4, 7, 6, 8]
-ft = FenwickTree.from_array(arr)
-print(f"Tree array: {ft.tree}\n")
+# Example usage
+if __name__ == "__main__":
+    # Test case 1: Basic operations
+    print("Test Case 1: Basic Operations")
+    arr = [3, 2, 5, 1, 4, 7, 6, 8]
+    ft = FenwickTree.from_array(arr)
+    print(f"Tree array: {ft.tree}\n")
 
-# Test prefix sums
-print(f"Original array: {arr}")
-print(f"Prefix sum at index 3: {ft.prefix_sum(3)}")  # Should be 11 (3+2+5+1)
-print(f"Prefix sum at index 7: {ft.prefix_sum(7)}")  # Should be 36 (sum of all)
+    # Test prefix sums
+    print(f"Original array: {arr}")
+    print(f"Prefix sum at index 3: {ft.prefix_sum(3)}")  # Should be 11 (3+2+5+1)
+    print(f"Prefix sum at index 7: {ft.prefix_sum(7)}")  # Should be 36 (sum of all)
 
-# Test range sums
-print(f"Sum of range [2,5]: {ft.range_sum(2, 5)}\n")  # Should be 17 (5+1+4+7)
+    # Test range sums
+    print(f"Sum of range [2,5]: {ft.range_sum(2, 5)}\n")  # Should be 17 (5+1+4+7)
 
-# Test update
-print("\nTest Case 2: Update Operations")
-original_sum = ft.prefix_sum(7)
-print(f"Original sum of all elements: {original_sum}\n")
+    # Test update
+    print("\nTest Case 2: Update Operations")
+    original_sum = ft.prefix_sum(7)
+    print(f"Original sum of all elements: {original_sum}\n")
 
-ft.update(4, 3)  # Add 3 to index 4 (value becomes 7)
-new_sum = ft.prefix_sum(7)
-print(f"Sum after updating index 4 with +3: {new_sum}\n")
+    ft.update(4, 3)  # Add 3 to index 4 (value becomes 7)
+    new_sum = ft.prefix_sum(7)
+    print(f"Sum after updating index 4 with +3: {new_sum}\n")
 
-# Test case 2: Edge cases
-print("\nTest Case 3: Edge Cases")
-# Single element range
-print(f"Sum of range [3,3]: {ft.range_sum(3, 3)}")  # Should give single element
-# First element
-print(f"First element sum: {ft.range_sum(0, 0)}")
-# Last element
-print(f"Last element sum: {ft.range_sum(7, 7)}\n")
+    # Test case 2: Edge cases
+    print("\nTest Case 3: Edge Cases")
+    # Single element range
+    print(f"Sum of range [3,3]: {ft.range_sum(3, 3)}")  # Should give single element
+    # First element
+    print(f"First element sum: {ft.range_sum(0, 0)}")
+    # Last element
+    print(f"Last element sum: {ft.range_sum(7, 7)}\n")
 
-# Test case 3: Negative numbers
-print("\nTest Case 4: Negative Numbers")
-ft.update(2, -5)  # Subtract 5 from index 2
-print(f"Sum after subtracting 5 from index 2: {ft.prefix_sum(7)}")
\ No newline at end of file
+    # Test case 3: Negative numbers
+    print("\nTest Case 4: Negative Numbers")
+    ft.update(2, -5)  # Subtract 5 from index 2
+    print(f"Sum after subtracting 5 from index 2: {ft.prefix_sum(7)}")
@@ -1,3 +1,8 @@
+from collections import Counter
+
+_DELETED = object()  # Tombstone: keeps probe sequences through deleted slots intact
+
+
 class HashTable:
     def __init__(self, size=10):
         """
@@ -27,17 +32,23 @@ class HashTable:
         """
         index = self.hash_function(key)
         original_index = index
+        free_index = None  # First tombstone met, reused unless the key is found further on
         while self.table[index] is not None:
-            if self.table[index][0] == key:
+            if self.table[index] is _DELETED:
+                if free_index is None:
+                    free_index = index
+            elif self.table[index][0] == key:
                 # Update the value if the key already exists
                 self.table[index] = (key, value)
                 return
             # Linear probing
             index = (index + 1) % self.size
             if index == original_index:
-                # Table is full
-                raise Exception("HashTable is full")
-        self.table[index] = (key, value)
+                if free_index is None:
+                    # Table is full
+                    raise Exception("HashTable is full")
+                break
+        self.table[index if free_index is None else free_index] = (key, value)
 
     def get(self, key):
         """
@@ -50,7 +61,7 @@ class HashTable:
         index = self.hash_function(key)
         original_index = index
         while self.table[index] is not None:
-            if self.table[index][0] == key:
+            if self.table[index] is not _DELETED and self.table[index][0] == key:
                 return self.table[index][1]
             # Linear probing
             index = (index + 1) % self.size
@@ -68,9 +79,10 @@ class HashTable:
         index = self.hash_function(key)
         original_index = index
         while self.table[index] is not None:
-            if self.table[index][0] == key:
-                # Mark as deleted with a sentinel value
-                self.table[index] = None
+            if self.table[index] is not _DELETED and self.table[index][0] == key:
+                # Mark as deleted with a sentinel value: an empty slot would end
+                # the probe sequence of the keys stored after this one
+                self.table[index] = _DELETED
                 return
             # Linear probing
             index = (index + 1) % self.size
@@ -78,11 +90,54 @@ class HashTable:
                 break
         raise KeyError(f"Key '{key}' not found in HashTable")
 
-################  
+
+class CountingHashTable(HashTable):
+    """A HashTable that counts its inserts, gets and deletes, and the slots they probe, in counters."""
+
+    def __init__(self, size=10):
+        super().__init__(size)
+        self.counters = Counter()
+
+    def probe_length(self, key):
+        """
+        Returns the number of slots a search for key examines: linear probing
+        stops at the key or at an empty slot, and skips tombstones.
+        """
+        index = self.hash_function(key)
+        for probes in range(1, self.size + 1):
+            slot = self.table[index]
+            if slot is None or (slot is not _DELETED and slot[0] == key):
+                return probes
+            index = (index + 1) % self.size
+        return self.size
+
+    def insert(self, key, value):
+        self.counters["operations"] += 1
+        self.counters["probes"] += self.probe_length(key)
+        super().insert(key, value)
+
+    def get(self, key):
+        self.counters["operations"] += 1
+        self.counters["probes"] += self.probe_length(key)
+        return super().get(key)
+
+    def delete(self, key):
+        self.counters["operations"] += 1
+        self.counters["probes"] += self.probe_length(key)
+        super().delete(key)
+
+
+################
 # Example code #
 ################
-hash_table = HashTable(size=5)
-hash_table.insert("apple", 10)
-print(hash_table.get("apple"))  # Output: 10
-hash_table.insert("strawberry", 15)
-print(hash_table.get("strawberry"))  # Output: 15
\ No newline at end of file
+if __name__ == "__main__":
+    hash_table = HashTable(size=5)
+    hash_table.insert("apple", 10)
+    print(hash_table.get("apple"))  # Output: 10
+    hash_table.insert("strawberry", 15)
+    print(hash_table.get("strawberry"))  # Output: 15
+    # Probe lengths, for benchmarks
+    counting = CountingHashTable(size=8)
+    for key in range(0, 40, 8):  # Every key hashes to slot 0
+        counting.insert(key, key)
+    print(counting.counters)  # Output: Counter({'probes': 15, 'operations': 5})
@@ -0,0 +1,277 @@
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+from array import array
+from itertools import count
+from operator import itemgetter
+import heapq
+import operator
+
+
+class Heap:
+    """
+    A binary heap parameterized by order and key function.
+
+    Keys are computed once, when an item enters the heap, so sifting never
+    calls the key function again. List-backed min heaps run on the C heapq
+    functions; max heaps and typed arrays use the Python sift loops below.
+
+    Attributes:
+        heap: The heap-ordered storage. It holds the items themselves when key
+            is None, (key, sequence, item) entries for a keyed min heap, and
+            otherwise the keys alone, parallel to values.
+        values: The items parallel to heap, or None when heap holds them.
+    """
+
+    def __init__(self, iterable: Iterable[Any] = (), key: Optional[Callable[[Any], Any]] = None,
+                 reverse: bool = False, typecode: Optional[str] = None) -> None:
+        """
+        Build a heap from an iterable in O(n).
+
+        Args:
+            iterable: Initial items.
+            key: Function computing the comparison key of an item.
+            reverse: False for a min heap, True for a max heap.
+            typecode: Optional array.array typecode ('q', 'd', ...) used to
+                store numeric keys in a typed array instead of a list.
+        """
+        self.key = key
+        self.reverse = reverse
+        self._before = operator.gt if reverse else operator.lt
+        # Min heaps of a list are delegated to the C heapq functions
+        self._native = not reverse and typecode is None
+        # Keyed native heaps store (key, sequence, item) so ties never compare items
+        self._entries = self._native and key is not None
+        self._counter = count()
+        self.heap = array(typecode) if typecode else []
+        self.values: Optional[List[Any]] = None if key is None or self._entries else []
+        self.push_many(iterable)
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __bool__(self) -> bool:
+        return len(self.heap) > 0
+
+    def push(self, value: Any) -> None:
+        """Insert a value into the heap in O(log n)."""
+        if self._entries:
+            heapq.heappush(self.heap, (self.key(value), next(self._counter), value))
+        elif self._native:
+            heapq.heappush(self.heap, value)
+        else:
+            self._push_entry(value if self.key is None else self.key(value), value)
+
+    def push_many(self, iterable: Iterable[Any]) -> None:
+        """
+        Insert many values at once.
+
+        When the batch is large compared to the heap, the values are appended
+        and the whole heap is rebuilt in O(n + k) instead of k sifts.
+        """
+        items = list(iterable)
+        if not items:
+            return
+        if len(items) * 2 < len(self.heap):
+            for value in items:
+                self.push(value)
+            return
+
+        if self.key is None:
+            self.heap.extend(items)
+        elif self._entries:
+            self.heap.extend(zip(map(self.key, items), self._counter, items))
+        else:
+            self.heap.extend(map(self.key, items))
+            self.values.extend(items)
+        self._heapify()
+
+    def peek(self) -> Any:
+        """Return the first value in heap order without removing it."""
+        if not self.heap:
+            raise IndexError("peek from an empty heap")
+        return self._first()
+
+    def pop(self) -> Any:
+        """Remove and return the first value in heap order in O(log n)."""
+        if not self.heap:
+            raise IndexError("pop from an empty heap")
+        if self._native:
+            entry = heapq.heappop(self.heap)
+            return entry[2] if self._entries else entry
+
+        keys = self.heap
+        values = self.values
+        last_key = keys.pop()
+        last_value = last_key if values is None else values.pop()
+        if not keys:
+            return last_value
+        result = self._first()
+        self._replace_root(last_key, last_value)
+        return result
+
+    def pushpop(self, value: Any) -> Any:
+        """Push a value, then pop and return the first value; faster than push() then pop()."""
+        if self._entries:
+            return heapq.heappushpop(self.heap, (self.key(value), next(self._counter), value))[2]
+        if self._native:
+            return heapq.heappushpop(self.heap, value)
+        key = value if self.key is None else self.key(value)
+        if not self.heap or not self._before(self.heap[0], key):
+            return value
+        result = self._first()
+        self._replace_root(key, value)
+        return result
+
+    def replace(self, value: Any) -> Any:
+        """Pop and return the first value, then push a value; the heap size is unchanged."""
+        if not self.heap:
+            raise IndexError("replace on an empty heap")
+        if self._entries:
+            return heapq.heapreplace(self.heap, (self.key(value), next(self._counter), value))[2]
+        if self._native:
+            return heapq.heapreplace(self.heap, value)
+        result = self._first()
+        self._replace_root(value if self.key is None else self.key(value), value)
+        return result
+
+    def drain(self) -> Iterator[Any]:
+        """Yield and remove the values in heap order, one at a time."""
+        while self.heap:
+            yield self.pop()
+
+    def _first(self) -> Any:
+        """Return the value at the root of a non-empty heap."""
+        if self._entries:
+            return self.heap[0][2]
+        return self.heap[0] if self.values is None else self.values[0]
+
+    def _push_entry(self, key: Any, value: Any) -> None:
+        """Append an already computed key (and its value) and sift it up."""
+        keys = self.heap
+        values = self.values
+        before = self._before
+        pos = len(keys)
+        keys.append(key)
+        if values is not None:
+            values.append(value)
+
+        # Move parents down into the hole until the key fits
+        while pos > 0:
+            parent = (pos - 1) >> 1
+            if before(key, keys[parent]):
+                keys[pos] = keys[parent]
+                if values is not None:
+                    values[pos] = values[parent]
+                pos = parent
+            else:
+                break
+        keys[pos] = key
+        if values is not None:
+            values[pos] = value
+
+    def _replace_root(self, key: Any, value: Any) -> None:
+        """Put an entry at the root and sift it down."""
+        self._sift_down(0, key, value)
+
+    def _sift_down(self, pos: int, key: Any, value: Any) -> None:
+        """Place the entry (key, value) in the hole at pos, moving smaller children up."""
+        keys = self.heap
+        values = self.values
+        before = self._before
+        size = len(keys)
+        child = 2 * pos + 1
+        while child < size:
+            # Pick the child that comes first in heap order
+            right = child + 1
+            if right < size and before(keys[right], keys[child]):
+                child = right
+            if before(keys[child], key):
+                keys[pos] = keys[child]
+                if values is not None:
+                    values[pos] = values[child]
+                pos = child
+                child = 2 * pos + 1
+            else:
+                break
+        keys[pos] = key
+        if values is not None:
+            values[pos] = value
+
+    def _heapify(self) -> None:
+        """Restore the heap property over the whole storage in O(n)."""
+        if self._native:
+            heapq.heapify(self.heap)
+            return
+        keys = self.heap
+        values = self.values
+        for pos in reversed(range(len(keys) // 2)):
+            self._sift_down(pos, keys[pos], keys[pos] if values is None else values[pos])
+
+
+def _bounded_select(n: int, iterable: Iterable[Any], key: Optional[Callable[[Any], Any]],
+                    largest: bool) -> List[Any]:
+    """Stream the iterable through a heap of size n holding the best candidates seen so far."""
+    if n <= 0:
+        return []
+    # The candidates heap has the opposite order, so its root is the worst candidate.
+    # Entries carry the arrival index, which keeps the result stable like sorted().
+    candidates = Heap(key=itemgetter(0), reverse=not largest)
+    better = operator.gt if largest else operator.lt
+    worst = None
+    for index, value in enumerate(iterable):
+        item_key = value if key is None else key(value)
+        if index < n:
+            candidates.push(((item_key, -index if largest else index), value))
+            if index == n - 1:
+                worst = candidates.peek()[0][0]
+        elif better(item_key, worst):
+            # Most items stop at the comparison above, before any allocation
+            candidates.replace(((item_key, -index if largest else index), value))
+            worst = candidates.peek()[0][0]
+    result = [value for _, value in candidates.drain()]
+    result.reverse()
+    return result
+
+
+def nsmallest(n: int, iterable: Iterable[Any], key: Optional[Callable[[Any], Any]] = None) -> List[Any]:
+    """
+    Return the n smallest items of an iterable, in ascending order.
+
+    Uses O(n) memory whatever the length of the iterable, and calls key once per item.
+    Equivalent to sorted(iterable, key=key)[:n].
+    """
+    return _bounded_select(n, iterable, key, largest=False)
+
+
+def nlargest(n: int, iterable: Iterable[Any], key: Optional[Callable[[Any], Any]] = None) -> List[Any]:
+    """
+    Return the n largest items of an iterable, in descending order.
+
+    Equivalent to sorted(iterable, key=key, reverse=True)[:n].
+    """
+    return _bounded_select(n, iterable, key, largest=True)
+
+
+##################
+# Example usage: #
+##################
+if __name__ == "__main__":
+    # Min heap built in O(n) from an iterable
+    min_heap = Heap([10, 20, 5, 7, 1])
+    print("Heap:", min_heap.heap)
+    print("Pop:", min_heap.pop())  # Pop: 1
+    print("Pushpop 3:", min_heap.pushpop(3))  # Pushpop 3: 3
+    print("Replace with 30:", min_heap.replace(30))  # Replace with 30: 5
+
+    # Max heap of records ordered by a key, computed once per record
+    tasks = [("backup", 3), ("deploy", 9), ("report", 5)]
+    max_heap = Heap(tasks, key=lambda task: task[1], reverse=True)
+    max_heap.push_many([("alert", 10), ("cleanup", 1)])
+    print("Drain:", [name for name, _ in max_heap.drain()])  # alert, deploy, report, backup, cleanup
+
+    # Numeric heap stored in a typed array
+    typed_heap = Heap([3.5, 1.25, 2.0], typecode="d")
+    print("Typed heap:", typed_heap.heap)
+
+    # Streaming top-k
+    print("nsmallest:", nsmallest(3, [9, 4, 7, 1, 8, 2]))  # [1, 2, 4]
+    print("nlargest:", nlargest(2, tasks, key=lambda task: task[1]))  # deploy, report
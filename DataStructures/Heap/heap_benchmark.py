@@ -0,0 +1,75 @@
+import heapq
+import random
+import sys
+import time
+
+from heap import Heap, nsmallest
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    func()
+    print(f"{label:<40} {time.perf_counter() - start:>8.3f} s")
+
+
+def push_pop_one_by_one(data, **options):
+    heap = Heap(**options)
+    for value in data:
+        heap.push(value)
+    while heap:
+        heap.pop()
+
+
+def heapq_push_pop(data):
+    heap = []
+    for value in data:
+        heapq.heappush(heap, value)
+    while heap:
+        heapq.heappop(heap)
+
+
+def heapify_and_drain(data, **options):
+    for _ in Heap(data, **options).drain():
+        pass
+
+
+def merge_runs(runs):
+    """k-way merge of sorted runs, keeping one head per run in the heap."""
+    heap = Heap(((run[0], index, 0) for index, run in enumerate(runs) if run))
+    while heap:
+        value, index, position = heap.peek()
+        position += 1
+        if position < len(runs[index]):
+            heap.replace((runs[index][position], index, position))
+        else:
+            heap.pop()
+
+
+def run(n):
+    data = [random.random() for _ in range(n)]
+    records = [{"id": i, "score": value} for i, value in enumerate(data)]
+    by_score = lambda record: record["score"]
+
+    print(f"n = {n}")
+    timed("min heap push + pop", lambda: push_pop_one_by_one(data))
+    timed("max heap push + pop", lambda: push_pop_one_by_one(data, reverse=True))
+    timed("min heap heapify + drain", lambda: heapify_and_drain(data))
+    timed("max heap heapify + drain", lambda: heapify_and_drain(data, reverse=True))
+    timed("max heap heapify + drain (typed 'd')", lambda: heapify_and_drain(data, reverse=True, typecode="d"))
+    timed("keyed records heapify + drain", lambda: heapify_and_drain(records, key=by_score))
+    timed("heapq heappush + heappop", lambda: heapq_push_pop(data))
+
+    timed("top-100 nsmallest (records)", lambda: nsmallest(100, records, key=by_score))
+    timed("top-100 heapq.nsmallest (records)", lambda: heapq.nsmallest(100, records, key=by_score))
+    timed("top-100 sorted()[:100] (records)", lambda: sorted(records, key=by_score)[:100])
+
+    runs = [sorted(data[i::64]) for i in range(64)]
+    timed("64-way merge", lambda: merge_runs(runs))
+    timed("64-way heapq.merge", lambda: list(heapq.merge(*runs)))
+
+
+#############
+# Benchmark #
+#############
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,229 @@
+from typing import Any, Callable, Dict, Hashable, Optional
+
+try:
+    from .double_linked_list import DoublyLinkedList, DoublyNode
+except ImportError:  # Run as a script from this directory
+    from double_linked_list import DoublyLinkedList, DoublyNode
+
+
+class ARCEntry(DoublyNode):
+    """
+    An entry of an adaptive replacement cache.
+
+    Attributes:
+        data (Hashable): The key of the entry.
+        value (Any): The cached value (None for ghost entries, which only remember the key).
+        location (DoublyLinkedList): The list the entry is linked in.
+    """
+    __slots__ = ("value", "location")
+
+    def __init__(self, key: Hashable, value: Any) -> None:
+        super().__init__(key)
+        self.value = value
+        self.location: Optional[DoublyLinkedList] = None
+
+
+class ARCCache:
+    """
+    An adaptive replacement cache (ARC) with O(1) get, put and eviction.
+
+    Cached entries live in two LRU lists: recent holds keys seen once, and
+    frequent holds keys seen at least twice, so a long scan of new keys only
+    churns recent and leaves the hot set in frequent alone. Each list has a
+    ghost list (recent_ghosts, frequent_ghosts) remembering the keys it
+    evicted, without their values. A miss on a ghost key means that list was
+    too small: the target size of recent, target, grows or shrinks in
+    response, which adapts the cache between recency and frequency.
+
+    All four lists are DoublyLinkedLists ordered from the least to the most
+    recently used, and entries move between them through their nodes.
+
+    Attributes:
+        hits (int): Lookups that found an entry.
+        misses (int): Lookups that found nothing.
+        evictions (int): Entries dropped to respect max_entries.
+    """
+
+    def __init__(self, max_entries: int = 128, on_evict: Optional[Callable[[Hashable, Any], None]] = None) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached entries (the ghost lists hold as many keys again).
+            on_evict: Called with (key, value) for every evicted entry.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.on_evict = on_evict
+
+        self._entries: Dict[Hashable, ARCEntry] = {}  # Cached and ghost entries
+        self.recent = DoublyLinkedList()
+        self.frequent = DoublyLinkedList()
+        self.recent_ghosts = DoublyLinkedList()
+        self.frequent_ghosts = DoublyLinkedList()
+        self.target = 0.0  # Adaptive target size of recent
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the value cached for key, promoting it to the frequent list.
+
+        Args:
+            key (Hashable): The key to look up.
+            default (Any): The value returned on a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None or not self._is_cached(entry):
+            self.misses += 1
+            return default
+        self._move(entry, self.frequent)
+        self.hits += 1
+        return entry.value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Cache a value, adapting the target on ghost hits and evicting as needed.
+
+        Args:
+            key (Hashable): The key of the entry.
+            value (Any): The value to cache.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and self._is_cached(entry):
+            entry.value = value
+            self._move(entry, self.frequent)
+            return
+
+        if entry is not None:
+            # The key was evicted recently: grow the list that evicted it
+            if entry.location is self.recent_ghosts:
+                step = max(len(self.frequent_ghosts) / len(self.recent_ghosts), 1)
+                self.target = min(self.target + step, self.max_entries)
+            else:
+                step = max(len(self.recent_ghosts) / len(self.frequent_ghosts), 1)
+                self.target = max(self.target - step, 0)
+            if self._cached_count() >= self.max_entries:
+                self._replace(entry.location is self.frequent_ghosts)
+            entry.value = value
+            self._move(entry, self.frequent)
+            return
+
+        # A brand new key
+        recent_total = len(self.recent) + len(self.recent_ghosts)
+        if recent_total >= self.max_entries:
+            if len(self.recent) < self.max_entries:
+                self._forget(self.recent_ghosts.head)
+                if self._cached_count() >= self.max_entries:
+                    self._replace(False)
+            else:
+                # No ghost to drop: evict the least recently used entry outright
+                self._evict(self.recent.head)
+        elif self._cached_count() >= self.max_entries:
+            if len(self._entries) >= 2 * self.max_entries:
+                self._forget(self.frequent_ghosts.head)
+            self._replace(False)
+
+        entry = ARCEntry(key, value)
+        self._entries[key] = entry
+        self._move(entry, self.recent)
+
+    def delete(self, key: Hashable) -> bool:
+        """
+        Remove the entry of key, without calling on_evict.
+
+        Returns:
+            bool: True if a cached entry was removed.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        cached = self._is_cached(entry)
+        self._forget(entry)
+        return cached
+
+    def clear(self) -> None:
+        """Remove every entry and ghost; the counters are kept."""
+        self._entries.clear()
+        self.recent = DoublyLinkedList()
+        self.frequent = DoublyLinkedList()
+        self.recent_ghosts = DoublyLinkedList()
+        self.frequent_ghosts = DoublyLinkedList()
+        self.target = 0.0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and self._is_cached(entry)
+
+    def __len__(self) -> int:
+        return self._cached_count()
+
+    def __repr__(self) -> str:
+        recent = [(key, self._entries[key].value) for key in self.recent]
+        frequent = [(key, self._entries[key].value) for key in self.frequent]
+        return f"ARCCache(recent={recent}, frequent={frequent})"
+
+    def _is_cached(self, entry: ARCEntry) -> bool:
+        return entry.location is self.recent or entry.location is self.frequent
+
+    def _cached_count(self) -> int:
+        return len(self.recent) + len(self.frequent)
+
+    def _move(self, entry: ARCEntry, location: DoublyLinkedList) -> None:
+        """Link an entry as the most recently used of a list, unlinking it from its current one."""
+        if entry.location is not None:
+            entry.location.remove_node(entry)
+        entry.location = location
+        location.append_node(entry)
+
+    def _replace(self, in_frequent_ghosts: bool) -> None:
+        """Evict the least recently used entry of recent or frequent into its ghost list."""
+        recent_size = len(self.recent)
+        if recent_size and (
+            recent_size > self.target or (in_frequent_ghosts and recent_size == self.target) or not self.frequent.head
+        ):
+            entry, ghosts = self.recent.head, self.recent_ghosts
+        else:
+            entry, ghosts = self.frequent.head, self.frequent_ghosts
+        value = entry.value
+        entry.value = None
+        self._move(entry, ghosts)
+        self._evicted(entry.data, value)
+
+    def _evict(self, entry: ARCEntry) -> None:
+        """Evict a cached entry without keeping a ghost."""
+        value = entry.value
+        self._forget(entry)
+        self._evicted(entry.data, value)
+
+    def _evicted(self, key: Hashable, value: Any) -> None:
+        self.evictions += 1
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def _forget(self, entry: ARCEntry) -> None:
+        """Unlink an entry or ghost and drop its key."""
+        entry.location.remove_node(entry)
+        entry.location = None
+        del self._entries[entry.data]
+
+
+#################
+# Example usage #
+#################
+if __name__ == "__main__":
+    cache = ARCCache(max_entries=3)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")  # "a" moves to the frequent list
+    for key in ("x", "y", "z"):  # A scan of keys used once
+        cache.put(key, 0)
+    print(cache)  # Output: ARCCache(recent=[('y', 0), ('z', 0)], frequent=[('a', 1)])
+    print(cache.get("a"), cache.get("b"))  # Output: 1 None
@@ -0,0 +1,76 @@
+import functools
+import itertools
+import random
+import sys
+import time
+
+from arc_cache import ARCCache
+from lfu_cache import LFUCache
+from lru_cache import LRUCache
+
+_MISSING = object()
+
+
+def zipf_trace(length, universe, alpha=1.0):
+    """Keys drawn from a Zipf distribution: key k is requested with weight 1 / (k + 1) ** alpha."""
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) ** alpha for rank in range(universe)))
+    return random.choices(range(universe), cum_weights=cum_weights, k=length)
+
+
+def scan_mixed_trace(length, universe, scan_length, scan_every, alpha=1.0):
+    """A Zipf trace interrupted every scan_every requests by a sequential scan of never reused keys."""
+    trace = []
+    fresh_key = universe
+    for chunk in range(0, length, scan_every + scan_length):
+        trace.extend(zipf_trace(min(scan_every, length - chunk), universe, alpha))
+        trace.extend(range(fresh_key, fresh_key + scan_length))
+        fresh_key += scan_length
+    return trace[:length]
+
+
+def replay(cache, trace):
+    """Read-through replay: every miss is followed by a put. Returns the requests per second."""
+    get = cache.get
+    put = cache.put
+    start = time.perf_counter()
+    for key in trace:
+        if get(key, _MISSING) is _MISSING:
+            put(key, key)
+    return len(trace) / (time.perf_counter() - start)
+
+
+def replay_functools(max_entries, trace):
+    """The same replay through functools.lru_cache, as a C-implemented baseline."""
+    load = functools.lru_cache(maxsize=max_entries)(lambda key: key)
+    start = time.perf_counter()
+    for key in trace:
+        load(key)
+    ops = len(trace) / (time.perf_counter() - start)
+    info = load.cache_info()
+    return info.hits / (info.hits + info.misses), ops
+
+
+def run(length, universe, max_entries):
+    traces = {
+        "zipf": zipf_trace(length, universe),
+        "zipf + scans": scan_mixed_trace(length, universe, scan_length=2 * max_entries, scan_every=10 * max_entries),
+    }
+    policies = (("LRUCache", LRUCache), ("LFUCache", LFUCache), ("ARCCache", ARCCache))
+
+    print(f"{length} requests over {universe} keys, {max_entries} cache entries")
+    print(f"{'trace':>14} {'policy':>20} {'hit ratio':>10} {'ops/sec':>12}")
+    for trace_name, trace in traces.items():
+        for policy_name, policy in policies:
+            cache = policy(max_entries=max_entries)
+            ops = replay(cache, trace)
+            print(f"{trace_name:>14} {policy_name:>20} {cache.hit_ratio:>10.3f} {ops:>12,.0f}")
+        hit_ratio, ops = replay_functools(max_entries, trace)
+        print(f"{trace_name:>14} {'functools.lru_cache':>20} {hit_ratio:>10.3f} {ops:>12,.0f}")
+
+
+#############
+# Benchmark #
+#############
+if __name__ == "__main__":
+    length = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    run(length, universe=100_000, max_entries=1_000)
@@ -1,4 +1,4 @@
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 class DoublyNode:
     """
@@ -9,6 +9,7 @@ class DoublyNode:
         next_node (Optional[DoublyNode]): Reference to the next node in the list, or None if it's the last node.
         prev_node (Optional[DoublyNode]): Reference to the previous node in the list, or None if it's the first node.
     """
+    __slots__ = ("data", "next_node", "prev_node")
 
     def __init__(self, data: Any):
         self.data: Any = data
@@ -23,43 +24,128 @@ class DoublyLinkedList:
     """
     A class representing a doubly linked list.
 
+    append and prepend return the inserted node: the node is a handle that
+    remove_node and move_to_end use to relink it in O(1), without searching.
+
     Attributes:
         head (Optional[DoublyNode]): The first node in the linked list, or None if the list is empty.
+        tail (Optional[DoublyNode]): The last node in the linked list, or None if the list is empty.
     """
 
     def __init__(self) -> None:
         self.head: Optional[DoublyNode] = None
+        self.tail: Optional[DoublyNode] = None
+        self._length = 0
 
-    def append(self, data: Any) -> None:
+    def append(self, data: Any) -> DoublyNode:
         """
         Append a new node with the provided data to the end of the doubly linked list.
 
         Args:
             data (Any): The data to be added to the list.
+
+        Returns:
+            DoublyNode: The new node, usable as a handle.
         """
-        new_node = DoublyNode(data)
-        if not self.head:
-            self.head = new_node
-            return
+        return self.append_node(DoublyNode(data))
 
-        current = self.head
-        while current.next_node:
-            current = current.next_node
-        current.next_node = new_node
-        new_node.prev_node = current
+    def append_node(self, node: DoublyNode) -> DoublyNode:
+        """
+        Link a detached node (a new one, or one removed from a list) at the end in O(1).
 
-    def prepend(self, data: Any) -> None:
+        Args:
+            node (DoublyNode): The node to be linked.
+
+        Returns:
+            DoublyNode: The same node.
+        """
+        node.next_node = None
+        node.prev_node = self.tail
+        if self.tail:
+            self.tail.next_node = node
+        else:
+            self.head = node
+        self.tail = node
+        self._length += 1
+        return node
+
+    def insert_after(self, node: Optional[DoublyNode], new_node: DoublyNode) -> DoublyNode:
+        """
+        Link a detached node right after a node of this list, or at the start if node is None, in O(1).
+
+        Args:
+            node (Optional[DoublyNode]): A node of this list, or None.
+            new_node (DoublyNode): The node to be linked.
+
+        Returns:
+            DoublyNode: The new node.
+        """
+        following = self.head if node is None else node.next_node
+        new_node.prev_node = node
+        new_node.next_node = following
+        if node is None:
+            self.head = new_node
+        else:
+            node.next_node = new_node
+        if following is None:
+            self.tail = new_node
+        else:
+            following.prev_node = new_node
+        self._length += 1
+        return new_node
+
+    def prepend(self, data: Any) -> DoublyNode:
         """
         Prepend a new node with the provided data to the start of the doubly linked list.
 
         Args:
             data (Any): The data to be added to the list.
+
+        Returns:
+            DoublyNode: The new node, usable as a handle.
         """
         new_node = DoublyNode(data)
         if self.head:
             self.head.prev_node = new_node
+        else:
+            self.tail = new_node
         new_node.next_node = self.head
         self.head = new_node
+        self._length += 1
+        return new_node
+
+    def remove_node(self, node: DoublyNode) -> Any:
+        """
+        Unlink a node of this list in O(1) and return its data.
+
+        Args:
+            node (DoublyNode): A node returned by append, append_node, insert_after or prepend.
+
+        Returns:
+            Any: The data of the removed node.
+        """
+        if node.prev_node:
+            node.prev_node.next_node = node.next_node
+        else:
+            self.head = node.next_node
+        if node.next_node:
+            node.next_node.prev_node = node.prev_node
+        else:
+            self.tail = node.prev_node
+        node.prev_node = node.next_node = None
+        self._length -= 1
+        return node.data
+
+    def move_to_end(self, node: DoublyNode) -> None:
+        """
+        Move a node of this list to the end in O(1).
+
+        Args:
+            node (DoublyNode): A node of this list.
+        """
+        if node is not self.tail:
+            self.remove_node(node)
+            self.append_node(node)
 
     def delete_value(self, value: Any) -> None:
         """
@@ -74,15 +160,19 @@ class DoublyLinkedList:
         current: Optional[DoublyNode] = self.head
         while current:
             if current.data == value:
-                if current.prev_node:
-                    current.prev_node.next_node = current.next_node
-                if current.next_node:
-                    current.next_node.prev_node = current.prev_node
-                if current == self.head:
-                    self.head = current.next_node
+                self.remove_node(current)
                 return
             current = current.next_node
 
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Any]:
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next_node
+
     def __repr__(self) -> str:
         """
         Return a string representation of the doubly linked list.
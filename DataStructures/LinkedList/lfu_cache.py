@@ -0,0 +1,198 @@
+from typing import Any, Callable, Dict, Hashable, Optional
+
+try:
+    from .double_linked_list import DoublyLinkedList, DoublyNode
+except ImportError:  # Run as a script from this directory
+    from double_linked_list import DoublyLinkedList, DoublyNode
+
+
+class LFUEntry(DoublyNode):
+    """
+    A cache entry, linked by its key in the bucket of its access frequency.
+
+    Attributes:
+        data (Hashable): The key of the entry.
+        value (Any): The cached value.
+        frequency (int): The number of times the entry was put or hit.
+        bucket (LFUBucket): The bucket of that frequency.
+    """
+    __slots__ = ("value", "frequency", "bucket")
+
+    def __init__(self, key: Hashable, value: Any, bucket: "LFUBucket") -> None:
+        super().__init__(key)
+        self.value = value
+        self.frequency = 1
+        self.bucket = bucket
+
+
+class LFUBucket(DoublyNode):
+    """
+    The entries of one access frequency, a node of the list of frequencies in ascending order.
+
+    Attributes:
+        data (int): The frequency.
+        entries (DoublyLinkedList): The entries, from the least to the most recently used.
+    """
+    __slots__ = ("entries",)
+
+    def __init__(self, frequency: int) -> None:
+        super().__init__(frequency)
+        self.entries = DoublyLinkedList()
+
+
+class LFUCache:
+    """
+    A least frequently used cache with O(1) get, put and eviction.
+
+    Entries with the same access frequency share a bucket: a DoublyLinkedList
+    ordered from the least to the most recently used. The non-empty buckets
+    form a list of their own, in ascending order of frequency. A hit unlinks
+    the entry from its bucket and appends it to the next one, which is the
+    bucket's neighbour or a new bucket linked right after it; a bucket left
+    empty is unlinked. The lowest frequency is therefore always the head of
+    the list, after a delete too, and eviction takes the head of its bucket.
+    Ties between equally frequent entries are broken by recency.
+
+    Attributes:
+        hits (int): Lookups that found an entry.
+        misses (int): Lookups that found nothing.
+        evictions (int): Entries dropped to respect max_entries.
+    """
+
+    def __init__(self, max_entries: int = 128, on_evict: Optional[Callable[[Hashable, Any], None]] = None) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries.
+            on_evict: Called with (key, value) for every evicted entry.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.on_evict = on_evict
+
+        self._entries: Dict[Hashable, LFUEntry] = {}
+        self._frequencies = DoublyLinkedList()  # LFUBucket nodes, in ascending order of frequency
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the value cached for key and count the access.
+
+        Args:
+            key (Hashable): The key to look up.
+            default (Any): The value returned on a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self._touch(entry)
+        self.hits += 1
+        return entry.value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Cache a value; updating an existing key counts as an access.
+
+        Args:
+            key (Hashable): The key of the entry.
+            value (Any): The value to cache.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.value = value
+            self._touch(entry)
+            return
+
+        if len(self._entries) >= self.max_entries:
+            self._evict()
+        bucket = self._frequencies.head
+        if bucket is None or bucket.data != 1:
+            bucket = self._frequencies.insert_after(None, LFUBucket(1))
+        entry = LFUEntry(key, value, bucket)
+        self._entries[key] = entry
+        bucket.entries.append_node(entry)
+
+    def delete(self, key: Hashable) -> bool:
+        """
+        Remove the entry of key, without calling on_evict.
+
+        Returns:
+            bool: True if an entry was removed.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._unlink(entry)
+        return True
+
+    def clear(self) -> None:
+        """Remove every entry; the counters are kept."""
+        self._entries.clear()
+        self._frequencies = DoublyLinkedList()
+
+    @property
+    def min_frequency(self) -> int:
+        """The lowest access frequency of an entry, 0 when the cache is empty."""
+        bucket = self._frequencies.head
+        return 0 if bucket is None else bucket.data
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"LFUCache({[(key, entry.value, entry.frequency) for key, entry in self._entries.items()]})"
+
+    def _unlink(self, entry: LFUEntry) -> None:
+        """Remove an entry from its bucket, dropping the bucket once empty."""
+        bucket = entry.bucket
+        bucket.entries.remove_node(entry)
+        if bucket.entries.head is None:
+            self._frequencies.remove_node(bucket)
+
+    def _touch(self, entry: LFUEntry) -> None:
+        """Move an entry to the bucket of the next frequency."""
+        bucket = entry.bucket
+        following = bucket.next_node
+        if following is None or following.data != entry.frequency + 1:
+            following = self._frequencies.insert_after(bucket, LFUBucket(entry.frequency + 1))
+        self._unlink(entry)
+        entry.frequency += 1
+        entry.bucket = following
+        following.entries.append_node(entry)
+
+    def _evict(self) -> None:
+        """Drop the least recently used entry of the lowest frequency."""
+        entry = self._frequencies.head.entries.head
+        self._unlink(entry)
+        del self._entries[entry.data]
+        self.evictions += 1
+        if self.on_evict is not None:
+            self.on_evict(entry.data, entry.value)
+
+
+#################
+# Example usage #
+#################
+if __name__ == "__main__":
+    cache = LFUCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+    cache.put("c", 3)  # "b" was used less often than "a": it is evicted
+    print(cache)  # Output: LFUCache([('a', 1, 3), ('c', 3, 1)])
+    print(cache.get("b"), cache.hit_ratio)  # Output: None 0.75
@@ -0,0 +1,285 @@
+import sys
+import threading
+import time
+from typing import Any, Callable, Hashable, Optional
+
+try:
+    from .double_linked_list import DoublyLinkedList, DoublyNode
+except ImportError:  # Run as a script from this directory
+    from double_linked_list import DoublyLinkedList, DoublyNode
+
+_MISSING = object()
+
+
+class CacheEntry(DoublyNode):
+    """
+    A cache entry, linked in a DoublyLinkedList by its key.
+
+    Attributes:
+        data (Hashable): The key of the entry.
+        value (Any): The cached value.
+        size (int): The size charged against the cache size budget.
+        expires_at (Optional[float]): The clock time after which the entry is stale, or None.
+    """
+    __slots__ = ("value", "size", "expires_at")
+
+    def __init__(self, key: Hashable, value: Any, size: int, expires_at: Optional[float]) -> None:
+        super().__init__(key)
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+
+    @property
+    def key(self) -> Hashable:
+        return self.data
+
+
+class LRUCache:
+    """
+    A least recently used cache with O(1) get, put and eviction.
+
+    A dict maps each key to its CacheEntry, and the entries are linked in a
+    DoublyLinkedList from the least to the most recently used: a hit moves
+    its node to the end, and evictions unlink the head, both through node
+    handles instead of a search.
+
+    Entries are evicted when the cache holds more than max_entries entries or
+    when the total size of the entries exceeds max_size. Entries with a TTL
+    expire lazily: a stale entry is dropped when it is looked up or reaches
+    the head of the list, never by a background sweep.
+
+    Attributes:
+        hits (int): Lookups that found a fresh entry.
+        misses (int): Lookups that found nothing, or a stale entry.
+        evictions (int): Entries dropped to respect max_entries or max_size.
+        expirations (int): Stale entries dropped.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 128,
+        max_size: Optional[int] = None,
+        sizeof: Callable[[Any], int] = sys.getsizeof,
+        ttl: Optional[float] = None,
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries, or None for no limit.
+            max_size: Maximum total size of the values, or None for no limit.
+            sizeof: Function measuring a value, used when max_size is set.
+            ttl: Default time to live of an entry in seconds, or None to never expire.
+            on_evict: Called with (key, value) for every evicted or expired entry.
+            clock: Monotonic time source, replaceable in tests.
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.sizeof = sizeof
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self.clock = clock
+
+        self._entries: dict = {}
+        self._order = DoublyLinkedList()  # Least recently used first
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the value cached for key and mark it as the most recently used.
+
+        Args:
+            key (Hashable): The key to look up.
+            default (Any): The value returned on a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        if entry.expires_at is not None and entry.expires_at <= self.clock():
+            self._drop(entry)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self._order.move_to_end(entry)
+        self.hits += 1
+        return entry.value
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None, size: Optional[int] = None) -> None:
+        """
+        Cache a value as the most recently used entry, evicting as needed.
+
+        A value larger than max_size on its own is not cached.
+
+        Args:
+            key (Hashable): The key of the entry.
+            value (Any): The value to cache.
+            ttl (Optional[float]): Time to live in seconds, overriding the cache default.
+            size (Optional[int]): Size of the value, overriding sizeof.
+        """
+        old = self._entries.get(key)
+        if old is not None:
+            self._order.remove_node(old)
+            del self._entries[key]
+            self.size -= old.size
+
+        if size is None:
+            size = self.sizeof(value) if self.max_size is not None else 0
+        if self.max_size is not None and size > self.max_size:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = None if ttl is None else self.clock() + ttl
+
+        entry = CacheEntry(key, value, size, expires_at)
+        self._entries[key] = self._order.append_node(entry)
+        self.size += size
+        self._evict()
+
+    def delete(self, key: Hashable) -> bool:
+        """
+        Remove the entry of key, without calling on_evict.
+
+        Returns:
+            bool: True if an entry was removed.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._order.remove_node(entry)
+        self.size -= entry.size
+        return True
+
+    def clear(self) -> None:
+        """Remove every entry; the counters are kept."""
+        self._entries.clear()
+        self._order = DoublyLinkedList()
+        self.size = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __contains__(self, key: Hashable) -> bool:
+        # Does not count as a lookup nor refresh the entry
+        entry = self._entries.get(key)
+        return entry is not None and (entry.expires_at is None or entry.expires_at > self.clock())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        # Least recently used first
+        return f"LRUCache({[(key, self._entries[key].value) for key in self._order]})"
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits its limits."""
+        while self._order.head is not None and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_size is not None and self.size > self.max_size)
+        ):
+            entry = self._order.head
+            if entry.expires_at is not None and entry.expires_at <= self.clock():
+                self.expirations += 1
+            else:
+                self.evictions += 1
+            self._drop(entry)
+
+    def _drop(self, entry: CacheEntry) -> None:
+        """Unlink an entry and report it to on_evict."""
+        self._order.remove_node(entry)
+        del self._entries[entry.key]
+        self.size -= entry.size
+        if self.on_evict is not None:
+            self.on_evict(entry.key, entry.value)
+
+
+class ThreadSafeCache:
+    """
+    Wrap a cache so that several threads can share it.
+
+    Every call holds one lock: even get mutates the cache (recency order,
+    counters), so a read-write lock would not allow more concurrency.
+    """
+
+    def __init__(self, cache: Any) -> None:
+        self.cache = cache
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            return self.cache.get(key, default)
+
+    def put(self, key: Hashable, value: Any, **options: Any) -> None:
+        with self._lock:
+            self.cache.put(key, value, **options)
+
+    def delete(self, key: Hashable) -> bool:
+        with self._lock:
+            return self.cache.delete(key)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[Hashable], Any]) -> Any:
+        """
+        Return the cached value of key, computing and caching it on a miss.
+
+        compute runs outside the lock, so a slow computation does not block
+        other keys; concurrent misses on the same key may compute it twice.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute(key)
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self.cache.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self.cache
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self.cache)
+
+    def __getattr__(self, name: str) -> Any:
+        # Counters and settings of the wrapped cache
+        return getattr(self.cache, name)
+
+
+#################
+# Example usage #
+#################
+if __name__ == "__main__":
+    cache = LRUCache(max_entries=2, on_evict=lambda key, value: print(f"Evicted {key}"))
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")  # "a" becomes the most recently used
+    cache.put("c", 3)  # Output: Evicted b
+    print(cache)  # Output: LRUCache([('a', 1), ('c', 3)])
+
+    # Size budget: values are measured with len, and the total stays under 10
+    blobs = LRUCache(max_entries=None, max_size=10, sizeof=len)
+    blobs.put("x", b"123456")
+    blobs.put("y", b"12345")
+    print("x" in blobs, "y" in blobs)  # Output: False True
+
+    # Lazy expiry with a fake clock
+    now = [0.0]
+    sessions = LRUCache(ttl=30, clock=lambda: now[0])
+    sessions.put("token", "alice")
+    now[0] = 31.0
+    print(sessions.get("token"), sessions.expirations)  # Output: None 1
+    print(f"Hit ratio: {cache.hit_ratio}")  # Output: Hit ratio: 1.0
+
+    shared = ThreadSafeCache(LRUCache(max_entries=1000))
+    print(shared.get_or_compute(12, lambda key: key * key))  # Output: 144
@@ -0,0 +1,279 @@
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+
+class UnrolledNode:
+    """
+    A node of an unrolled linked list, holding up to node_capacity elements.
+
+    Attributes:
+        elements (List[Any]): The elements stored in the node, in order.
+        next_node (Optional[UnrolledNode]): Reference to the next node, or None for the last node.
+    """
+    __slots__ = ("elements", "next_node")
+
+    def __init__(self, elements: Optional[List[Any]] = None) -> None:
+        self.elements: List[Any] = elements if elements is not None else []
+        self.next_node: Optional[UnrolledNode] = None
+
+    def __repr__(self) -> str:
+        return f"UnrolledNode({self.elements})"
+
+
+class UnrolledLinkedList:
+    """
+    A linked list whose nodes hold small arrays of elements instead of one element.
+
+    Packing node_capacity elements per node divides the number of node objects
+    (and pointer hops) by up to node_capacity, and iterating a node walks a
+    contiguous array. A tail reference and a length counter make append and
+    len() O(1); positional operations skip whole nodes at a time.
+
+    Attributes:
+        head (Optional[UnrolledNode]): The first node, or None if the list is empty.
+        tail (Optional[UnrolledNode]): The last node, or None if the list is empty.
+        node_capacity (int): The maximum number of elements per node.
+    """
+
+    def __init__(self, iterable: Iterable[Any] = (), node_capacity: int = 64) -> None:
+        if node_capacity < 2:
+            raise ValueError("node_capacity must be at least 2.")
+        self.head: Optional[UnrolledNode] = None
+        self.tail: Optional[UnrolledNode] = None
+        self.node_capacity = node_capacity
+        self._length = 0
+        self.extend(iterable)
+
+    def append(self, data: Any) -> None:
+        """
+        Append an element to the end of the list in O(1).
+
+        Args:
+            data (Any): The data to be added to the list.
+        """
+        tail = self.tail
+        if tail is None or len(tail.elements) >= self.node_capacity:
+            tail = self._append_node(UnrolledNode())
+        tail.elements.append(data)
+        self._length += 1
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Append every element of an iterable, filling whole nodes at once.
+
+        Args:
+            iterable (Iterable[Any]): The data to be added to the list.
+        """
+        items = list(iterable)
+        capacity = self.node_capacity
+        start = 0
+        if self.tail is not None:
+            # Top up the current tail first
+            start = capacity - len(self.tail.elements)
+            self.tail.elements.extend(items[:start])
+        for chunk_start in range(start, len(items), capacity):
+            self._append_node(UnrolledNode(items[chunk_start:chunk_start + capacity]))
+        self._length += len(items)
+
+    def prepend(self, data: Any) -> None:
+        """
+        Prepend an element to the start of the list.
+
+        Args:
+            data (Any): The data to be added to the list.
+        """
+        self.insert(0, data)
+
+    def insert(self, index: int, data: Any) -> None:
+        """
+        Insert an element before the given position, like list.insert.
+
+        A node that overflows is split in two halves, so later inserts nearby
+        do not shift more than node_capacity elements.
+
+        Args:
+            index (int): The position to insert at (negative values count from the end).
+            data (Any): The data to be added to the list.
+        """
+        if index < 0:
+            index = max(0, index + self._length)
+        if index >= self._length:
+            self.append(data)
+            return
+
+        node, offset = self._locate(index)
+        node.elements.insert(offset, data)
+        self._length += 1
+        if len(node.elements) > self.node_capacity:
+            half = len(node.elements) // 2
+            new_node = UnrolledNode(node.elements[half:])
+            del node.elements[half:]
+            new_node.next_node = node.next_node
+            node.next_node = new_node
+            if node is self.tail:
+                self.tail = new_node
+
+    def pop(self, index: int = -1) -> Any:
+        """
+        Remove and return the element at the given position (the last one by default).
+
+        Args:
+            index (int): The position of the element (negative values count from the end).
+
+        Returns:
+            Any: The removed element.
+        """
+        index = self._normalize(index)
+        node, offset = self._locate(index)
+        value = node.elements.pop(offset)
+        self._length -= 1
+        self._rebalance(node)
+        return value
+
+    def delete_value(self, value: Any) -> None:
+        """
+        Delete the first element equal to the specified value, if any.
+
+        Args:
+            value (Any): The value to be deleted from the list.
+        """
+        node = self.head
+        while node:
+            if value in node.elements:
+                node.elements.remove(value)
+                self._length -= 1
+                self._rebalance(node)
+                return
+            node = node.next_node
+
+    def index(self, value: Any) -> int:
+        """
+        Return the position of the first element equal to value.
+
+        Raises:
+            ValueError: If the value is not in the list.
+        """
+        position = 0
+        node = self.head
+        while node:
+            if value in node.elements:
+                return position + node.elements.index(value)
+            position += len(node.elements)
+            node = node.next_node
+        raise ValueError(f"{value!r} is not in the list")
+
+    def __getitem__(self, index: int) -> Any:
+        node, offset = self._locate(self._normalize(index))
+        return node.elements[offset]
+
+    def __setitem__(self, index: int, data: Any) -> None:
+        node, offset = self._locate(self._normalize(index))
+        node.elements[offset] = data
+
+    def __delitem__(self, index: int) -> None:
+        self.pop(index)
+
+    def __contains__(self, value: Any) -> bool:
+        node = self.head
+        while node:
+            if value in node.elements:
+                return True
+            node = node.next_node
+        return False
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Any]:
+        node = self.head
+        while node:
+            yield from node.elements  # Contiguous scan inside each node
+            node = node.next_node
+
+    def __repr__(self) -> str:
+        """
+        Return a string representation of the unrolled linked list.
+
+        Example:
+            "UnrolledNode([1, 3]) -> UnrolledNode([5]) -> None"
+        """
+        nodes = []
+        current = self.head
+        while current:
+            nodes.append(repr(current))
+            current = current.next_node
+        return " -> ".join(nodes + ["None"])
+
+    def _append_node(self, node: UnrolledNode) -> UnrolledNode:
+        """Link a node after the tail and return it."""
+        if self.tail is None:
+            self.head = node
+        else:
+            self.tail.next_node = node
+        self.tail = node
+        return node
+
+    def _normalize(self, index: int) -> int:
+        """Turn a possibly negative index into a position, checking its bounds."""
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Index out of range.")
+        return index
+
+    def _locate(self, index: int) -> Tuple[UnrolledNode, int]:
+        """Return the node holding a valid position and the offset in it, skipping whole nodes."""
+        tail_start = self._length - len(self.tail.elements)
+        if index >= tail_start:
+            # Positions in the tail node are found without walking the list
+            return self.tail, index - tail_start
+        node = self.head
+        while index >= len(node.elements):
+            index -= len(node.elements)
+            node = node.next_node
+        return node, index
+
+    def _rebalance(self, node: UnrolledNode) -> None:
+        """Keep nodes at least half full after a removal, merging or borrowing from the next node."""
+        half = self.node_capacity // 2
+        if len(node.elements) >= half:
+            return
+
+        successor = node.next_node
+        if successor is not None:
+            if len(node.elements) + len(successor.elements) <= self.node_capacity:
+                # Merge the successor into this node
+                node.elements.extend(successor.elements)
+                node.next_node = successor.next_node
+                if successor is self.tail:
+                    self.tail = node
+            else:
+                # Borrow elements so both nodes end up about half full
+                moved = (len(successor.elements) - len(node.elements)) // 2
+                node.elements.extend(successor.elements[:moved])
+                del successor.elements[:moved]
+        elif not node.elements:
+            # The emptied node is the tail: walk to its predecessor to unlink it
+            if node is self.head:
+                self.head = self.tail = None
+                return
+            previous = self.head
+            while previous.next_node is not node:
+                previous = previous.next_node
+            previous.next_node = None
+            self.tail = previous
+
+
+#################
+# Example usage #
+#################
+if __name__ == "__main__":
+    unrolled_list = UnrolledLinkedList(node_capacity=4)
+    unrolled_list.extend([3, 5, 7, 9, 11])
+    unrolled_list.append(13)
+    unrolled_list.prepend(1)
+    print(unrolled_list)  # Output: UnrolledNode([1, 3]) -> UnrolledNode([5, 7, 9]) -> UnrolledNode([11, 13]) -> None
+    unrolled_list.insert(2, 4)
+    unrolled_list.delete_value(9)
+    print(list(unrolled_list))  # Output: [1, 3, 4, 5, 7, 11, 13]
+    print(unrolled_list[3], len(unrolled_list))  # Output: 5 7
+    print(unrolled_list.pop())  # Output: 13
@@ -0,0 +1,66 @@
+import sys
+import time
+import tracemalloc
+
+from linked_list import SinglyLinkedList
+from double_linked_list import DoublyLinkedList
+from unrolled_linked_list import UnrolledLinkedList
+
+
+def build_by_append(factory, n):
+    linked_list = factory()
+    for value in range(n):
+        linked_list.append(value)
+    return linked_list
+
+
+def iterate_nodes(linked_list):
+    """Walk a singly or doubly linked list, which have no __iter__ of their own."""
+    total = 0
+    node = linked_list.head
+    while node:
+        total += node.data
+        node = node.next_node
+    return total
+
+
+def measure_build(build, n):
+    """Build a list and return it with the build time and the bytes allocated per element."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    linked_list = build(n)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return linked_list, elapsed, current / n
+
+
+def measure_iterate(iterate, linked_list):
+    start = time.perf_counter()
+    iterate(linked_list)
+    return time.perf_counter() - start
+
+
+def run(sizes):
+    structures = (
+        # SinglyLinkedList walks from the head on every append
+        ("SinglyLinkedList", lambda n: build_by_append(SinglyLinkedList, n), iterate_nodes),
+        ("DoublyLinkedList", lambda n: build_by_append(DoublyLinkedList, n), iterate_nodes),
+        ("UnrolledLinkedList append", lambda n: build_by_append(UnrolledLinkedList, n), sum),
+        ("UnrolledLinkedList extend", lambda n: UnrolledLinkedList(range(n)), sum),
+        ("list", lambda n: list(range(n)), sum),
+    )
+    print(f"{'n':>8} {'structure':>26} {'build (s)':>10} {'iterate (s)':>12} {'bytes/element':>14}")
+    for n in sizes:
+        for name, build, iterate in structures:
+            linked_list, build_time, per_element = measure_build(build, n)
+            iterate_time = measure_iterate(iterate, linked_list)
+            print(f"{n:>8} {name:>26} {build_time:>10.4f} {iterate_time:>12.4f} {per_element:>14.1f}")
+
+
+#############
+# Benchmark #
+#############
+if __name__ == "__main__":
+    # Quadratic SinglyLinkedList appends keep the default sizes moderate
+    run([int(size) for size in sys.argv[1:]] or [1_000, 5_000, 20_000])
@@ -1,8 +1,17 @@
+from array import array
+
+
 class CircularQueue:
-    def __init__(self, capacity):
-        """Initialize the queue with a fixed capacity."""
+    def __init__(self, capacity, overwrite=False):
+        """
+        Initialize the queue with a fixed capacity.
+
+        With overwrite=True, enqueueing into a full queue drops the oldest item
+        instead of raising.
+        """
         self.queue = [None] * capacity
         self.capacity = capacity
+        self.overwrite = overwrite
         self.front = 0
         self.rear = 0
         self.size = 0
@@ -10,7 +19,9 @@ class CircularQueue:
     def enqueue(self, item):
         """Add an item to the next available position."""
         if self.size == self.capacity:
-            raise OverflowError("Queue is full.")
+            if not self.overwrite:
+                raise OverflowError("Queue is full.")
+            self.dequeue()  # Drop the oldest item to make room
         self.queue[self.rear] = item
         self.rear = (self.rear + 1) % self.capacity
         self.size += 1
@@ -32,15 +43,178 @@ class CircularQueue:
     def is_full(self):
         """Check if the queue is full."""
         return self.size == self.capacity
-    
+
+
+class TypedCircularQueue:
+    """
+    A circular queue of fixed-size numeric records stored in one flat buffer.
+
+    Each slot holds a record of record_size values of the given array
+    typecode ('d' for float samples, 'B' for byte frames...). Records are
+    copied in once by enqueue_many, and dequeue_many returns memoryviews of
+    the ring itself (two views when the records wrap around the end), so
+    reading costs no copy at all.
+
+    The views returned by dequeue_many point at freed slots: consume them
+    before the next enqueue, which may overwrite them.
+    """
+
+    def __init__(self, capacity, typecode="B", record_size=1, buffer=None, overwrite=False):
+        """
+        Initialize the queue.
+
+        Args:
+            capacity: Number of records the queue can hold.
+            typecode: array/struct typecode of each value.
+            record_size: Number of values in a record.
+            buffer: Optional writable buffer to store the records in (a
+                bytearray, a NumPy array, a shared memory block...). A new
+                bytearray is allocated when omitted.
+            overwrite: Drop the oldest records instead of raising when full.
+        """
+        itemsize = array(typecode).itemsize
+        if buffer is None:
+            buffer = bytearray(capacity * record_size * itemsize)
+        storage = memoryview(buffer).cast("B").cast(typecode)
+        if len(storage) < capacity * record_size:
+            raise ValueError("Buffer is too small for the requested capacity.")
+
+        self.queue = storage[:capacity * record_size]
+        self.typecode = typecode
+        self.record_size = record_size
+        self.capacity = capacity
+        self.overwrite = overwrite
+        self.front = 0  # Index of the oldest record
+        self.rear = 0  # Index of the next free record slot
+        self.size = 0
+        self.dropped = 0  # Records discarded by the overwrite policy
+
+    def enqueue(self, record):
+        """Add one record (a value, or a sequence of record_size values)."""
+        if self.record_size == 1 and not isinstance(record, (memoryview, bytes, bytearray, array)):
+            record = (record,)
+        self.enqueue_many(record)
+
+    def enqueue_many(self, data):
+        """
+        Copy whole records from a buffer (or a sequence of values) into the queue.
+
+        Without overwrite, raises OverflowError and queues nothing if the
+        records do not fit.
+        """
+        values = self._as_values(data)
+        record_size = self.record_size
+        if len(values) % record_size:
+            raise ValueError("Data length is not a multiple of the record size.")
+        count = len(values) // record_size
+
+        free = self.capacity - self.size
+        if count > free:
+            if not self.overwrite:
+                raise OverflowError("Queue is full.")
+            if count > self.capacity:
+                # Only the newest records can survive
+                self.dropped += count - self.capacity
+                values = values[(count - self.capacity) * record_size:]
+                count = self.capacity
+            self._advance(count - free)
+            self.dropped += count - free
+
+        # Copy in at most two slices: up to the end of the ring, then from the start
+        first = min(count, self.capacity - self.rear)
+        start = self.rear * record_size
+        self.queue[start:start + first * record_size] = values[:first * record_size]
+        if count > first:
+            self.queue[:(count - first) * record_size] = values[first * record_size:]
+        self._publish(count)
+
+    def dequeue(self):
+        """Remove and return the front record (a value when record_size is 1)."""
+        if self.is_empty():
+            raise IndexError("Dequeue from an empty queue.")
+        start = self.front * self.record_size
+        self._advance(1)
+        if self.record_size == 1:
+            return self.queue[start]
+        return self.queue[start:start + self.record_size]
+
+    def dequeue_many(self, n):
+        """
+        Remove up to n records and return them as a tuple of one or two memoryviews.
+
+        The views share memory with the queue: nothing is copied.
+        """
+        if self.is_empty():
+            raise IndexError("Dequeue from an empty queue.")
+        views = self.peek_many(n)
+        self._advance(sum(len(view) for view in views) // self.record_size)
+        return views
+
+    def peek_many(self, n):
+        """Return up to n front records as one or two memoryviews, without removing them."""
+        count = min(n, self.size)
+        record_size = self.record_size
+        first = min(count, self.capacity - self.front)
+        start = self.front * record_size
+        views = (self.queue[start:start + first * record_size],)
+        if count > first:
+            views += (self.queue[:(count - first) * record_size],)
+        return views
+
+    def is_empty(self):
+        """Check if the queue is empty."""
+        return self.size == 0
+
+    def is_full(self):
+        """Check if the queue is full."""
+        return self.size == self.capacity
+
+    def __len__(self):
+        return self.size
+
+    def _advance(self, count):
+        """Release count records from the front."""
+        self.front = (self.front + count) % self.capacity
+        self.size -= count
+
+    def _publish(self, count):
+        """Make count records written after the rear visible to the consumer."""
+        self.rear = (self.rear + count) % self.capacity
+        self.size += count
+
+    def _as_values(self, data):
+        """Return the data as a flat memoryview with the queue typecode."""
+        if isinstance(data, (bytes, bytearray, memoryview, array)) or hasattr(data, "__array_interface__"):
+            view = memoryview(data)
+            if view.format != self.typecode or view.ndim != 1:
+                view = view.cast("B").cast(self.typecode)
+            return view
+        return memoryview(array(self.typecode, data))
+
+
 ##################
-# Example usage: # 
+# Example usage: #
 ##################
-my_queue = CircularQueue(3)
-my_queue.enqueue('A')
-my_queue.enqueue('B')
-my_queue.enqueue('C')
-
-print(f"Full? {my_queue.is_full()}")  # Full? Trye
-print(f"Dequeue: {my_queue.dequeue()}")  # Dequeue: "B"
-print(f"Full? {my_queue.is_full()}")  # Full? False
\ No newline at end of file
+if __name__ == "__main__":
+    my_queue = CircularQueue(3)
+    my_queue.enqueue('A')
+    my_queue.enqueue('B')
+    my_queue.enqueue('C')
+
+    print(f"Full? {my_queue.is_full()}")  # Full? True
+    print(f"Dequeue: {my_queue.dequeue()}")  # Dequeue: "A"
+    print(f"Full? {my_queue.is_full()}")  # Full? False
+
+    # Typed ring of float samples
+    samples = TypedCircularQueue(4, typecode="d")
+    samples.enqueue_many(array("d", [0.5, 1.5, 2.5]))
+    print(f"Dequeue: {samples.dequeue()}")  # Dequeue: 0.5
+    samples.enqueue_many(array("d", [3.5, 4.5]))  # Wraps around the end of the ring
+    views = samples.dequeue_many(10)
+    print(f"Views: {[view.tolist() for view in views]}")  # Views: [[1.5, 2.5, 3.5], [4.5]]
+
+    # Lossy ring of 2-byte frames
+    frames = TypedCircularQueue(2, typecode="B", record_size=2, overwrite=True)
+    frames.enqueue_many(b"aabbcc")
+    print(f"Frames: {[bytes(view) for view in frames.dequeue_many(2)]}")  # Frames: [b'bbcc']
+    print(f"Dropped: {frames.dropped}")  # Dropped: 1
@@ -0,0 +1,232 @@
+import asyncio
+import threading
+import time
+
+try:
+    from .priority_queue import PriorityQueue
+except ImportError:  # Run as a script from this directory
+    from priority_queue import PriorityQueue
+
+
+class BlockingPriorityQueue:
+    """
+    A bounded, thread-safe priority queue built on the PriorityQueue heap.
+
+    Producers block in put() while the queue is full (backpressure) and
+    consumers block in get() while it is empty. A timeout of None waits
+    forever, a timeout of 0 never waits.
+    """
+
+    def __init__(self, maxsize=0):
+        """Initialize the queue; maxsize <= 0 means unbounded."""
+        self.maxsize = maxsize
+        self._queue = PriorityQueue()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def put(self, item, priority, timeout=None):
+        """Add an item, waiting for a free slot if the queue is full."""
+        with self._not_full:
+            if not self._not_full.wait_for(self._has_room, timeout):
+                raise OverflowError("Queue is full.")
+            handle = self._queue.enqueue(item, priority)
+            self._not_empty.notify()
+            return handle
+
+    def put_many(self, items, timeout=None):
+        """
+        Add (item, priority) pairs, taking the lock once per batch of free slots.
+
+        Raises OverflowError if the timeout expires before every item is queued;
+        the items queued until then stay in the queue.
+        """
+        items = list(items)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        position = 0
+        with self._not_full:
+            while position < len(items):
+                if not self._not_full.wait_for(self._has_room, self._remaining(deadline)):
+                    raise OverflowError("Queue is full.")
+                room = len(items) - position
+                if self.maxsize > 0:
+                    room = min(room, self.maxsize - len(self._queue))
+                for item, priority in items[position:position + room]:
+                    self._queue.enqueue(item, priority)
+                position += room
+                self._not_empty.notify(room)
+
+    def get(self, timeout=None):
+        """Remove and return the item with the highest priority, waiting while the queue is empty."""
+        with self._not_empty:
+            if not self._not_empty.wait_for(self._has_items, timeout):
+                raise IndexError("Dequeue from an empty queue.")
+            item = self._queue.dequeue()
+            self._not_full.notify()
+            return item
+
+    def get_many(self, n, timeout=None):
+        """
+        Remove and return up to n items in priority order.
+
+        Waits only until at least one item is available, then takes as many as
+        possible under a single lock acquisition and wakes the producers once.
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(self._has_items, timeout):
+                raise IndexError("Dequeue from an empty queue.")
+            count = min(n, len(self._queue))
+            items = [self._queue.dequeue() for _ in range(count)]
+            self._not_full.notify(count)
+            return items
+
+    def qsize(self):
+        """Return the number of queued items."""
+        with self._lock:
+            return len(self._queue)
+
+    def is_empty(self):
+        """Check if the queue is empty."""
+        return self.qsize() == 0
+
+    def is_full(self):
+        """Check if the queue is full."""
+        return self.maxsize > 0 and self.qsize() >= self.maxsize
+
+    def _has_room(self):
+        return self.maxsize <= 0 or len(self._queue) < self.maxsize
+
+    def _has_items(self):
+        return len(self._queue) > 0
+
+    @staticmethod
+    def _remaining(deadline):
+        return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+class AsyncPriorityQueue:
+    """
+    A bounded asyncio priority queue built on the PriorityQueue heap.
+
+    Same semantics as BlockingPriorityQueue, with coroutines instead of
+    blocking calls. It must be used from a single event loop.
+    """
+
+    def __init__(self, maxsize=0):
+        """Initialize the queue; maxsize <= 0 means unbounded."""
+        self.maxsize = maxsize
+        self._queue = PriorityQueue()
+        self._lock = asyncio.Lock()
+        self._not_empty = asyncio.Condition(self._lock)
+        self._not_full = asyncio.Condition(self._lock)
+
+    async def put(self, item, priority, timeout=None):
+        """Add an item, waiting for a free slot if the queue is full."""
+        async with self._not_full:
+            if not await self._wait(self._not_full, self._has_room, timeout):
+                raise OverflowError("Queue is full.")
+            handle = self._queue.enqueue(item, priority)
+            self._not_empty.notify()
+            return handle
+
+    async def put_many(self, items, timeout=None):
+        """Add (item, priority) pairs, waking consumers once per batch of free slots."""
+        items = list(items)
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        position = 0
+        async with self._not_full:
+            while position < len(items):
+                remaining = None if deadline is None else max(0.0, deadline - loop.time())
+                if not await self._wait(self._not_full, self._has_room, remaining):
+                    raise OverflowError("Queue is full.")
+                room = len(items) - position
+                if self.maxsize > 0:
+                    room = min(room, self.maxsize - len(self._queue))
+                for item, priority in items[position:position + room]:
+                    self._queue.enqueue(item, priority)
+                position += room
+                self._not_empty.notify(room)
+
+    async def get(self, timeout=None):
+        """Remove and return the item with the highest priority, waiting while the queue is empty."""
+        async with self._not_empty:
+            if not await self._wait(self._not_empty, self._has_items, timeout):
+                raise IndexError("Dequeue from an empty queue.")
+            item = self._queue.dequeue()
+            self._not_full.notify()
+            return item
+
+    async def get_many(self, n, timeout=None):
+        """Remove and return up to n items in priority order, waiting for at least one."""
+        async with self._not_empty:
+            if not await self._wait(self._not_empty, self._has_items, timeout):
+                raise IndexError("Dequeue from an empty queue.")
+            count = min(n, len(self._queue))
+            items = [self._queue.dequeue() for _ in range(count)]
+            self._not_full.notify(count)
+            return items
+
+    def qsize(self):
+        """Return the number of queued items."""
+        return len(self._queue)
+
+    def is_empty(self):
+        """Check if the queue is empty."""
+        return len(self._queue) == 0
+
+    def is_full(self):
+        """Check if the queue is full."""
+        return self.maxsize > 0 and len(self._queue) >= self.maxsize
+
+    def _has_room(self):
+        return self.maxsize <= 0 or len(self._queue) < self.maxsize
+
+    def _has_items(self):
+        return len(self._queue) > 0
+
+    @staticmethod
+    async def _wait(condition, predicate, timeout):
+        """Wait on a held condition until predicate() is true; return False on timeout."""
+        if predicate():
+            return True
+        if timeout is not None and timeout <= 0:
+            return False
+        try:
+            await asyncio.wait_for(condition.wait_for(predicate), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+
+##################
+# Example usage: #
+##################
+if __name__ == "__main__":
+    # Blocking queue fed by a producer thread
+    blocking_queue = BlockingPriorityQueue(maxsize=2)
+
+    def producer():
+        for priority, item in enumerate("ABCD"):
+            blocking_queue.put(item, -priority)  # Waits while 2 items are queued
+
+    thread = threading.Thread(target=producer)
+    thread.start()
+    thread.join(timeout=0.1)  # The producer is stuck on "C": the queue is full
+    print(f"Get many: {blocking_queue.get_many(10)}")  # Get many: ['B', 'A']
+    thread.join()
+    print(f"Get many: {blocking_queue.get_many(10)}")  # Get many: ['D', 'C']
+
+    try:
+        blocking_queue.get(timeout=0.01)
+    except IndexError as error:
+        print(f"Get: {error}")  # Get: Dequeue from an empty queue.
+
+    # Asyncio queue
+    async def main():
+        async_queue = AsyncPriorityQueue(maxsize=10)
+        await async_queue.put_many([("low", 5), ("high", 1), ("mid", 3)])
+        print(f"Get: {await async_queue.get()}")  # Get: high
+        print(f"Get many: {await async_queue.get_many(5)}")  # Get many: ['mid', 'low']
+
+    asyncio.run(main())
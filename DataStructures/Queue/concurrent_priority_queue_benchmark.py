@@ -0,0 +1,93 @@
+import asyncio
+import random
+import sys
+import threading
+import time
+
+from concurrent_priority_queue import AsyncPriorityQueue, BlockingPriorityQueue
+
+BATCH = 64
+
+
+def run_threads(producers, items_per_producer, batched, maxsize=1024):
+    """Return the ops/sec (one put + one get per item) with threaded producers and one consumer."""
+    queue = BlockingPriorityQueue(maxsize)
+    total = producers * items_per_producer
+
+    def produce():
+        priorities = [random.random() for _ in range(items_per_producer)]
+        if batched:
+            for start in range(0, items_per_producer, BATCH):
+                queue.put_many((None, priority) for priority in priorities[start:start + BATCH])
+        else:
+            for priority in priorities:
+                queue.put(None, priority)
+
+    def consume():
+        received = 0
+        while received < total:
+            if batched:
+                received += len(queue.get_many(BATCH))
+            else:
+                queue.get()
+                received += 1
+
+    threads = [threading.Thread(target=produce) for _ in range(producers)]
+    consumer = threading.Thread(target=consume)
+    start = time.perf_counter()
+    consumer.start()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    consumer.join()
+    return total / (time.perf_counter() - start)
+
+
+def run_asyncio(producers, items_per_producer, batched, maxsize=1024):
+    """Return the ops/sec with producer tasks and one consumer task."""
+    total = producers * items_per_producer
+
+    async def main():
+        queue = AsyncPriorityQueue(maxsize)
+
+        async def produce():
+            priorities = [random.random() for _ in range(items_per_producer)]
+            if batched:
+                for start in range(0, items_per_producer, BATCH):
+                    await queue.put_many((None, priority) for priority in priorities[start:start + BATCH])
+            else:
+                for priority in priorities:
+                    await queue.put(None, priority)
+
+        async def consume():
+            received = 0
+            while received < total:
+                if batched:
+                    received += len(await queue.get_many(BATCH))
+                else:
+                    await queue.get()
+                    received += 1
+
+        await asyncio.gather(consume(), *(produce() for _ in range(producers)))
+
+    start = time.perf_counter()
+    asyncio.run(main())
+    return total / (time.perf_counter() - start)
+
+
+#############
+# Benchmark #
+#############
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"{'producers':>9} {'threads':>12} {'threads batch':>14} {'asyncio':>12} {'asyncio batch':>14}  (ops/sec)")
+    for producers in (1, 2, 4, 8, 16):
+        per_producer = total // producers
+        results = [
+            run_threads(producers, per_producer, batched=False),
+            run_threads(producers, per_producer, batched=True),
+            run_asyncio(producers, per_producer, batched=False),
+            run_asyncio(producers, per_producer, batched=True),
+        ]
+        print(f"{producers:>9} {results[0]:>12,.0f} {results[1]:>14,.0f} {results[2]:>12,.0f} {results[3]:>14,.0f}")
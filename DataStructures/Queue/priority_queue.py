@@ -1,29 +1,156 @@
+from itertools import count
+
+
+class QueueEntry:
+    """
+    An item stored in the PriorityQueue, returned by enqueue as a handle.
+
+    The handle keeps its own position inside the heap, so the queue can
+    update or remove it in O(log n) without searching.
+    """
+    __slots__ = ("key", "item", "index")
+
+    def __init__(self, priority, sequence, item):
+        self.key = (priority, sequence)  # Ties on priority are broken by insertion order
+        self.item = item
+        self.index = -1  # Position in the heap, -1 once the entry left the queue
+
+    @property
+    def priority(self):
+        return self.key[0]
+
+    def __repr__(self):
+        return f"QueueEntry({self.item!r}, priority={self.priority!r})"
+
+
 class PriorityQueue:
     def __init__(self):
-        self.queue = []
+        self.queue = []  # Binary min-heap of QueueEntry objects
+        self._counter = count()
 
     def enqueue(self, item, priority):
-        """Add an item to the queue with the given priority."""
-        self.queue.append((priority, item))
-        self.queue.sort(key=lambda x: x[0])  # Keep the queue sorted by priority (lowest first)
+        """Add an item to the queue with the given priority and return its handle."""
+        entry = QueueEntry(priority, next(self._counter), item)
+        entry.index = len(self.queue)
+        self.queue.append(entry)
+        self._sift_up(entry.index)
+        return entry
 
     def dequeue(self):
-        """Remove and return the item with the highest priority."""
+        """Remove and return the item with the highest priority (lowest priority value)."""
         if self.is_empty():
             raise IndexError("Dequeue from an empty queue.")
-        return self.queue.pop(0)[1]  # Remove and return the item with the lowest priority value
+        return self._pop_at(0).item
+
+    def peek(self):
+        """Return the item with the highest priority without removing it."""
+        if self.is_empty():
+            raise IndexError("Peek from an empty queue.")
+        return self.queue[0].item
+
+    def update_priority(self, handle, priority):
+        """Change the priority of a queued item, keeping its original insertion order."""
+        self._check_handle(handle)
+        old_key = handle.key
+        handle.key = (priority, old_key[1])
+        if handle.key < old_key:
+            self._sift_up(handle.index)
+        else:
+            self._sift_down(handle.index)
+
+    def remove(self, handle):
+        """Remove a queued item by its handle and return the item."""
+        self._check_handle(handle)
+        return self._pop_at(handle.index).item
 
     def is_empty(self):
         """Check if the queue is empty."""
         return len(self.queue) == 0
 
+    def __len__(self):
+        return len(self.queue)
+
+    def __contains__(self, handle):
+        index = handle.index
+        return 0 <= index < len(self.queue) and self.queue[index] is handle
+
+    def _check_handle(self, handle):
+        """Raise if the handle does not belong to an entry currently in this queue."""
+        if handle not in self:
+            raise KeyError("Handle is not in the queue.")
+
+    def _pop_at(self, index):
+        """Remove and return the entry at the given heap position."""
+        queue = self.queue
+        entry = queue[index]
+        last = queue.pop()
+        if last is not entry:
+            # Move the last entry into the hole and restore the heap property
+            queue[index] = last
+            last.index = index
+            if index > 0 and last.key < queue[(index - 1) >> 1].key:
+                self._sift_up(index)
+            else:
+                self._sift_down(index)
+        entry.index = -1
+        return entry
+
+    def _sift_up(self, index):
+        """Move the entry at index up until its parent is not larger."""
+        queue = self.queue
+        entry = queue[index]
+        key = entry.key
+        while index > 0:
+            parent_index = (index - 1) >> 1
+            parent = queue[parent_index]
+            if key < parent.key:
+                # Shift the parent down into the hole instead of swapping
+                queue[index] = parent
+                parent.index = index
+                index = parent_index
+            else:
+                break
+        queue[index] = entry
+        entry.index = index
+
+    def _sift_down(self, index):
+        """Move the entry at index down until both children are not smaller."""
+        queue = self.queue
+        size = len(queue)
+        entry = queue[index]
+        key = entry.key
+        child_index = 2 * index + 1
+        while child_index < size:
+            # Pick the smaller of the two children
+            right_index = child_index + 1
+            if right_index < size and queue[right_index].key < queue[child_index].key:
+                child_index = right_index
+            child = queue[child_index]
+            if child.key < key:
+                queue[index] = child
+                child.index = index
+                index = child_index
+                child_index = 2 * index + 1
+            else:
+                break
+        queue[index] = entry
+        entry.index = index
+
+
 ##################
-# Example usage: # 
+# Example usage: #
 ##################
-my_queue = PriorityQueue()
-my_queue.enqueue('A', 2)
-my_queue.enqueue('B', 1)
-my_queue.enqueue('C', 1)
+if __name__ == "__main__":
+    my_queue = PriorityQueue()
+    my_queue.enqueue('A', 2)
+    my_queue.enqueue('B', 1)
+    handle = my_queue.enqueue('C', 1)
+    my_queue.enqueue('D', 3)
+
+    print(f"Dequeue: {my_queue.dequeue()}")  # Dequeue: "B"
+    print(f"Empty? {my_queue.is_empty()}")  # Empty False
 
-print(f"Dequeue: {my_queue.dequeue()}")  # Dequeue: "B"
-print(f"Empty? {my_queue.is_empty()}")  # Empty False
\ No newline at end of file
+    my_queue.update_priority(handle, 5)  # "C" now comes after "D"
+    print(f"Dequeue: {my_queue.dequeue()}")  # Dequeue: "A"
+    print(f"Remove: {my_queue.remove(handle)}")  # Remove: "C"
+    print(f"Dequeue: {my_queue.dequeue()}")  # Dequeue: "D"
@@ -1,4 +1,6 @@
 from collections import deque
+import threading
+
 
 class StandardQueue:
     def __init__(self):
@@ -8,12 +10,22 @@ class StandardQueue:
         """Add an item to the back of the queue."""
         self.queue.append(item)
 
+    def enqueue_many(self, items):
+        """Add all the items to the back of the queue, in order."""
+        self.queue.extend(items)
+
     def dequeue(self):
         """Remove and return the front item from the queue."""
         if self.is_empty():
             raise IndexError("Dequeue from an empty queue.")
         return self.queue.popleft()
 
+    def dequeue_many(self, max_n):
+        """Remove and return up to max_n items from the front of the queue."""
+        count = min(max_n, len(self.queue))
+        popleft = self.queue.popleft
+        return [popleft() for _ in range(count)]
+
     def is_empty(self):
         """Check if the queue is empty."""
         return len(self.queue) == 0
@@ -24,16 +36,99 @@ class StandardQueue:
             raise IndexError("Peek from an empty queue.")
         return self.queue[0]
 
+
+class QueueClosed(Exception):
+    """Raised when putting into a closed queue, or getting from a closed and drained one."""
+
+
+class BlockingQueue(StandardQueue):
+    """
+    A thread-safe StandardQueue whose consumers wait for items.
+
+    Once closed, the queue refuses new items but still hands out the queued
+    ones; consumers get QueueClosed when it is both closed and empty, which
+    lets worker threads exit their loop cleanly.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.closed = False
+        self._not_empty = threading.Condition(threading.Lock())
+
+    def enqueue(self, item):
+        """Add an item to the back of the queue and wake one consumer."""
+        with self._not_empty:
+            if self.closed:
+                raise QueueClosed("Enqueue on a closed queue.")
+            self.queue.append(item)
+            self._not_empty.notify()
+
+    def enqueue_many(self, items):
+        """Add all the items under a single lock acquisition and wake as many consumers."""
+        items = list(items)
+        with self._not_empty:
+            if self.closed:
+                raise QueueClosed("Enqueue on a closed queue.")
+            self.queue.extend(items)
+            self._not_empty.notify(len(items))
+
+    def dequeue(self, timeout=None):
+        """Remove and return the front item, waiting while the queue is empty."""
+        with self._not_empty:
+            self._wait_for_items(timeout)
+            return self.queue.popleft()
+
+    def dequeue_many(self, max_n, timeout=None):
+        """Wait for at least one item, then remove and return up to max_n items."""
+        with self._not_empty:
+            self._wait_for_items(timeout)
+            return super().dequeue_many(max_n)
+
+    def close(self):
+        """Refuse new items and wake every waiting consumer."""
+        with self._not_empty:
+            self.closed = True
+            self._not_empty.notify_all()
+
+    def _wait_for_items(self, timeout):
+        """Wait with the lock held until an item is queued; raise if closed or timed out."""
+        if not self._not_empty.wait_for(lambda: self.queue or self.closed, timeout):
+            raise IndexError("Dequeue from an empty queue.")
+        if not self.queue:
+            raise QueueClosed("Dequeue from a closed queue.")
+
+
 ##################
-# Example usage: # 
+# Example usage: #
 ##################
-my_queue = StandardQueue()
+if __name__ == "__main__":
+    my_queue = StandardQueue()
+
+    print("Enqueue A B C")
+    my_queue.enqueue("A");
+    my_queue.enqueue("B");
+    my_queue.enqueue("C")
+
+
+    print(f"Dequeue: {my_queue.dequeue()}")  # Dequeue: "A"
+    print(f"Empty? {my_queue.is_empty()}")  # Empty False
+
+    my_queue.enqueue_many(["D", "E", "F"])
+    print(f"Dequeue many: {my_queue.dequeue_many(3)}")  # Dequeue many: ['B', 'C', 'D']
 
-print("Enqueue A B C")
-my_queue.enqueue("A"); 
-my_queue.enqueue("B"); 
-my_queue.enqueue("C")
+    # Blocking queue consumed by a worker thread until closed
+    tasks = BlockingQueue()
 
+    def worker():
+        while True:
+            try:
+                batch = tasks.dequeue_many(2)
+            except QueueClosed:
+                break
+            print(f"Worker got: {batch}")
 
-print(f"Dequeue: {my_queue.dequeue()}")  # Dequeue: "A"
-print(f"Empty? {my_queue.is_empty()}")  # Empty False
\ No newline at end of file
+    thread = threading.Thread(target=worker)
+    thread.start()
+    tasks.enqueue_many(range(5))
+    tasks.close()
+    thread.join()
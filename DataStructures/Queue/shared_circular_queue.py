@@ -0,0 +1,200 @@
+import time
+from array import array
+from multiprocessing import shared_memory
+
+try:
+    from .cirular_queue import TypedCircularQueue
+except ImportError:  # Run as a script from this directory
+    from cirular_queue import TypedCircularQueue
+
+HEADER_SIZE = 128  # Head and tail counters, each on its own 64-byte cache line
+HEAD = 0  # Index of the head counter in the header, as 64-bit words
+TAIL = 8  # Index of the tail counter in the header, as 64-bit words
+
+
+class SharedCircularQueue(TypedCircularQueue):
+    """
+    A TypedCircularQueue living in a multiprocessing.shared_memory segment.
+
+    The records and the head/tail indexes all live in the shared segment, so
+    processes exchange fixed-size records with plain memory copies instead of
+    pickling. Head and tail are ever-increasing 64-bit record counters: the
+    consumer only writes the head and the producer only writes the tail,
+    which makes the single-producer/single-consumer case lock-free. Passing a
+    multiprocessing.Lock makes enqueue safe for multiple producers.
+
+    Lock-free publication relies on aligned 64-bit stores being atomic and
+    performed in program order, as they are on x86-64.
+    """
+
+    def __init__(self, capacity, typecode="B", record_size=1, name=None, create=True, lock=None):
+        """
+        Create (or attach to) a shared queue.
+
+        Args:
+            capacity: Number of records the queue can hold.
+            typecode: array/struct typecode of each value.
+            record_size: Number of values in a record.
+            name: Name of the shared memory segment (generated when creating).
+            create: Create a new segment, or attach to an existing one.
+            lock: Optional multiprocessing.Lock shared by multiple producers.
+        """
+        itemsize = array(typecode).itemsize
+        self.shm = shared_memory.SharedMemory(
+            name=name, create=create, size=HEADER_SIZE + capacity * record_size * itemsize
+        )
+        self._header = self.shm.buf[:HEADER_SIZE].cast("Q")
+        self.queue = self.shm.buf[HEADER_SIZE:HEADER_SIZE + capacity * record_size * itemsize].cast(typecode)
+        if create:
+            self._header[HEAD] = 0
+            self._header[TAIL] = 0
+
+        self.typecode = typecode
+        self.record_size = record_size
+        self.capacity = capacity
+        self.overwrite = False  # Only the consumer may move the head
+        self.dropped = 0
+        self.lock = lock
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def front(self):
+        return self._header[HEAD] % self.capacity
+
+    @property
+    def rear(self):
+        return self._header[TAIL] % self.capacity
+
+    @property
+    def size(self):
+        # Each side reads the other side's counter, which can only make the
+        # queue look fuller (to the producer) or emptier (to the consumer)
+        return self._header[TAIL] - self._header[HEAD]
+
+    def enqueue_many(self, data):
+        """Copy whole records into the queue; raises OverflowError if they do not fit."""
+        if self.lock is None:
+            super().enqueue_many(data)
+        else:
+            with self.lock:
+                super().enqueue_many(data)
+
+    def put_many(self, data, timeout=None):
+        """Enqueue records, waiting for free slots; raises OverflowError when the timeout expires."""
+        values = self._as_values(data)
+        count = len(values) // self.record_size
+        if count > self.capacity:
+            raise ValueError("More records than the queue capacity.")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if self.capacity - self.size >= count:
+                try:
+                    self.enqueue_many(values)
+                    return
+                except OverflowError:
+                    pass  # Another producer took the free slots first
+            if deadline is not None and time.monotonic() >= deadline:
+                raise OverflowError("Queue is full.")
+            time.sleep(0)  # Yield to the consumer
+
+    def dequeue(self):
+        """Remove and return the front record, copied out of the shared segment."""
+        if self.is_empty():
+            raise IndexError("Dequeue from an empty queue.")
+        start = self.front * self.record_size
+        if self.record_size == 1:
+            value = self.queue[start]
+        else:
+            value = array(self.typecode, self.queue[start:start + self.record_size])
+        self._advance(1)
+        return value
+
+    def dequeue_many(self, n):
+        """
+        Remove up to n records and return them copied into one array.
+
+        Zero-copy consumers can use peek_many(n) followed by advance(count)
+        instead, reading the views before releasing the slots.
+        """
+        if self.is_empty():
+            raise IndexError("Dequeue from an empty queue.")
+        records = array(self.typecode)
+        for view in self.peek_many(n):
+            records.frombytes(view.cast("B"))
+        self._advance(len(records) // self.record_size)
+        return records
+
+    def get_many(self, n, timeout=None):
+        """Wait until at least one record is available, then dequeue up to n records."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.is_empty():
+            if deadline is not None and time.monotonic() >= deadline:
+                raise IndexError("Dequeue from an empty queue.")
+            time.sleep(0)  # Yield to the producers
+        return self.dequeue_many(n)
+
+    def advance(self, count):
+        """Release count records previously read through peek_many."""
+        self._advance(min(count, self.size))
+
+    def close(self):
+        """Detach this process from the shared segment."""
+        self._header.release()
+        self.queue.release()
+        self.shm.close()
+
+    def unlink(self):
+        """Destroy the shared segment; call once, from the creating process."""
+        self.shm.unlink()
+
+    def _advance(self, count):
+        self._header[HEAD] += count  # Only the consumer writes the head
+
+    def _publish(self, count):
+        self._header[TAIL] += count  # The records are in place: publish them
+
+    def __reduce__(self):
+        # Processes receive a handle that re-attaches to the same segment
+        return (_attach, (self.capacity, self.typecode, self.record_size, self.name, self.lock))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _attach(capacity, typecode, record_size, name, lock):
+    return SharedCircularQueue(capacity, typecode, record_size, name=name, create=False, lock=lock)
+
+
+##################
+# Example usage: #
+##################
+if __name__ == "__main__":
+    from multiprocessing import Process
+
+    def producer(queue, start):
+        # Each record is 4 int64 values; 1000 records are written in batches of 100
+        for first in range(start, start + 1000, 100):
+            queue.put_many(array("q", range(first * 4, (first + 100) * 4)))
+        queue.close()
+
+    with SharedCircularQueue(256, typecode="q", record_size=4) as queue:
+        process = Process(target=producer, args=(queue, 0))
+        process.start()
+
+        received = 0
+        checksum = 0
+        while received < 1000:
+            records = queue.get_many(128)
+            received += len(records) // 4
+            checksum += sum(records)
+        process.join()
+
+        print(f"Received: {received}")  # Received: 1000
+        print(f"Checksum: {checksum == sum(range(4000))}")  # Checksum: True
+        queue.unlink()
@@ -0,0 +1,138 @@
+import importlib.util
+import os
+import sys
+import threading
+import time
+from array import array
+
+# The queue.py of this directory shadows the standard library module that
+# multiprocessing.Queue needs: import multiprocessing before the script
+# directory is searched, then load StandardQueue from its file.
+_script_dir = sys.path.pop(0)
+import multiprocessing
+import multiprocessing.queues
+sys.path.insert(0, _script_dir)
+
+from shared_circular_queue import SharedCircularQueue
+
+_spec = importlib.util.spec_from_file_location("standard_queue", os.path.join(_script_dir, "queue.py"))
+_standard_queue = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_standard_queue)
+StandardQueue = _standard_queue.StandardQueue
+
+RECORD_SIZE = 8  # int64 values per record, 64 bytes
+BATCH = 256  # Records per batch
+
+
+def make_batch():
+    """One batch of records, built once so the benchmark measures the transport only."""
+    return array("q", range(BATCH * RECORD_SIZE))
+
+
+def make_records():
+    batch = make_batch()
+    return [tuple(batch[index * RECORD_SIZE:(index + 1) * RECORD_SIZE]) for index in range(BATCH)]
+
+
+def shared_producer(queue, records):
+    batch = make_batch()
+    for _ in range(0, records, BATCH):
+        queue.put_many(batch)
+    queue.close()
+
+
+def run_shared(records, producers):
+    lock = multiprocessing.Lock() if producers > 1 else None
+    queue = SharedCircularQueue(16 * BATCH, typecode="q", record_size=RECORD_SIZE, lock=lock)
+    per_producer = records // producers
+    processes = [multiprocessing.Process(target=shared_producer, args=(queue, per_producer))
+                 for _ in range(producers)]
+    start = time.perf_counter()
+    for process in processes:
+        process.start()
+    received = 0
+    while received < per_producer * producers:
+        received += len(queue.get_many(BATCH)) // RECORD_SIZE
+    elapsed = time.perf_counter() - start
+    for process in processes:
+        process.join()
+    queue.close()
+    queue.unlink()
+    return received / elapsed
+
+
+def mp_queue_producer(queue, records, batched):
+    batch = make_batch()
+    batch_records = make_records()
+    for _ in range(0, records, BATCH):
+        if batched:
+            queue.put(batch.tobytes())
+        else:
+            for record in batch_records:
+                queue.put(record)
+
+
+def run_mp_queue(records, producers, batched):
+    queue = multiprocessing.Queue(maxsize=16 if batched else 16 * BATCH)
+    per_producer = records // producers
+    processes = [multiprocessing.Process(target=mp_queue_producer, args=(queue, per_producer, batched))
+                 for _ in range(producers)]
+    start = time.perf_counter()
+    for process in processes:
+        process.start()
+    received = 0
+    while received < per_producer * producers:
+        queue.get()
+        received += BATCH if batched else 1
+    elapsed = time.perf_counter() - start
+    for process in processes:
+        process.join()
+    return received / elapsed
+
+
+def run_standard_queue(records, producers):
+    """In-process baseline: StandardQueue guarded by a lock, fed by producer threads."""
+    queue = StandardQueue()
+    lock = threading.Lock()
+    per_producer = records // producers
+
+    def produce():
+        batch_records = make_records()
+        for _ in range(0, per_producer, BATCH):
+            for record in batch_records:
+                with lock:
+                    queue.enqueue(record)
+
+    threads = [threading.Thread(target=produce) for _ in range(producers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    received = 0
+    while received < per_producer * producers:
+        with lock:
+            if queue.is_empty():
+                continue
+            queue.dequeue()
+        received += 1
+    elapsed = time.perf_counter() - start
+    for thread in threads:
+        thread.join()
+    return received / elapsed
+
+
+#############
+# Benchmark #
+#############
+if __name__ == "__main__":
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    records -= records % (BATCH * 4)
+    print(f"{records} records of {RECORD_SIZE * 8} bytes (records/sec)")
+    print(f"{'producers':>9} {'shared ring':>12} {'mp.Queue':>12} {'mp.Queue batch':>15} {'StandardQueue+lock':>19}")
+    for producers in (1, 2, 4):
+        results = [
+            run_shared(records, producers),
+            run_mp_queue(records, producers, batched=False),
+            run_mp_queue(records, producers, batched=True),
+            run_standard_queue(records, producers),
+        ]
+        print(f"{producers:>9} {results[0]:>12,.0f} {results[1]:>12,.0f} {results[2]:>15,.0f} {results[3]:>19,.0f}")
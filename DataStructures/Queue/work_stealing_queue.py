@@ -0,0 +1,110 @@
+from collections import deque
+from itertools import count
+import threading
+
+
+class WorkStealingQueues:
+    """
+    A set of task deques, one per worker, with work stealing.
+
+    Each worker pushes and pops at the back of its own deque (newest first,
+    which keeps related tasks hot in cache), and only when it runs dry steals
+    from the front of another worker's deque (oldest first). Owners and
+    thieves work at opposite ends, and deque append/pop/popleft are atomic,
+    so no lock is shared between workers: contention only happens while
+    stealing, instead of on every task as with one shared queue.
+    """
+
+    def __init__(self, num_workers):
+        """Initialize one empty deque per worker."""
+        self.deques = [deque() for _ in range(num_workers)]
+        self.num_workers = num_workers
+        self.closed = False
+        self._next_worker = count()  # Round-robin target of submit()
+
+    def submit(self, item):
+        """Add a task from outside the pool, spreading tasks round-robin."""
+        self.deques[next(self._next_worker) % self.num_workers].append(item)
+
+    def submit_many(self, items):
+        """Spread a batch of tasks evenly, with one extend per deque."""
+        items = list(items)
+        start = next(self._next_worker)
+        for offset in range(self.num_workers):
+            worker = (start + offset) % self.num_workers
+            self.deques[worker].extend(items[offset::self.num_workers])
+
+    def push(self, worker, item):
+        """Add a task to the back of the worker's own deque."""
+        self.deques[worker].append(item)
+
+    def pop(self, worker):
+        """
+        Return the worker's newest task, or steal one when its deque is empty.
+
+        Raises IndexError when every deque is empty.
+        """
+        try:
+            return self.deques[worker].pop()
+        except IndexError:
+            return self.steal(worker)
+
+    def steal(self, worker):
+        """
+        Take the oldest tasks of the first non-empty victim, trying each in turn.
+
+        Half of the victim's tasks move to the thief's deque at once, so a
+        worker that ran dry does not have to come back stealing for every task.
+        Raises IndexError when there is nothing to steal.
+        """
+        own = self.deques[worker]
+        for offset in range(1, self.num_workers):
+            victim = self.deques[(worker + offset) % self.num_workers]
+            try:
+                item = victim.popleft()
+            except IndexError:
+                continue
+            for _ in range(len(victim) // 2):
+                try:
+                    own.append(victim.popleft())
+                except IndexError:
+                    break  # The owner or another thief emptied it meanwhile
+            return item
+        raise IndexError("Steal from empty queues.")
+
+    def close(self):
+        """Signal the workers that no more tasks will be submitted."""
+        self.closed = True
+
+    def __len__(self):
+        return sum(len(tasks) for tasks in self.deques)
+
+
+##################
+# Example usage: #
+##################
+if __name__ == "__main__":
+    import time
+
+    pool = WorkStealingQueues(num_workers=2)
+    done = [[] for _ in range(2)]
+
+    def worker(worker_id):
+        while True:
+            try:
+                task = pool.pop(worker_id)
+            except IndexError:
+                if pool.closed and not len(pool):
+                    break
+                time.sleep(0)  # Nothing to run or steal yet
+                continue
+            done[worker_id].append(task)
+
+    pool.submit_many(range(10))
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    pool.close()
+    for thread in threads:
+        thread.join()
+    print(f"Tasks run: {sorted(done[0] + done[1])}")  # Tasks run: [0, 1, ..., 9]
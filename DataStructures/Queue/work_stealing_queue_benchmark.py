@@ -0,0 +1,108 @@
+import sys
+import threading
+import time
+
+from queue import BlockingQueue, QueueClosed, StandardQueue
+from work_stealing_queue import WorkStealingQueues
+
+BATCH = 64
+
+
+def dispatch(num_workers, worker_loop, submit):
+    """Run the workers while the main thread submits; return tasks dispatched per second."""
+    threads = [threading.Thread(target=worker_loop, args=(i,)) for i in range(num_workers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    submit()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def run_locked_standard_queue(tasks, num_workers):
+    queue = StandardQueue()
+    lock = threading.Lock()
+    done = threading.Event()
+
+    def worker_loop(_):
+        while True:
+            with lock:
+                empty = queue.is_empty()
+                if not empty:
+                    queue.dequeue()
+            if empty:
+                if done.is_set():
+                    return
+                time.sleep(0)
+
+    def submit():
+        for task in range(tasks):
+            with lock:
+                queue.enqueue(task)
+        done.set()
+
+    return tasks / dispatch(num_workers, worker_loop, submit)
+
+
+def run_blocking_queue(tasks, num_workers, batched):
+    queue = BlockingQueue()
+
+    def worker_loop(_):
+        while True:
+            try:
+                if batched:
+                    queue.dequeue_many(BATCH)
+                else:
+                    queue.dequeue()
+            except QueueClosed:
+                return
+
+    def submit():
+        if batched:
+            for start in range(0, tasks, BATCH):
+                queue.enqueue_many(range(start, min(start + BATCH, tasks)))
+        else:
+            for task in range(tasks):
+                queue.enqueue(task)
+        queue.close()
+
+    return tasks / dispatch(num_workers, worker_loop, submit)
+
+
+def run_work_stealing(tasks, num_workers):
+    pool = WorkStealingQueues(num_workers)
+
+    def worker_loop(worker_id):
+        pop = pool.pop
+        while True:
+            try:
+                pop(worker_id)
+            except IndexError:
+                if pool.closed and not len(pool):
+                    return
+                time.sleep(0)
+
+    def submit():
+        for start in range(0, tasks, BATCH):
+            pool.submit_many(range(start, min(start + BATCH, tasks)))
+        pool.close()
+
+    return tasks / dispatch(num_workers, worker_loop, submit)
+
+
+#############
+# Benchmark #
+#############
+if __name__ == "__main__":
+    tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"{tasks} tasks (tasks/sec)")
+    print(f"{'threads':>7} {'StandardQueue+lock':>19} {'BlockingQueue':>14} {'batched':>10} {'work stealing':>14}")
+    for num_workers in (1, 2, 4, 8, 16, 32):
+        results = [
+            run_locked_standard_queue(tasks, num_workers),
+            run_blocking_queue(tasks, num_workers, batched=False),
+            run_blocking_queue(tasks, num_workers, batched=True),
+            run_work_stealing(tasks, num_workers),
+        ]
+        print(f"{num_workers:>7} {results[0]:>19,.0f} {results[1]:>14,.0f} {results[2]:>10,.0f} {results[3]:>14,.0f}")
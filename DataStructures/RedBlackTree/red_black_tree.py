@@ -1,17 +1,28 @@
+from collections import Counter
+
+
 class Node:
     """
     Represents a node in the Red-Black Tree.
-    Each node has a key, a color (either "red" or "black"), and pointers to its
-    left child, right child, and parent.
+    Each node has a key, the value mapped to it, a color (either "red" or "black"),
+    and pointers to its left child, right child, and parent.
     """
-    def __init__(self, key, color="red"):
-        self.key = key  # The value stored in the node
+    __slots__ = ("key", "value", "color", "left", "right", "parent")
+
+    def __init__(self, key, color="red", value=None):
+        self.key = key  # The key of the node, which orders the tree
+        self.value = value  # The value mapped to the key
         self.color = color  # The color of the node ("red" or "black")
         self.left = None  # Pointer to the left child
         self.right = None  # Pointer to the right child
         self.parent = None  # Pointer to the parent node
 
 
+# Sentinel node representing null leaves; always black. It is shared by all
+# trees, so that split and join can move subtrees between trees.
+TNULL = Node(None, color="black")
+
+
 class RedBlackTree:
     """
     Represents a Red-Black Tree, a type of self-balancing binary search tree.
@@ -20,33 +31,41 @@ class RedBlackTree:
     - The root is always black.
     - Red nodes cannot have red children (no two consecutive red nodes).
     - Every path from a node to its descendant null leaves has the same number of black nodes.
+
+    The tree is an ordered map: each key is stored once, with a value.
     """
 
     def __init__(self):
-        # Sentinel node representing null leaves; always black
-        self.TNULL = Node(None, color="black")
+        self.TNULL = TNULL
         self.root = self.TNULL  # Initially, the tree is empty with only the sentinel node
+        self._size = 0  # None when unknown, after a split
 
-    def insert(self, key):
+    def insert(self, key, value=None):
         """
         Inserts a new node with the given key into the Red-Black Tree.
         Maintains the binary search tree property and fixes Red-Black properties if violated.
+        If the key is already present, only its value is replaced.
         """
-        # Create a new node with the key and default red color
-        new_node = Node(key)
-        new_node.left = self.TNULL  # New nodes' children are initially TNULL
-        new_node.right = self.TNULL
-
         # Perform standard binary search tree insertion
         parent = None
         current = self.root
         while current != self.TNULL:  # Traverse until reaching a TNULL node
             parent = current
+            if key == current.key:  # Existing key: update the mapping
+                current.value = value
+                return
             if key < current.key:  # Traverse left for smaller keys
                 current = current.left
             else:  # Traverse right for larger keys
                 current = current.right
 
+        # Create a new node with the key and default red color
+        new_node = Node(key, value=value)
+        new_node.left = self.TNULL  # New nodes' children are initially TNULL
+        new_node.right = self.TNULL
+        if self._size is not None:
+            self._size += 1
+
         # Set the parent of the new node and insert it
         new_node.parent = parent
         if not parent:  # If the tree was empty, set the new node as the root
@@ -59,10 +78,159 @@ class RedBlackTree:
         # Restore Red-Black Tree properties after insertion
         self._fix_insert(new_node)
 
+    def delete(self, key):
+        """
+        Removes the node with the given key and returns its value.
+        Restores the Red-Black properties with _fix_delete; raises KeyError if the key is missing.
+        """
+        node = self._find(key)
+        if node is self.TNULL:
+            raise KeyError(key)
+
+        removed_color = node.color
+        if node.left is self.TNULL:  # At most one child: splice the node out
+            replacement = node.right
+            self._transplant(node, node.right)
+        elif node.right is self.TNULL:
+            replacement = node.left
+            self._transplant(node, node.left)
+        else:
+            # Two children: the successor (minimum of the right subtree) takes the node's place
+            successor = self._minimum(node.right)
+            removed_color = successor.color
+            replacement = successor.right
+            if successor.parent is node:
+                replacement.parent = successor  # Needed when replacement is TNULL
+            else:
+                self._transplant(successor, successor.right)
+                successor.right = node.right
+                successor.right.parent = successor
+            self._transplant(node, successor)
+            successor.left = node.left
+            successor.left.parent = successor
+            successor.color = node.color
+
+        if removed_color == "black":  # Removing a black node shortens some paths
+            self._fix_delete(replacement)
+        self.TNULL.parent = None
+        node.left = node.right = node.parent = None
+        if self._size is not None:
+            self._size -= 1
+        return node.value
+
+    def get(self, key, default=None):
+        """Returns the value mapped to key, or default if the key is missing."""
+        node = self._find(key)
+        return default if node is self.TNULL else node.value
+
+    def floor(self, key):
+        """Returns the largest key <= key, or None."""
+        return self._closest(key, lambda node_key: node_key <= key, prefer_larger=True)
+
+    def ceiling(self, key):
+        """Returns the smallest key >= key, or None."""
+        return self._closest(key, lambda node_key: node_key >= key, prefer_larger=False)
+
+    def successor(self, key):
+        """Returns the smallest key > key, or None."""
+        return self._closest(key, lambda node_key: node_key > key, prefer_larger=False)
+
+    def predecessor(self, key):
+        """Returns the largest key < key, or None."""
+        return self._closest(key, lambda node_key: node_key < key, prefer_larger=True)
+
+    def items(self, low=None, high=None):
+        """
+        Lazily yields the (key, value) pairs with low <= key < high, in key order.
+        Either bound may be None for an open range; subtrees outside the range are skipped.
+        """
+        stack = []
+        node = self.root
+        while stack or node is not self.TNULL:
+            while node is not self.TNULL:
+                if low is not None and node.key < low:
+                    node = node.right  # The whole left subtree is below the range
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if high is not None and node.key >= high:
+                return
+            yield node.key, node.value
+            node = node.right
+
+    def range(self, low=None, high=None):
+        """Lazily yields the keys with low <= key < high, in order."""
+        for key, _ in self.items(low, high):
+            yield key
+
+    def split(self, key):
+        """
+        Moves every key >= key into a new tree, which is returned; this tree keeps the smaller keys.
+        Runs in O(log n): the nodes on the search path are rejoined, other subtrees are reused as is.
+        Nodes do not store subtree sizes, so the size of both trees becomes unknown: the next len()
+        of each one counts its keys, in O(n), and insert and delete keep that count up to date.
+        """
+        left, left_height, right, right_height = self._split(self.root, self._black_height(), key)
+        self._set_root(left)
+        tail = RedBlackTree()
+        tail._set_root(right)
+        self._size = tail._size = None  # Counted again by __len__ when needed
+        return tail
+
+    def join(self, other):
+        """
+        Moves every key of other, which must all be greater than the keys of this tree, into this tree.
+        Runs in O(log n) and leaves other empty. If either tree was split since its last len(),
+        the size of the result is unknown and the next len() counts its keys in O(n), as after split.
+        """
+        if other.root is self.TNULL:
+            return
+        if self.root is not self.TNULL and self._maximum(self.root).key >= self._minimum(other.root).key:
+            raise ValueError("The keys of the joined tree must be greater than the keys of this tree.")
+
+        # The smallest node of other becomes the pivot between the two trees
+        size = None if self._size is None or other._size is None else self._size + other._size
+        pivot_key = self._minimum(other.root).key
+        pivot_value = other.delete(pivot_key)
+        pivot = Node(pivot_key, value=pivot_value)
+        root, _ = self._join(self.root, self._black_height(), pivot, other.root, other._black_height())
+        self._set_root(root)
+        self._size = size
+        other.root = other.TNULL
+        other._size = 0
+
+    def __setitem__(self, key, value):
+        self.insert(key, value)
+
+    def __getitem__(self, key):
+        node = self._find(key)
+        if node is self.TNULL:
+            raise KeyError(key)
+        return node.value
+
+    def __delitem__(self, key):
+        self.delete(key)
+
+    def __contains__(self, key):
+        return self._find(key) is not self.TNULL
+
+    def __len__(self):
+        """O(1), except for the first call after a split, which counts the keys in O(n)."""
+        if self._size is None:
+            self._size = sum(1 for _ in self.items())
+        return self._size
+
+    def __iter__(self):
+        return self.range()
+
     def _fix_insert(self, node):
         """
         Fixes violations of Red-Black Tree properties caused by insertion.
         Ensures the tree remains balanced and adheres to the Red-Black rules.
+        Returns True if the black height of the tree grew by one.
         """
         while node != self.root and node.parent.color == "red":
             if node.parent == node.parent.parent.left:  # Parent is the left child
@@ -95,8 +263,10 @@ class RedBlackTree:
                     node.parent.parent.color = "red"
                     self._rotate_left(node.parent.parent)  # Perform left rotation
 
-        # Ensure the root is always black
+        # Ensure the root is always black; blackening a red root adds one to the black height
+        grew = self.root.color == "red"
         self.root.color = "black"
+        return grew
 
     def _rotate_left(self, node):
         """
@@ -135,3 +305,217 @@ class RedBlackTree:
             node.parent.left = left_child
         left_child.right = node
         node.parent = left_child
+
+    def _find(self, key):
+        """Returns the node holding key, or TNULL."""
+        node = self.root
+        while node is not self.TNULL and key != node.key:
+            node = node.left if key < node.key else node.right
+        return node
+
+    def _closest(self, key, accept, prefer_larger):
+        """
+        Returns the best key accepted by the predicate during one descent from the root:
+        the largest accepted key if prefer_larger, else the smallest.
+        """
+        best = None
+        node = self.root
+        while node is not self.TNULL:
+            if accept(node.key):
+                best = node.key
+                # Look for a closer accepted key on the other side
+                node = node.right if prefer_larger else node.left
+            else:
+                node = node.left if prefer_larger else node.right
+        return best
+
+    def _minimum(self, node):
+        while node.left is not self.TNULL:
+            node = node.left
+        return node
+
+    def _maximum(self, node):
+        while node.right is not self.TNULL:
+            node = node.right
+        return node
+
+    def _transplant(self, old, new):
+        """Replaces the subtree rooted at old with the subtree rooted at new."""
+        if not old.parent:
+            self.root = new
+        elif old is old.parent.left:
+            old.parent.left = new
+        else:
+            old.parent.right = new
+        new.parent = old.parent
+
+    def _fix_delete(self, node):
+        """
+        Fixes violations of Red-Black Tree properties caused by deletion.
+        node carries an extra black, which is pushed up the tree until it can be absorbed.
+        """
+        while node is not self.root and node.color == "black":
+            if node is node.parent.left:
+                sibling = node.parent.right
+                if sibling.color == "red":  # Case 1: Sibling is red
+                    sibling.color = "black"
+                    node.parent.color = "red"
+                    self._rotate_left(node.parent)
+                    sibling = node.parent.right
+                if sibling.left.color == "black" and sibling.right.color == "black":
+                    sibling.color = "red"  # Case 2: Sibling and its children are black
+                    node = node.parent  # Move the extra black up the tree
+                else:
+                    if sibling.right.color == "black":  # Case 3: Sibling's far child is black
+                        sibling.left.color = "black"
+                        sibling.color = "red"
+                        self._rotate_right(sibling)
+                        sibling = node.parent.right
+                    # Case 4: Sibling's far child is red
+                    sibling.color = node.parent.color
+                    node.parent.color = "black"
+                    sibling.right.color = "black"
+                    self._rotate_left(node.parent)
+                    node = self.root
+            else:  # Node is the right child (mirror cases)
+                sibling = node.parent.left
+                if sibling.color == "red":
+                    sibling.color = "black"
+                    node.parent.color = "red"
+                    self._rotate_right(node.parent)
+                    sibling = node.parent.left
+                if sibling.left.color == "black" and sibling.right.color == "black":
+                    sibling.color = "red"
+                    node = node.parent
+                else:
+                    if sibling.left.color == "black":
+                        sibling.right.color = "black"
+                        sibling.color = "red"
+                        self._rotate_left(sibling)
+                        sibling = node.parent.left
+                    sibling.color = node.parent.color
+                    node.parent.color = "black"
+                    sibling.left.color = "black"
+                    self._rotate_right(node.parent)
+                    node = self.root
+        node.color = "black"
+
+    def _black_height(self):
+        """Counts the black nodes on the path from the root to the leftmost leaf."""
+        height = 0
+        node = self.root
+        while node is not self.TNULL:
+            if node.color == "black":
+                height += 1
+            node = node.left
+        return height
+
+    def _set_root(self, node):
+        self.root = node
+        if node is not self.TNULL:
+            node.parent = None
+            node.color = "black"
+
+    def _split(self, node, height, key):
+        """
+        Splits the subtree rooted at node, of black height height, into (left, left height,
+        right, right height) with the keys < key on the left. Recurses along one search path.
+        """
+        if node is self.TNULL:
+            return self.TNULL, 0, self.TNULL, 0
+        child_height = height - (node.color == "black")
+        left_child, right_child = node.left, node.right
+        node.left = node.right = self.TNULL
+        if key <= node.key:
+            left, left_height, right, right_height = self._split(left_child, child_height, key)
+            right, right_height = self._join(right, right_height, node, right_child, child_height)
+        else:
+            left, left_height, right, right_height = self._split(right_child, child_height, key)
+            left, left_height = self._join(left_child, child_height, node, left, left_height)
+        return left, left_height, right, right_height
+
+    def _join(self, left, left_height, pivot, right, right_height):
+        """
+        Joins two subtrees and a pivot node whose key lies between them, in O(|left_height - right_height| + 1).
+        The pivot is linked where the taller subtree's spine reaches the other subtree's black height,
+        then the red pivot is fixed up like an inserted node. Returns (root, black height).
+        """
+        # Detached subtrees must have black roots
+        if left is not self.TNULL and left.color == "red":
+            left.color = "black"
+            left_height += 1
+        if right is not self.TNULL and right.color == "red":
+            right.color = "black"
+            right_height += 1
+        left.parent = right.parent = None
+
+        if left_height == right_height:
+            pivot.left, pivot.right, pivot.parent = left, right, None
+            pivot.color = "black"
+            if left is not self.TNULL:
+                left.parent = pivot
+            if right is not self.TNULL:
+                right.parent = pivot
+            return pivot, left_height + 1
+
+        taller_is_left = left_height > right_height
+        tree = RedBlackTree()
+        tree.root = left if taller_is_left else right
+        height = left_height if taller_is_left else right_height
+        target = right_height if taller_is_left else left_height
+
+        # Walk down the inner spine to the first black node with the shorter subtree's black height
+        parent = None
+        node = tree.root
+        while not (node.color == "black" and height == target):
+            height -= node.color == "black"
+            parent = node
+            node = node.right if taller_is_left else node.left
+
+        pivot.color = "red"
+        pivot.parent = parent
+        if taller_is_left:
+            pivot.left, pivot.right = node, right
+            parent.right = pivot
+        else:
+            pivot.left, pivot.right = left, node
+            parent.left = pivot
+        for child in (pivot.left, pivot.right):
+            if child is not self.TNULL:
+                child.parent = pivot
+
+        grew = tree._fix_insert(pivot)
+        return tree.root, max(left_height, right_height) + grew
+
+
+class CountingRedBlackTree(RedBlackTree):
+    """A RedBlackTree that counts the rotations of its inserts and deletes in counters["rotations"]."""
+
+    def __init__(self):
+        super().__init__()
+        self.counters = Counter()
+
+    def _rotate_left(self, node):
+        self.counters["rotations"] += 1
+        super()._rotate_left(node)
+
+    def _rotate_right(self, node):
+        self.counters["rotations"] += 1
+        super()._rotate_right(node)
+
+
+# Example usage
+if __name__ == "__main__":
+    tree = RedBlackTree()
+    for timestamp in [40, 10, 30, 20, 50, 60]:
+        tree[timestamp] = f"event-{timestamp}"
+
+    print(tree[30])  # Output: event-30
+    print(tree.floor(35), tree.ceiling(35), tree.successor(60))  # Output: 30 40 None
+    print(list(tree.range(20, 50)))  # Output: [20, 30, 40]
+
+    recent = tree.split(40)  # Keys >= 40 move to a new tree
+    print(list(tree), list(recent))  # Output: [10, 20, 30] [40, 50, 60]
+    del tree[20]
+    tree.join(recent)
+    print(list(tree), len(tree))  # Output: [10, 30, 40, 50, 60] 5
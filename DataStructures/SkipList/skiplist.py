@@ -1,4 +1,5 @@
 import random
+from collections import Counter
 
 class Node:
     """Represents a single node in a Skip List."""
@@ -77,15 +78,55 @@ class SkipList:
             while self.level > 0 and self.head.forward[self.level] is None:
                 self.level -= 1
 
+
+class CountingSkipList(SkipList):
+    """A Skip List that counts its operations, levels descended and forward pointers followed in counters."""
+    def __init__(self, max_level, p):
+        super().__init__(max_level, p)
+        self.counters = Counter()
+
+    def count_path(self, key):
+        """Counts the search path to key, the one insert, search and delete all follow."""
+        self.counters["operations"] += 1
+        self.counters["levels"] += self.level + 1
+        current = self.head
+        steps = 0
+        for i in range(self.level, -1, -1):
+            while current.forward[i] and current.forward[i].key < key:
+                current = current.forward[i]
+                steps += 1
+        self.counters["steps"] += steps
+
+    def insert(self, key):
+        self.count_path(key)
+        super().insert(key)
+
+    def search(self, key):
+        self.count_path(key)
+        return super().search(key)
+
+    def delete(self, key):
+        self.count_path(key)
+        super().delete(key)
+
 ##################
 # Example usage: # 
 ##################
-
-skiplist = SkipList(max_level=4, p=0.5)
-for num in [1, 3, 7, 8, 10]:
-    skiplist.insert(num)
-
-print(skiplist.search(8))  # Output: True
-print(skiplist.search(5))  # Output: False
-skiplist.delete(8)
-print(skiplist.search(8))  # Output: False
\ No newline at end of file
+if __name__ == "__main__":
+    skiplist = SkipList(max_level=4, p=0.5)
+    for num in [1, 3, 7, 8, 10]:
+        skiplist.insert(num)
+
+    print(skiplist.search(8))  # Output: True
+    print(skiplist.search(5))  # Output: False
+    skiplist.delete(8)
+    print(skiplist.search(8))  # Output: False
+
+    # Search path lengths, for benchmarks
+    random.seed(1)  # Levels are random
+    counting = CountingSkipList(max_level=4, p=0.5)
+    for num in range(16):
+        counting.insert(num)
+    counting.counters.clear()
+    counting.search(11)
+    print(counting.counters)  # Output: Counter({'levels': 5, 'steps': 5, 'operations': 1})
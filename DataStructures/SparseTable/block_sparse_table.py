@@ -0,0 +1,167 @@
+from typing import Callable, Sequence
+from array import array
+
+BLOCK_SIZE = 64  # One in-block mask per element must fit in an unsigned 64-bit word
+
+
+class BlockSparseTable:
+    def __init__(self, arr: Sequence[int], func: Callable[[int, int], int] = min):
+        """
+        Initialize a block-decomposed Sparse Table (linear memory RMQ).
+
+        The array is split into blocks of BLOCK_SIZE elements. A classic sparse
+        table is built over the block minima only, while queries inside a block
+        are answered in O(1) with one bitmask per element describing the
+        monotonic stack of that block.
+
+        Args:
+            arr: Input array (kept by reference, never copied; an array.array
+                 or any indexable sequence works)
+            func: min or max
+        """
+        if func is not min and func is not max:
+            raise ValueError("BlockSparseTable only supports min and max.")
+
+        self.arr = arr
+        self.n = len(arr)
+        self.func = func
+        self._is_min = func is min
+
+        # Index typecode: 32-bit when possible, to halve the table memory
+        index_code = "I" if self.n < 2 ** 32 else "Q"
+
+        # In-block masks: bit k of masks[i] is set when position (block start + k)
+        # is on the monotonic stack after processing position i
+        self.masks = array("Q", bytes(8 * self.n))
+        self._build_masks()
+
+        # Sparse table over block minima, stored as flat typed arrays of indexes
+        self.num_blocks = (self.n + BLOCK_SIZE - 1) // BLOCK_SIZE
+        level = array(index_code, bytes(array(index_code).itemsize * self.num_blocks))
+        for block in range(self.num_blocks):
+            start = block * BLOCK_SIZE
+            end = min(start + BLOCK_SIZE, self.n) - 1
+            level[block] = self._in_block_index(start, end)
+        self.table = [level]
+
+        j = 1
+        while (1 << j) <= self.num_blocks:
+            prev = self.table[j - 1]
+            half = 1 << (j - 1)
+            level = array(index_code, prev[:self.num_blocks - (1 << j) + 1])
+            for i in range(len(level)):
+                level[i] = self._better(prev[i], prev[i + half])
+            self.table.append(level)
+            j += 1
+
+    def _build_masks(self) -> None:
+        """Fill the per-element stack masks, one block at a time."""
+        arr = self.arr
+        masks = self.masks
+        is_min = self._is_min
+        for start in range(0, self.n, BLOCK_SIZE):
+            end = min(start + BLOCK_SIZE, self.n)
+            current = 0
+            for i in range(start, end):
+                value = arr[i]
+                # Pop every stacked position that can no longer be an answer
+                while current:
+                    top = current.bit_length() - 1
+                    top_value = arr[start + top]
+                    if (top_value > value) if is_min else (top_value < value):
+                        current ^= 1 << top
+                    else:
+                        break
+                current |= 1 << (i - start)
+                masks[i] = current
+
+    def _better(self, i: int, j: int) -> int:
+        """Return whichever of the two indexes holds the better value (leftmost on ties)."""
+        if self._is_min:
+            return j if self.arr[j] < self.arr[i] else i
+        return j if self.arr[j] > self.arr[i] else i
+
+    def _in_block_index(self, left: int, right: int) -> int:
+        """Index of the answer for [left, right] when both lie in the same block."""
+        start = left - left % BLOCK_SIZE
+        mask = self.masks[right] >> (left - start)
+        # The lowest surviving stack position at or after left is the answer
+        return left + (mask & -mask).bit_length() - 1
+
+    def query_index(self, left: int, right: int) -> int:
+        """
+        Query the position of the answer in the range [left, right] inclusive.
+
+        Args:
+            left: Left boundary of range
+            right: Right boundary of range
+
+        Returns:
+            Index of the min (or max) element of the range
+        """
+        if left < 0 or right >= self.n or left > right:
+            raise IndexError("Query range out of bounds.")
+
+        left_block = left // BLOCK_SIZE
+        right_block = right // BLOCK_SIZE
+        if left_block == right_block:
+            return self._in_block_index(left, right)
+
+        # Partial blocks at both ends
+        best = self._better(
+            self._in_block_index(left, (left_block + 1) * BLOCK_SIZE - 1),
+            self._in_block_index(right_block * BLOCK_SIZE, right)
+        )
+
+        # Whole blocks in between, answered by two overlapping sparse table ranges
+        if left_block + 1 < right_block:
+            lo = left_block + 1
+            hi = right_block - 1
+            j = (hi - lo + 1).bit_length() - 1
+            level = self.table[j]
+            best = self._better(best, self._better(level[lo], level[hi - (1 << j) + 1]))
+        return best
+
+    def query(self, left: int, right: int) -> int:
+        """
+        Query the range [left, right] inclusive.
+
+        Args:
+            left: Left boundary of range
+            right: Right boundary of range
+
+        Returns:
+            Result of applying func on the range
+        """
+        return self.arr[self.query_index(left, right)]
+
+    def memory_usage(self) -> int:
+        """Return the bytes used by the auxiliary typed arrays (the input array excluded)."""
+        total = self.masks.itemsize * len(self.masks)
+        for level in self.table:
+            total += level.itemsize * len(level)
+        return total
+
+
+#################
+# Example Usage #
+#################
+if __name__ == "__main__":
+    # Sample Array
+    arr = array("q", [4, 2, 7, 1, 8, 5, 3, 6])
+
+    # Test a Block Sparse Table with the min function
+    block_table_min = BlockSparseTable(arr, min)
+
+    print("Block Sparse Table Min")
+    print(block_table_min.query(2, 5))  # 1
+    print(block_table_min.query(1, 3))  # 1
+    print(block_table_min.query(4, 6))  # 3
+
+    # Test a Block Sparse Table with the max function
+    block_table_max = BlockSparseTable(arr, max)
+
+    print("\nBlock Sparse Table Max")
+    print(block_table_max.query(0, 5))  # 8
+    print(block_table_max.query(1, 3))  # 7
+    print(block_table_max.query(4, 6))  # 8
@@ -55,26 +55,26 @@ class SparseTable:
             self.table[right - (2 ** j) + 1][j]
         )
         
-#################    
+#################
 # Example Usage #
 #################
+if __name__ == "__main__":
+    # Sample Array
+    arr = [4, 2, 7, 1, 8, 5, 3, 6]
 
-# Sample Array
-arr = [4, 2, 7, 1, 8, 5, 3, 6]
-
-# Test a Sparse Table with the min function
-sparse_table_min = SparseTable(arr, min)
-print(sparse_table_min.table)
+    # Test a Sparse Table with the min function
+    sparse_table_min = SparseTable(arr, min)
+    print(sparse_table_min.table)
 
-print("Sparse Table Min")
-print(sparse_table_min.query(2, 5)) # 1 
-print(sparse_table_min.query(1, 3)) # 1
-print(sparse_table_min.query(4, 6)) # 3 
+    print("Sparse Table Min")
+    print(sparse_table_min.query(2, 5)) # 1
+    print(sparse_table_min.query(1, 3)) # 1
+    print(sparse_table_min.query(4, 6)) # 3
 
-# Test a Sparse Table with the max function
-sparse_table_max = SparseTable(arr, max)
+    # Test a Sparse Table with the max function
+    sparse_table_max = SparseTable(arr, max)
 
-print("\nSparse Table Max")
-print(sparse_table_max.query(0, 5)) # 8 
-print(sparse_table_max.query(1, 3)) # 7   
-print(sparse_table_max.query(4, 6)) # 8  
\ No newline at end of file
+    print("\nSparse Table Max")
+    print(sparse_table_max.query(0, 5)) # 8
+    print(sparse_table_max.query(1, 3)) # 7
+    print(sparse_table_max.query(4, 6)) # 8
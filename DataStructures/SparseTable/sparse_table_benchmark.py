@@ -0,0 +1,51 @@
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+
+from sparse_table import SparseTable
+from block_sparse_table import BlockSparseTable
+
+
+def measure_build(factory, arr):
+    """Build a table and return it with the build time and the peak memory allocated."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    table = factory(arr)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return table, elapsed, peak
+
+
+def measure_queries(table, queries):
+    """Return the average latency of a query in microseconds."""
+    start = time.perf_counter()
+    for left, right in queries:
+        table.query(left, right)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def run(sizes, num_queries=100_000):
+    print(f"{'n':>10} {'structure':>18} {'build (s)':>10} {'memory (MB)':>12} {'query (us)':>11}")
+    for n in sizes:
+        arr = array("q", (random.randint(0, 1 << 40) for _ in range(n)))
+        queries = []
+        for _ in range(num_queries):
+            left = random.randrange(n)
+            queries.append((left, random.randrange(left, n)))
+
+        for name, factory in (("SparseTable", SparseTable), ("BlockSparseTable", BlockSparseTable)):
+            table, build_time, peak = measure_build(factory, arr)
+            latency = measure_queries(table, queries)
+            print(f"{n:>10} {name:>18} {build_time:>10.2f} {peak / 2 ** 20:>12.1f} {latency:>11.2f}")
+            del table
+
+
+#############
+# Benchmark #
+#############
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    run(sizes)
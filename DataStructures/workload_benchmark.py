@@ -0,0 +1,336 @@
+"""
+Workload-driven benchmark for the maps and sets of DataStructures.
+
+Each run loads n records, then replays a YCSB-style mix of inserts,
+lookups, updates, deletes and range scans whose keys follow a uniform,
+Zipf or sequential distribution. It reports throughput, p50/p99
+latency and the bytes of memory per stored entry. With --count, a second
+untimed run on the instrumented variant of each structure adds the work
+done per operation: rotations, hash probes, skip list levels and steps.
+
+    python workload_benchmark.py --records 100000 --operations 100000
+    python workload_benchmark.py --structures RedBlackTree BTree --workloads A E --distributions zipf
+    python workload_benchmark.py --structures AVLTree RedBlackTree --count --json counts.json
+"""
+import argparse
+import bisect
+import itertools
+import json
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# Each structure lives in its own directory
+_data_structures = os.path.dirname(os.path.abspath(__file__))
+for _directory in ("BinaryTree", "AVLTree", "RedBlackTree", "SkipList", "HashTable", "BTree"):
+    sys.path.append(os.path.join(_data_structures, _directory))
+
+from avl_map import AVLMap, CountingAVLMap
+from b_tree import BTree
+from binary_tree import BinarySearchTree
+from hash_table import CountingHashTable, HashTable
+from red_black_tree import CountingRedBlackTree, RedBlackTree
+from skiplist import CountingSkipList, SkipList
+
+# name: {operation: share of the operations}
+WORKLOADS = {
+    "A": {"read": 0.5, "update": 0.5},  # Update heavy
+    "B": {"read": 0.95, "update": 0.05},  # Read mostly
+    "C": {"read": 1.0},  # Read only
+    "D": {"read": 0.95, "insert": 0.05},  # Read mostly, growing
+    "E": {"scan": 0.95, "insert": 0.05},  # Short range scans
+    "F": {"read": 0.5, "read_modify_write": 0.5},
+    "churn": {"read": 0.4, "insert": 0.3, "delete": 0.3},  # Not in YCSB: deletes
+}
+DISTRIBUTIONS = ("uniform", "zipf", "sequential")
+
+
+def skiplist_scan(skiplist, key, count):
+    """SkipList has no range query: descend to the first key >= key, then follow level 0."""
+    current = skiplist.head
+    for level in range(skiplist.level, -1, -1):
+        while current.forward[level] and current.forward[level].key < key:
+            current = current.forward[level]
+    current = current.forward[0]
+    for _ in range(count):
+        if current is None:
+            return
+        current = current.forward[0]
+
+
+def hash_table_get(table, key):
+    try:
+        return table.get(key)
+    except KeyError:
+        return None
+
+
+def red_black_delete(tree, key):
+    try:
+        tree.delete(key)
+    except KeyError:
+        pass
+
+
+def hash_table_delete(table, key):
+    try:
+        table.delete(key)
+    except KeyError:
+        pass
+
+
+# name: (constructor for a capacity, upsert, lookup, delete, scan of count keys from a key)
+# None marks an operation the structure does not support.
+STRUCTURES = {
+    "BinarySearchTree": (
+        lambda capacity: BinarySearchTree(),
+        lambda tree, key, value: tree.search(key) or tree.insert(key),  # A set: it keeps duplicates
+        lambda tree, key: tree.search(key),
+        None,
+        lambda tree, key, count: list(itertools.islice(tree.range(key, math.inf), count)),
+    ),
+    "AVLTree": (  # Through AVLMap, its map interface
+        lambda capacity: AVLMap(),
+        AVLMap.__setitem__,
+        AVLMap.get,
+        lambda tree, key: tree.pop(key, None),
+        lambda tree, key, count: list(itertools.islice(tree.items(key), count)),
+    ),
+    "RedBlackTree": (
+        lambda capacity: RedBlackTree(),
+        RedBlackTree.insert,
+        RedBlackTree.get,
+        red_black_delete,
+        lambda tree, key, count: list(itertools.islice(tree.items(key), count)),
+    ),
+    "SkipList": (
+        lambda capacity: SkipList(max_level=max(1, int(math.log2(capacity))), p=0.5),
+        lambda skiplist, key, value: skiplist.search(key) or skiplist.insert(key),  # A set: it keeps duplicates
+        lambda skiplist, key: skiplist.search(key),
+        lambda skiplist, key: skiplist.delete(key),
+        skiplist_scan,
+    ),
+    "HashTable": (
+        lambda capacity: HashTable(size=2 * capacity),  # Fixed size: keep the load factor at most 0.5
+        lambda table, key, value: table.insert(key, value),
+        hash_table_get,
+        hash_table_delete,
+        None,
+    ),
+    "BTree": (
+        lambda capacity: BTree(order=64),
+        BTree.__setitem__,
+        BTree.get,
+        lambda tree, key: tree.pop(key, None),
+        lambda tree, key, count: list(itertools.islice(tree.items(key), count)),
+    ),
+    "dict": (  # Reference: Python's built-in hash map
+        lambda capacity: {},
+        dict.__setitem__,
+        dict.get,
+        lambda table, key: table.pop(key, None),
+        None,
+    ),
+}
+
+# name: constructor of the instrumented variant, whose counters attribute counts its work.
+# The operations of STRUCTURES look their methods up on the instance, so they reach the overrides.
+COUNTING = {
+    "AVLTree": lambda capacity: CountingAVLMap(),
+    "RedBlackTree": lambda capacity: CountingRedBlackTree(),
+    "SkipList": lambda capacity: CountingSkipList(max_level=max(1, int(math.log2(capacity))), p=0.5),
+    "HashTable": lambda capacity: CountingHashTable(size=2 * capacity),
+}
+
+
+class KeyChooser:
+    """
+    Picks the keys of the operations. The n loaded keys are the even numbers
+    below 2n; inserts add new keys, odd ones, or increasing ones past 2n for
+    the sequential distribution.
+    """
+
+    def __init__(self, distribution, n, rng):
+        self.distribution = distribution
+        self.n = n
+        self.rng = rng
+        self.position = 0  # Next key of the sequential distribution
+        self.inserted = 0
+        if distribution == "zipf":
+            # Rank k is drawn with probability proportional to 1 / (k + 1) ** 0.99, as in YCSB;
+            # ranks map to loaded keys through a permutation so that hot keys are spread out
+            self.cumulative = list(itertools.accumulate(1 / (k + 1) ** 0.99 for k in range(n)))
+            self.permutation = list(range(0, 2 * n, 2))
+            rng.shuffle(self.permutation)
+        if distribution != "sequential":
+            self.new_keys = list(range(1, 2 * n, 2))
+            rng.shuffle(self.new_keys)
+
+    def load_order(self):
+        keys = list(range(0, 2 * self.n, 2))
+        if self.distribution != "sequential":
+            self.rng.shuffle(keys)
+        return keys
+
+    def existing(self):
+        if self.distribution == "uniform":
+            return 2 * self.rng.randrange(self.n)
+        if self.distribution == "zipf":
+            rank = bisect.bisect_left(self.cumulative, self.rng.random() * self.cumulative[-1])
+            return self.permutation[min(rank, self.n - 1)]
+        key = 2 * (self.position % self.n)
+        self.position += 1
+        return key
+
+    def new(self):
+        self.inserted += 1
+        if self.distribution == "sequential" or self.inserted > len(self.new_keys):
+            return 2 * self.n + self.inserted
+        return self.new_keys[self.inserted - 1]
+
+
+def make_operations(workload, distribution, n, count, seed):
+    """Returns the load order and the (operation, key) pairs of a run, the same for every structure."""
+    rng = random.Random(f"{seed}-{workload}-{distribution}")
+    chooser = KeyChooser(distribution, n, rng)
+    names = list(WORKLOADS[workload])
+    cumulative = list(itertools.accumulate(WORKLOADS[workload].values()))
+    operations = []
+    for _ in range(count):
+        name = names[min(bisect.bisect_left(cumulative, rng.random()), len(names) - 1)]
+        operations.append((name, chooser.new() if name == "insert" else chooser.existing()))
+    return chooser.load_order(), operations
+
+
+def run(structure, load_keys, operations, args):
+    """Loads the keys, then times every operation. Returns a result record."""
+    constructor, upsert, lookup, delete, scan = STRUCTURES[structure]
+    needed = {name for name, _ in operations}
+    missing = [name for name, function in (("delete", delete), ("scan", scan)) if name in needed and function is None]
+    if missing:
+        return {"status": f"no {', '.join(missing)}"}
+
+    capacity = len(load_keys) + len(operations)
+    deadline = time.perf_counter() + args.time_cap
+
+    # Bytes per entry: what the loaded structure holds, besides the keys themselves
+    tracemalloc.start()
+    table = constructor(capacity)
+    for count, key in enumerate(load_keys):
+        upsert(table, key, key)
+        if count % 1024 == 0 and time.perf_counter() > deadline:
+            tracemalloc.stop()
+            return {"status": "timeout (load)"}
+    bytes_per_entry = tracemalloc.get_traced_memory()[0] / len(load_keys)
+    tracemalloc.stop()
+
+    latencies = []
+    clock = time.perf_counter_ns
+    scan_length = args.scan_length
+    start = time.perf_counter()
+    for count, (name, key) in enumerate(operations):
+        before = clock()
+        if name == "read":
+            lookup(table, key)
+        elif name == "update" or name == "insert":
+            upsert(table, key, key)
+        elif name == "read_modify_write":
+            upsert(table, key, lookup(table, key))
+        elif name == "delete":
+            delete(table, key)
+        else:
+            scan(table, key, scan_length)
+        latencies.append(clock() - before)
+        if count % 1024 == 0 and time.perf_counter() > deadline:
+            return {"status": f"timeout ({count} ops)"}
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "status": "ok",
+        "ops_per_sec": len(operations) / elapsed,
+        "p50_us": latencies[len(latencies) // 2] / 1000,
+        "p99_us": latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)] / 1000,
+        "bytes_per_entry": bytes_per_entry,
+    }
+
+
+def count(structure, load_keys, operations, args):
+    """
+    Replays a run, untimed, on the instrumented variant of a structure.
+    Returns its counters over the operations, divided by the number of operations.
+    """
+    _, upsert, lookup, delete, scan = STRUCTURES[structure]
+    table = COUNTING[structure](len(load_keys) + len(operations))
+    for key in load_keys:
+        upsert(table, key, key)
+    for name in table.counters:  # Count the operations, not the load
+        table.counters[name] = 0
+    for name, key in operations:
+        if name == "read":
+            lookup(table, key)
+        elif name == "update" or name == "insert":
+            upsert(table, key, key)
+        elif name == "read_modify_write":
+            upsert(table, key, lookup(table, key))
+        elif name == "delete":
+            delete(table, key)
+        else:
+            scan(table, key, args.scan_length)
+    table.counters.pop("operations", None)  # Calls, which read_modify_write and the set upserts double
+    return {name: total / len(operations) for name, total in sorted(table.counters.items())}
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Benchmark the maps and sets of DataStructures on YCSB-style workloads.")
+    parser.add_argument("--structures", nargs="+", choices=STRUCTURES, default=list(STRUCTURES))
+    parser.add_argument("--workloads", nargs="+", choices=WORKLOADS, default=list(WORKLOADS))
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS, default=list(DISTRIBUTIONS))
+    parser.add_argument("--records", type=int, default=100_000, help="Number of keys loaded before the operations.")
+    parser.add_argument("--operations", type=int, default=100_000)
+    parser.add_argument("--scan-length", type=int, default=100)
+    parser.add_argument("--time-cap", type=float, default=60.0, help="Abandon a run after this many seconds.")
+    parser.add_argument("--seed", default="0")
+    parser.add_argument("--count", action="store_true",
+                        help="Also count rotations, probes and skip list steps per operation, in an untimed run.")
+    parser.add_argument("--json", help="Write the results to this JSON file.")
+    return parser.parse_args(argv)
+
+
+#############
+# Benchmark #
+#############
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    print(f"{args.records} records, {args.operations} operations, scans of {args.scan_length} keys")
+    print(f"{'workload':>8} {'keys':>10} {'structure':>16} {'status':>16} {'ops/sec':>10} "
+          f"{'p50 (µs)':>9} {'p99 (µs)':>9} {'bytes/entry':>11}")
+    results = []
+    slow_loads = set()  # (structure, distribution) whose load timed out: every workload loads the same way
+    for workload in args.workloads:
+        for distribution in args.distributions:
+            load_keys, operations = make_operations(workload, distribution, args.records, args.operations, args.seed)
+            for structure in args.structures:
+                record = {"workload": workload, "distribution": distribution, "structure": structure}
+                if (structure, distribution) in slow_loads:
+                    record["status"] = "timeout (load)"
+                else:
+                    record.update(run(structure, load_keys, operations, args))
+                    if record["status"] == "timeout (load)":
+                        slow_loads.add((structure, distribution))
+                results.append(record)
+                if record["status"] == "ok":
+                    print(f"{workload:>8} {distribution:>10} {structure:>16} {'ok':>16} {record['ops_per_sec']:>10,.0f} "
+                          f"{record['p50_us']:>9.1f} {record['p99_us']:>9.1f} {record['bytes_per_entry']:>11.0f}")
+                    if args.count and structure in COUNTING:
+                        record["counters"] = count(structure, load_keys, operations, args)
+                        print(f"{'':>53} per operation: "
+                              + ", ".join(f"{name} {value:.2f}" for name, value in record["counters"].items()))
+                else:
+                    print(f"{workload:>8} {distribution:>10} {structure:>16} {record['status']:>16}")
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump({"records": args.records, "operations": args.operations, "results": results}, file, indent=1)
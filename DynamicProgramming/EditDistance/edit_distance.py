@@ -34,4 +34,5 @@ def edit_distance(str1: str, str2: str) -> int:
     return dp[m][n]
 
 # Example usage
-print(edit_distance("kitten", "sitting"))  # Output 3
\ No newline at end of file
+if __name__ == "__main__":
+    print(edit_distance("kitten", "sitting"))  # Output 3
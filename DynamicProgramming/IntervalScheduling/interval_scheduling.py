@@ -46,14 +46,15 @@ def weighted_interval_scheduling(intervals: List[Interval]) -> Tuple[int, List[I
     return dp[n], result
 
 # Example usage
-intervals = [
-    (5, 8, 150),
-    (1, 3, 50),
-    (2, 5, 20),
-    (4, 6, 100),
-    (6, 7, 200),
-]
+if __name__ == "__main__":
+    intervals = [
+        (5, 8, 150),
+        (1, 3, 50),
+        (2, 5, 20),
+        (4, 6, 100),
+        (6, 7, 200),
+    ]
 
-max_profit, selected_intervals = weighted_interval_scheduling(intervals)
-print(f"Maximum Profit: {max_profit}")
-print("Selected Intervals:", selected_intervals)
\ No newline at end of file
+    max_profit, selected_intervals = weighted_interval_scheduling(intervals)
+    print(f"Maximum Profit: {max_profit}")
+    print("Selected Intervals:", selected_intervals)
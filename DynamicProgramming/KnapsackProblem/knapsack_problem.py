@@ -27,9 +27,10 @@ def knapsack(values, weights, capacity):
     return dp[n][capacity]
 
 # Example usage
-values = [60, 100, 120]
-weights = [1, 2, 3]
-capacity = 4
+if __name__ == "__main__":
+    values = [60, 100, 120]
+    weights = [1, 2, 3]
+    capacity = 4
 
-max_value = knapsack(values, weights, capacity)
-print(f"Maximum value achievable: {max_value}")
+    max_value = knapsack(values, weights, capacity)
+    print(f"Maximum value achievable: {max_value}")
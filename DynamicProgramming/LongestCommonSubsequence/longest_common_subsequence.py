@@ -41,8 +41,9 @@ def longest_common_subsequence(text1: str, text2: str) -> Tuple[str, List[List[i
     return ''.join(reversed(lcs)), dp
 
 # Example usage
-text1 = "AGCAT"
-text2 = "GAC"
-result, matrix = longest_common_subsequence(text1, text2)
+if __name__ == "__main__":
+    text1 = "AGCAT"
+    text2 = "GAC"
+    result, matrix = longest_common_subsequence(text1, text2)
 
-print(f"LCS: {result}")
\ No newline at end of file
+    print(f"LCS: {result}")
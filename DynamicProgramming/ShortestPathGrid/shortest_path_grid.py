@@ -55,15 +55,16 @@ class GridPathSolver:
         return path[::-1]
 
 # Example usage
-grid = [
-    [1, 3, 1, 2],
-    [2, 1, 2, 1],
-    [4, 2, 1, 3],
-    [1, 1, 2, 1]
-]
+if __name__ == "__main__":
+    grid = [
+        [1, 3, 1, 2],
+        [2, 1, 2, 1],
+        [4, 2, 1, 3],
+        [1, 1, 2, 1]
+    ]
 
-solver = GridPathSolver(grid)
-min_cost, path = solver.solve()
+    solver = GridPathSolver(grid)
+    min_cost, path = solver.solve()
 
-print(f"The best path is: {' -> '.join(f'[{x},{y}]' for x, y in path)}")
-print(f"Minimum cost: {min_cost}")
\ No newline at end of file
+    print(f"The best path is: {' -> '.join(f'[{x},{y}]' for x, y in path)}")
+    print(f"Minimum cost: {min_cost}")
@@ -41,13 +41,14 @@ def minimum_total(triangle: List[List[int]]) -> Tuple[int, List[int]]:
     return (dp[0], path)
 
 # Example usage
-triangle = [
-    [2],
-    [3, 4],
-    [6, 5, 7],
-    [4, 1, 8, 3]
-]
+if __name__ == "__main__":
+    triangle = [
+        [2],
+        [3, 4],
+        [6, 5, 7],
+        [4, 1, 8, 3]
+    ]
 
-result, path = minimum_total(triangle)
-print(f"Minimum path sum: {result}")  # Output: 11
-print(f"Path: {path}")  # Output: [2, 3, 5, 1]
\ No newline at end of file
+    result, path = minimum_total(triangle)
+    print(f"Minimum path sum: {result}")  # Output: 11
+    print(f"Path: {path}")  # Output: [2, 3, 5, 1]
@@ -22,37 +22,31 @@ def word_break(s: str, word_dict: List[str]) -> bool:
     for i in range(1, len(s) + 1):
         # Try all possible words ending at position i
         for j in range(i):
-            print(f"{i}:{j} - {s[j:i]}")
             # If we can segment string up to j and substring from j to i is in dictionary
             if dp[j] and s[j:i] in word_set:
                 dp[i] = True
                 break
     
-    print("----------------------")
-    print("Dictionary: ", word_dict)
-    print("String: ", s)
-    print("DP Table: ", dp)
-
     return dp[len(s)]
 
 
 
 # Example usage
+if __name__ == "__main__":
+    # Test case 1: Simple positive scenario
+    test1 = word_break("hellopython", ["hello", "python"])
+    print(test1) # Output: True
 
-# Test case 1: Simple positive scenario
-test1 = word_break("hellopython", ["hello", "python"])  
-print(test1) # Output: True
+    # Test case 2: Simple negative scenario
+    test2 = word_break("catsandog", ["cats", "dog", "sand", "and", "cat"])
+    print(f"Test 2 result: {test2}") # Output: False
 
-# Test case 2: Simple negative scenario
-test2 = word_break("catsandog", ["cats", "dog", "sand", "and", "cat"])
-print(f"Test 2 result: {test2}") # Output: False
-    
-# Test case 3: Empty string
-test3 =  word_break("", ["cat", "dog"]) 
-print(test3) # Output: True
-    
-test4 = word_break("applepenapple", ["apple", "pen"]) 
-print(test4) # Output: True
-    
-test5 = word_break("catsandog", ["cats", "dog", "sand"])
-print(test5) # Output: False
\ No newline at end of file
+    # Test case 3: Empty string
+    test3 =  word_break("", ["cat", "dog"])
+    print(test3) # Output: True
+
+    test4 = word_break("applepenapple", ["apple", "pen"])
+    print(test4) # Output: True
+
+    test5 = word_break("catsandog", ["cats", "dog", "sand"])
+    print(test5) # Output: False
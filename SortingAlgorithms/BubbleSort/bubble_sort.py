@@ -1,4 +1,22 @@
-def bubble_sort(arr):
+try:
+    from ..sort_keys import sort_by_key
+except ImportError:  # Run as a script, or imported from its own directory: run ../sort_keys.py
+    import os
+    from runpy import run_path
+    sort_by_key = run_path(os.path.join(os.path.dirname(__file__), os.pardir, "sort_keys.py"))["sort_by_key"]
+
+
+def bubble_sort(arr, key=None, reverse=False):
+    """
+    Sorts arr in place and returns it.
+
+    Stable: only strictly greater elements are swapped past their neighbour.
+    key and reverse work as in sorted(), see sort_keys.py.
+    """
+    if key is not None or reverse:
+        arr[:] = sort_by_key(bubble_sort, arr, key, reverse)
+        return arr
+
     n = len(arr)
 
     # Loop through the entire list n times
@@ -20,6 +38,11 @@ def bubble_sort(arr):
     return arr
 
 # Test
-my_list = [64, 5, 25, 12, 22, 11, 90]
-sorted_list = bubble_sort(my_list)
-print("Sorted array:", sorted_list)
\ No newline at end of file
+if __name__ == "__main__":
+    my_list = [64, 5, 25, 12, 22, 11, 90]
+    sorted_list = bubble_sort(my_list)
+    print("Sorted array:", sorted_list)
+
+    # Sort records by a field: equal fields keep their order
+    people = [("Ada", 36), ("Bob", 25), ("Cy", 36), ("Di", 25)]
+    print(bubble_sort(people, key=lambda person: person[1]))  # Output: [('Bob', 25), ('Di', 25), ('Ada', 36), ('Cy', 36)]
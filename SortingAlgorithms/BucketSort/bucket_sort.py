@@ -1,4 +1,13 @@
-def bucket_sort(arr):
+def bucket_sort(arr, key=None, reverse=False):
+    """
+    Returns a new sorted list with the elements of arr, floats in [0, 1),
+    or with key floats in [0, 1): key is called once per element.
+
+    Stable, reverse=True included: elements with equal keys keep their order.
+    """
+    if key is not None or reverse:
+        return bucket_sort_by_key(arr, arr if key is None else [key(item) for item in arr], reverse)
+
     # Step 1: Create empty buckets
     num_buckets = len(arr)
     buckets = [[] for _ in range(num_buckets)]
@@ -28,6 +37,38 @@ def bucket_sort(arr):
     return sorted_array
 
 
-data = [0.64, 0.5, 0.25, 0.12, 0.22, 0.11, 0.90]
-sorted_data = bucket_sort(data)
-print("Sorted Data:", sorted_data)
\ No newline at end of file
+def bucket_sort_by_key(arr, keys, reverse):
+    """
+    Like bucket_sort, but the buckets hold indexes, ordered by keys[index]:
+    the elements are only moved once, into the result.
+    """
+    num_buckets = len(arr)
+    buckets = [[] for _ in range(num_buckets)]
+    for i, k in enumerate(keys):
+        buckets[int(k * num_buckets)].append(i)
+
+    sorted_array = []
+    for bucket in (reversed(buckets) if reverse else buckets):
+        # Insertion sort on strict comparisons: equal keys are never swapped
+        for i in range(1, len(bucket)):
+            current = bucket[i]
+            current_key = keys[current]
+            j = i - 1
+            while j >= 0 and (keys[bucket[j]] < current_key if reverse else current_key < keys[bucket[j]]):
+                bucket[j + 1] = bucket[j]
+                j -= 1
+            bucket[j + 1] = current
+        sorted_array.extend(arr[i] for i in bucket)
+    return sorted_array
+
+
+# Example usage
+if __name__ == "__main__":
+    data = [0.64, 0.5, 0.25, 0.12, 0.22, 0.11, 0.90]
+    sorted_data = bucket_sort(data)
+    print("Sorted Data:", sorted_data)
+
+    # Players by win rate, best first
+    players = [("ann", 0.5), ("bob", 0.75), ("cal", 0.5), ("dan", 0.25)]
+    print(bucket_sort(players, key=lambda player: player[1], reverse=True))
+    # Output: [('bob', 0.75), ('ann', 0.5), ('cal', 0.5), ('dan', 0.25)]
@@ -1,28 +1,46 @@
-def counting_sort(arr: list[int]) -> list[int]:
+def counting_sort(arr: list, key=None, reverse: bool = False) -> list:
+    """
+    Returns a new list with the elements of arr, which are non-negative
+    integers, or with key non-negative integers: key is called once per element.
+
+    Stable, reverse=True included: elements with equal keys keep their order.
+    """
+    keys = arr if key is None else [key(item) for item in arr]
+    if reverse:
+        # Mirror the keys, so that the largest comes first
+        max_key = max(keys)
+        keys = [max_key - k for k in keys]
 
     # Step 1: Find the maximum value to determine the range of count array
-    max_val = max(arr)
+    max_val = max(keys)
 
     # Step 2: Initialize the count array with zeroes
     count = [0] * (max_val + 1)
 
-    # Step 3: Count the occurrences of each element
-    for num in arr:
-        count[num] += 1
+    # Step 3: Count the occurrences of each key
+    for k in keys:
+        count[k] += 1
 
     # Step 4: Update count array to store cumulative positions
     for i in range(1, len(count)):
         count[i] += count[i - 1]
 
     # Step 5: Build the output array, iterate in reverse to maintain stability
-    output = [0] * len(arr)
-    for num in reversed(arr):
-        output[count[num] - 1] = num
-        count[num] -= 1
+    output = [None] * len(arr)
+    for i in range(len(arr) - 1, -1, -1):
+        k = keys[i]
+        output[count[k] - 1] = arr[i]
+        count[k] -= 1
 
     return output
 
 # Example usage
-my_list = [3, 3, 1, 2, 2, 1, 4]
-sorted_list = counting_sort(my_list)
-print(f"Sorted Array: {sorted_list}")
\ No newline at end of file
+if __name__ == "__main__":
+    my_list = [3, 3, 1, 2, 2, 1, 4]
+    sorted_list = counting_sort(my_list)
+    print(f"Sorted Array: {sorted_list}")
+
+    # Orders by number of items; orders with the same count keep their order
+    orders = [("ann", 2), ("bob", 0), ("cal", 2), ("dan", 1)]
+    print(counting_sort(orders, key=lambda order: order[1], reverse=True))
+    # Output: [('ann', 2), ('cal', 2), ('dan', 1), ('bob', 0)]
@@ -1,29 +1,64 @@
 import heapq
 import os
+import pickle
 
-def merge_files(output_file, chunk_size):
+
+class _Descending:
+    """Wraps a key so that heapq, a min-heap, pops the largest key first."""
+    __slots__ = ("key",)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __lt__(self, other):
+        return other.key < self.key
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+
+def merge_files(output_file, chunk_size, key=None, reverse=False):
     """
     Merges sorted data from temporary files into a single output file.
 
     Args:
         output_file (str): Path to the output file.
         chunk_size (int): Number of lines to buffer before writing to the output file.
+        key (callable): Key the runs were sorted by. It is not called again:
+            keyed runs store each line after its key.
+        reverse (bool): Whether the runs were sorted in descending order.
     """
 
     buffer_size = 1000  # Number of lines to buffer before writing
     buffer = []  # Buffer to accumulate lines for writing
 
     heap = []
-    temp_files = [file for file in os.listdir('.') if file.startswith('temp_')]
+    # In chunk order: on equal keys the heap takes the earlier chunk, so the sort is stable
+    temp_files = sorted((file for file in os.listdir('.') if file.startswith('temp_')),
+                        key=lambda file: int(file[len('temp_'):]))
+
+    def next_element(file):
+        """Returns the next (heap key, line) of a run, or None at its end."""
+        if key is None:
+            element = file.readline().strip()
+            if not element:
+                return None
+            k = element
+        else:
+            try:
+                k, element = pickle.load(file)
+            except EOFError:
+                return None
+        return (_Descending(k) if reverse else k), element
 
     # Open temporary files
-    in_files = [open(temp_file, 'r') for temp_file in temp_files]
+    in_files = [open(temp_file, 'r' if key is None else 'rb') for temp_file in temp_files]
 
     # Initialize the heap
     for i, f in enumerate(in_files):
-        element = f.readline().strip()
-        if element:  # Skip empty lines
-            heap.append((element, i))
+        element = next_element(f)
+        if element:  # Skip empty runs
+            heap.append((element[0], i, element[1]))
     heapq.heapify(heap)  # Transform list into a heap in O(n)
 
 
@@ -31,7 +66,7 @@ def merge_files(output_file, chunk_size):
         while heap:
             # Extract the smallest element from the heap
             root = heapq.heappop(heap)
-            buffer.append(root[0])  # Add to the buffer
+            buffer.append(root[2])  # Add to the buffer
 
             # Write the buffer to disk if it's full
             if len(buffer) >= buffer_size:
@@ -39,9 +74,9 @@ def merge_files(output_file, chunk_size):
                 buffer = []
 
             # Read the next element from the corresponding file
-            element = in_files[root[1]].readline().strip()
-            if element:  # Skip empty lines
-                heapq.heappush(heap, (element, root[1]))
+            element = next_element(in_files[root[1]])
+            if element:  # Until the end of the run
+                heapq.heappush(heap, (element[0], root[1], element[1]))
 
         # Write any remaining lines in the buffer
         if buffer:
@@ -55,13 +90,16 @@ def merge_files(output_file, chunk_size):
     for temp_file in temp_files:
         os.remove(temp_file)
 
-def create_initial_runs(input_file, chunk_size):
+def create_initial_runs(input_file, chunk_size, key=None, reverse=False):
     """
     Reads chunks of data from an input file, sorts them, and writes sorted chunks to temporary files.
 
     Args:
         input_file (str): Path to the input file.
         chunk_size (int): Number of lines to process per chunk.
+        key (callable): Function of a line to sort by; lexicographic order by default.
+            It is called once per line, and its results are pickled into the runs.
+        reverse (bool): Whether to sort in descending order.
     """
     chunk_index = 0
 
@@ -73,40 +111,48 @@ def create_initial_runs(input_file, chunk_size):
             if not data:  # Exit loop if no more data
                 break
 
-            # Sort the data lexicographically
-            data.sort()
-
             # Write the sorted data to a temporary file
             temp_file = f"temp_{chunk_index}"
-            with open(temp_file, 'w') as out_file:
-                out_file.write('\n'.join(data) + '\n')
+            if key is None:
+                data.sort(reverse=reverse)  # Lexicographic order
+                with open(temp_file, 'w') as out_file:
+                    out_file.write('\n'.join(data) + '\n')
+            else:
+                # Each line after its key, so that the merge does not call key again; sorted is stable
+                keys = [key(line) for line in data]
+                with open(temp_file, 'wb') as out_file:
+                    for i in sorted(range(len(data)), key=keys.__getitem__, reverse=reverse):
+                        pickle.dump((keys[i], data[i]), out_file)
 
             print(f"Chunk {chunk_index} written to {temp_file}")
             chunk_index += 1
 
-def external_sort(input_file, output_file, chunk_size):
+def external_sort(input_file, output_file, chunk_size, key=None, reverse=False):
     """
     Performs external sorting on a large file by dividing it into chunks, sorting each chunk,
-    and merging them into a single sorted output file.
+    and merging them into a single sorted output file. The sort is stable: lines with
+    equal keys keep their input order, with reverse=True too.
 
     Args:
         input_file (str): Path to the input file.
         output_file (str): Path to the output file.
         chunk_size (int): Number of lines to process per chunk.
+        key (callable): Function of a line to sort by, e.g. len; lexicographic order by default.
+            It is called once per line; its results must be picklable.
+        reverse (bool): Whether to sort in descending order.
     """
-    create_initial_runs(input_file, chunk_size)
-    merge_files(output_file, chunk_size)
+    create_initial_runs(input_file, chunk_size, key, reverse)
+    merge_files(output_file, chunk_size, key, reverse)
 
 
 
 
 
 # Test the code
-chunk_size = 1000  # Size of each chunk
-
-input_file = "commedia.txt"
-output_file = "sorted_commedia.txt"
-
-external_sort(input_file, output_file, chunk_size)
+if __name__ == "__main__":
+    chunk_size = 1000  # Size of each chunk
 
+    input_file = "commedia.txt"
+    output_file = "sorted_commedia.txt"
 
+    external_sort(input_file, output_file, chunk_size)
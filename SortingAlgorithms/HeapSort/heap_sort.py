@@ -1,3 +1,11 @@
+try:
+    from ..sort_keys import sort_by_key
+except ImportError:  # Run as a script, or imported from its own directory: run ../sort_keys.py
+    import os
+    from runpy import run_path
+    sort_by_key = run_path(os.path.join(os.path.dirname(__file__), os.pardir, "sort_keys.py"))["sort_by_key"]
+
+
 def heapify(arr, n, i):
     # Find the largest among current node, left child, and right child
     largest = i  # Initially assume the current node is the largest
@@ -18,7 +26,18 @@ def heapify(arr, n, i):
         heapify(arr, n, largest)  # Continue heapifying the affected sub-tree
 
 
-def heap_sort(arr):
+def heap_sort(arr, key=None, reverse=False):
+    """
+    Sorts arr in place.
+
+    Not stable: moving the root to the end jumps it past equal elements.
+    With key or reverse, ties are broken by position, so the result is
+    stable; see sort_keys.py.
+    """
+    if key is not None or reverse:
+        arr[:] = sort_by_key(heap_sort, arr, key, reverse)
+        return
+
     n = len(arr)
 
     # Build a Max Heap
@@ -33,6 +52,11 @@ def heap_sort(arr):
         heapify(arr, i, 0)
 
 # Example usage
-arr = [64, 5, 25, 12, 22, 11, 90]
-heap_sort(arr)
-print("Sorted array:", arr)
+if __name__ == "__main__":
+    arr = [64, 5, 25, 12, 22, 11, 90]
+    heap_sort(arr)
+    print("Sorted array:", arr)
+
+    tasks = [("backup", 2), ("deploy", 1), ("report", 2), ("alert", 3)]
+    heap_sort(tasks, key=lambda task: task[1], reverse=True)
+    print(tasks)  # Output: [('alert', 3), ('backup', 2), ('report', 2), ('deploy', 1)]
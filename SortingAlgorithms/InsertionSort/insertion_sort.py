@@ -1,4 +1,22 @@
-def insertion_sort(arr):
+try:
+    from ..sort_keys import sort_by_key
+except ImportError:  # Run as a script, or imported from its own directory: run ../sort_keys.py
+    import os
+    from runpy import run_path
+    sort_by_key = run_path(os.path.join(os.path.dirname(__file__), os.pardir, "sort_keys.py"))["sort_by_key"]
+
+
+def insertion_sort(arr, key=None, reverse=False):
+    """
+    Sorts arr in place and returns it.
+
+    Stable: an element only moves past strictly greater ones.
+    key and reverse work as in sorted(), see sort_keys.py.
+    """
+    if key is not None or reverse:
+        arr[:] = sort_by_key(insertion_sort, arr, key, reverse)
+        return arr
+
     # Traverse through 1 to len(arr)
     for i in range(1, len(arr)):
         key = arr[i]
@@ -16,6 +34,10 @@ def insertion_sort(arr):
     return arr
 
 # Test
-my_list = [64, 5, 25, 12, 22, 11, 90]
-sorted_list = insertion_sort(my_list)
-print("Sorted array:", sorted_list)
+if __name__ == "__main__":
+    my_list = [64, 5, 25, 12, 22, 11, 90]
+    sorted_list = insertion_sort(my_list)
+    print("Sorted array:", sorted_list)
+
+    words = ["pear", "Fig", "apple", "date"]
+    print(insertion_sort(words, key=str.lower, reverse=True))  # Output: ['pear', 'Fig', 'date', 'apple']
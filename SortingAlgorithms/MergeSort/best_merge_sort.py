@@ -1,4 +1,23 @@
-def merge_sort(arr, left, right):
+try:
+    from ..sort_keys import sort_by_key
+except ImportError:  # Run as a script, or imported from its own directory: run ../sort_keys.py
+    import os
+    from runpy import run_path
+    sort_by_key = run_path(os.path.join(os.path.dirname(__file__), os.pardir, "sort_keys.py"))["sort_by_key"]
+
+
+def merge_sort(arr, left, right, key=None, reverse=False):
+    """
+    Sorts arr[left:right + 1] in place.
+
+    Stable: on a tie, merge takes the element of the left half first.
+    key and reverse work as in sorted(), see sort_keys.py.
+    """
+    if key is not None or reverse:
+        if left < right:
+            arr[left:right + 1] = sort_by_key(lambda pairs: merge_sort(pairs, 0, len(pairs) - 1),
+                                              arr[left:right + 1], key, reverse)
+        return
 
     if left < right:
         # Find the middle index
@@ -49,6 +68,10 @@ def merge(arr, left, mid, right):
         k += 1
 
 # Test
-my_list = [64, 5, 25, 12, 22, 11, 90]
-merge_sort(my_list, 0, len(my_list)-1)
-print("Sorted array:", my_list)
\ No newline at end of file
+if __name__ == "__main__":
+    my_list = [64, 5, 25, 12, 22, 11, 90]
+    merge_sort(my_list, 0, len(my_list)-1)
+    print("Sorted array:", my_list)
+
+    merge_sort(my_list, 0, len(my_list) - 1, reverse=True)
+    print("Descending:", my_list)  # Output: Descending: [90, 64, 25, 22, 12, 11, 5]
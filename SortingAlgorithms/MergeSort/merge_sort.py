@@ -1,4 +1,21 @@
-def merge_sort(arr):
+try:
+    from ..sort_keys import sort_by_key
+except ImportError:  # Run as a script, or imported from its own directory: run ../sort_keys.py
+    import os
+    from runpy import run_path
+    sort_by_key = run_path(os.path.join(os.path.dirname(__file__), os.pardir, "sort_keys.py"))["sort_by_key"]
+
+
+def merge_sort(arr, key=None, reverse=False):
+    """
+    Returns a new sorted list; arr is left unchanged.
+
+    Stable: on a tie, merge takes the element of the left half first.
+    key and reverse work as in sorted(), see sort_keys.py.
+    """
+    if key is not None or reverse:
+        return sort_by_key(merge_sort, arr, key, reverse)
+
     # Base case: if the array has 1 or zero elements, it's already sorted
     if len(arr) <= 1:
         return arr
@@ -22,9 +39,10 @@ def merge(left, right):
     i = 0  # Pointer for the left half
     j = 0  # Pointer for the right half
 
-    # Compare elements from both halves and append the smaller one to the merged list
+    # Compare elements from both halves and append the smaller one to the merged list;
+    # on a tie the left one goes first, which keeps the sort stable, and only < is needed
     while i < len(left) and j < len(right):
-        if left[i] < right[j]:
+        if not right[j] < left[i]:
             merged.append(left[i])
             i += 1
         else:
@@ -40,6 +58,10 @@ def merge(left, right):
     return merged
 
 # Test
-my_list = [64, 5, 25, 12, 22, 11, 90]
-sorted_list = merge_sort(my_list)
-print("Sorted array:", sorted_list)
\ No newline at end of file
+if __name__ == "__main__":
+    my_list = [64, 5, 25, 12, 22, 11, 90]
+    sorted_list = merge_sort(my_list)
+    print("Sorted array:", sorted_list)
+
+    # Keys are computed once per element: len runs 4 times here, not once per comparison
+    print(merge_sort(["kiwi", "fig", "banana", "plum"], key=len))  # Output: ['fig', 'kiwi', 'plum', 'banana']
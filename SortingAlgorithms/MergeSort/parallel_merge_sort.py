@@ -0,0 +1,205 @@
+import os
+from array import array
+from multiprocessing import Pool, shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # Pure Python merges on a memoryview: correct, but far slower
+    np = None
+
+# Shared memory of the sort, attached once by each worker process
+_segment = None
+_elements = None
+
+
+def _as_elements(buffer, typecode, length):
+    """Returns the first length elements of buffer: a NumPy array, or a memoryview without NumPy."""
+    if np is not None:
+        return np.frombuffer(buffer, dtype=typecode, count=length)
+    return buffer[:length * array(typecode).itemsize].cast(typecode)
+
+
+def _attach(name, typecode, length):
+    """Pool initializer: maps the shared segment into the worker, without copying it."""
+    global _segment, _elements
+    _segment = shared_memory.SharedMemory(name=name)
+    _elements = _as_elements(_segment.buf, typecode, length)
+
+
+def _touch(low, high):
+    """
+    Writes zeros to _elements[low:high]. The first write to a page of a fresh
+    segment faults, and the kernel allocates and clears the page: the workers
+    take those faults in parallel, instead of the copy into the segment.
+    """
+    _elements[low:high] = 0 if np is not None else array(_elements.format, bytes((high - low) * _elements.itemsize))
+
+
+def _sort_chunk(low, high):
+    """Sorts _elements[low:high] in place."""
+    if np is not None:
+        _elements[low:high].sort()
+    else:
+        _elements[low:high] = array(_elements.format, sorted(_elements[low:high]))
+
+
+def _merge(a_low, a_high, b_low, b_high, out):
+    """
+    Merges the sorted ranges _elements[a_low:a_high] and _elements[b_low:b_high]
+    into _elements[out:out + their total length], in the other half of the
+    segment. No slice is copied to temporary lists, as merge() in
+    best_merge_sort.py does. Without NumPy the output buffer is the only extra
+    memory; with NumPy, the merge allocates a temporary buffer, see below.
+    """
+    elements = _elements
+    if a_low == a_high or b_low == b_high:
+        # One side is empty, the other is already in order
+        length = a_high - a_low + b_high - b_low
+        start = b_low if a_low == a_high else a_low
+        elements[out:out + length] = elements[start:start + length]
+        return
+
+    if np is not None:
+        # Both runs side by side in the output: NumPy's stable sort, a TimSort,
+        # finds the two runs and merges them with one linear galloping merge.
+        # That merge allocates its own buffer, up to the shorter run, on every
+        # call: a scatter of each element to its rank (np.searchsorted) needs
+        # no buffer but is about 4 times slower, so the buffer is accepted
+        a_length = a_high - a_low
+        merged = elements[out:out + a_length + b_high - b_low]
+        merged[:a_length] = elements[a_low:a_high]
+        merged[a_length:] = elements[b_low:b_high]
+        merged.sort(kind="stable")
+        return
+
+    i, j, k = a_low, b_low, out
+    while i < a_high and j < b_high:
+        if elements[j] < elements[i]:
+            elements[k] = elements[j]
+            j += 1
+        else:
+            elements[k] = elements[i]
+            i += 1
+        k += 1
+    elements[k:k + a_high - i] = elements[i:a_high]
+    k += a_high - i
+    elements[k:k + b_high - j] = elements[j:b_high]
+
+
+def co_rank(elements, d, a_low, a_length, b_low, b_length):
+    """
+    Returns how many of the first d elements of the merge of the sorted runs
+    elements[a_low:a_low + a_length] and elements[b_low:b_low + b_length]
+    come from the first run, in O(log d) comparisons.
+
+    On equal elements the first run goes first, as in a sequential merge, so
+    one merge split at several co-ranks gives the same output in pieces that
+    processes can write independently.
+    """
+    low, high = max(0, d - b_length), min(d, a_length)
+    while low < high:
+        i = (low + high) // 2
+        if not elements[b_low + d - i - 1] < elements[a_low + i]:
+            low = i + 1  # elements[a_low + i] still belongs to the first d
+        else:
+            high = i
+    return low
+
+
+def merge_tasks(elements, runs, source, target, pieces):
+    """
+    Plans one round of pairwise merges of runs, from the buffer starting at
+    element source to the one starting at target. Each merge is cut by co_rank
+    into parts of about n / pieces elements, so the last rounds, with fewer
+    merges than processes, keep every process busy.
+
+    Returns the _merge arguments of every part and the runs of the next round.
+    """
+    n = runs[-1][1] - runs[0][0]
+    tasks, merged = [], []
+    for k in range(0, len(runs), 2):
+        a_low, a_high = runs[k]
+        b_low, b_high = runs[k + 1] if k + 1 < len(runs) else (a_high, a_high)
+        a_length, b_length = a_high - a_low, b_high - b_low
+        length = a_length + b_length
+        parts = max(1, round(pieces * length / n))
+        previous_d = previous_i = 0
+        for part in range(1, parts + 1):
+            d = length * part // parts
+            i = co_rank(elements, d, source + a_low, a_length, source + b_low, b_length)
+            tasks.append((source + a_low + previous_i, source + a_low + i,
+                          source + b_low + previous_d - previous_i, source + b_low + d - i,
+                          target + a_low + previous_d))
+            previous_d, previous_i = d, i
+        merged.append((a_low, b_high))
+    return tasks, merged
+
+
+def parallel_merge_sort(data, workers=None, typecode="q"):
+    """
+    Sorts data, a NumPy array, array.array or list of numbers, in place, with
+    a pool of worker processes.
+
+    The numbers are copied once into a shared memory segment twice their size:
+    the elements, then an auxiliary buffer of the same length. The workers
+    first touch every page of the segment, in parallel.
+    1. Each worker sorts one chunk of the elements in place.
+    2. Rounds of pairwise merges ping-pong the runs between the two buffers,
+       every merge split across the workers by co_rank.
+    3. The sorted numbers are copied back into data.
+
+    Args:
+        data: The numbers to sort; each must fit the typecode.
+        workers: Number of processes, os.cpu_count() by default.
+        typecode: array/NumPy type code of the numbers: "q" for int64, "d" for float64.
+    """
+    n = len(data)
+    if n < 2:
+        return
+    workers = min(workers or os.cpu_count() or 1, n)
+    itemsize = array(typecode).itemsize
+    segment = shared_memory.SharedMemory(create=True, size=2 * n * itemsize)
+    elements = _as_elements(segment.buf, typecode, 2 * n)
+    try:
+        with Pool(workers, initializer=_attach, initargs=(segment.name, typecode, 2 * n)) as pool:
+            pool.starmap(_touch, [(2 * n * k // workers, 2 * n * (k + 1) // workers) for k in range(workers)])
+            elements[:n] = data if np is not None else array(typecode, data)
+
+            runs = [(n * k // workers, n * (k + 1) // workers) for k in range(workers)]
+            pool.starmap(_sort_chunk, runs)
+
+            source, target = 0, n
+            while len(runs) > 1:
+                tasks, runs = merge_tasks(elements, runs, source, target, workers)
+                pool.starmap(_merge, tasks)
+                source, target = target, source
+
+        result = elements[source:source + n]
+        if np is not None and isinstance(data, np.ndarray):
+            data[...] = result
+        elif isinstance(data, array):
+            data[:] = array(data.typecode, result.tobytes())
+        else:
+            data[:] = result.tolist()
+        del result
+    finally:
+        # The segment can only be closed once no view of it is left
+        if np is None:
+            elements.release()
+        del elements
+        segment.close()
+        segment.unlink()
+
+
+# Example usage
+if __name__ == "__main__":
+    import random
+
+    numbers = [random.randrange(-1_000_000, 1_000_000) for _ in range(100_000)]
+    expected = sorted(numbers)
+    parallel_merge_sort(numbers, workers=4)
+    print(numbers == expected)  # Output: True
+
+    readings = array("d", [0.5, -2.25, 3.0, 0.5, -7.5])
+    parallel_merge_sort(readings, workers=2, typecode="d")
+    print(readings.tolist())  # Output: [-7.5, -2.25, 0.5, 0.5, 3.0]
@@ -0,0 +1,60 @@
+import os
+import random
+import sys
+import time
+from array import array
+
+from parallel_merge_sort import np, parallel_merge_sort
+
+
+def make_input(n, seed=0):
+    """n random int64 values, as a NumPy array, or as an array.array without NumPy."""
+    if np is not None:
+        return np.random.default_rng(seed).integers(-2 ** 63, 2 ** 63 - 1, n, dtype=np.int64)
+    rng = random.Random(seed)
+    return array("q", (rng.randrange(-2 ** 63, 2 ** 63) for _ in range(n)))
+
+
+def best_time(sort, data, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        copy = data.copy() if np is not None else array("q", data)
+        start = time.perf_counter()
+        sort(copy)
+        best = min(best, time.perf_counter() - start)
+    return best, copy
+
+
+def worker_counts():
+    """1, 2, 4, ... up to the number of cores, which is always included."""
+    cores = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 < cores:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cores:
+        counts.append(cores)
+    return counts
+
+
+#############
+# Benchmark #
+#############
+if __name__ == "__main__":
+    sizes = [int(size) for size in sys.argv[1:]] or [10 ** 8 if np is not None else 10 ** 6]
+    print(f"{os.cpu_count()} cores, {'NumPy ' + np.__version__ if np is not None else 'no NumPy: pure Python merges'}")
+    for n in sizes:
+        data = make_input(n)
+        if np is not None:
+            reference, expected = best_time(lambda values: values.sort(), data)
+            name = "numpy.sort, 1 core"
+        else:
+            reference, expected = best_time(lambda values: values.__setitem__(slice(None), array("q", sorted(values))), data)
+            name = "sorted(), 1 core"
+        print(f"\nn = {n:,} int64, {name}: {reference:.3f} s")
+        print(f"{'workers':>8} {'seconds':>9} {'speedup':>8} {'vs reference':>13}")
+        single = None
+        for workers in worker_counts():
+            seconds, result = best_time(lambda values: parallel_merge_sort(values, workers), data)
+            assert (result == expected).all() if np is not None else result == expected
+            single = single or seconds
+            print(f"{workers:>8} {seconds:>9.3f} {single / seconds:>7.2f}x {reference / seconds:>12.2f}x")
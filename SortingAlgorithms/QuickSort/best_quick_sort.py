@@ -1,43 +1,183 @@
-def quick_sort_in_place(arr, low, high):
+try:
+    from ..sort_keys import sort_by_key
+except ImportError:  # Run as a script, or imported from its own directory: run ../sort_keys.py
+    import os
+    from runpy import run_path
+    sort_by_key = run_path(os.path.join(os.path.dirname(__file__), os.pardir, "sort_keys.py"))["sort_by_key"]
+
+INSERTION_SORT_THRESHOLD = 16  # Partitions this small are finished by insertion sort
+NINTHER_THRESHOLD = 40  # From this size, the pivot is the ninther instead of the median of three
+
+
+def quick_sort_in_place(arr, low, high, key=None, reverse=False):
+    """
+    Sorts arr[low:high + 1] in place, in O(n log n) time on any input.
+
+    An introsort: quick sort with three-way partitioning, which falls back to
+    heap sort if the pivots keep being bad, and finishes small partitions
+    with insertion sort. The recursion is at most log2(n) calls deep.
+
+    Not stable: partitioning swaps elements across the range. With key or
+    reverse, ties are broken by position, so the result is stable; see sort_keys.py.
+    """
+    if key is not None or reverse:
+        if low < high:
+            arr[low:high + 1] = sort_by_key(lambda pairs: quick_sort_in_place(pairs, 0, len(pairs) - 1),
+                                            arr[low:high + 1], key, reverse)
+        return
+
     if low < high:
-        # Partition the array and get the partition index
-        pivot_index = partition(arr, low, high)
-        
-        # Recursively sort the elements before and after partition
-        quick_sort_in_place(arr, low, pivot_index - 1)
-        quick_sort_in_place(arr, pivot_index + 1, high)
+        # About 2 log2(n) levels of partitioning before giving up on quick sort
+        introsort(arr, low, high, 2 * (high - low + 1).bit_length())
+
+def introsort(arr, low, high, depth_limit):
+    """Sorts arr[low:high + 1], partitioning at most depth_limit more times before heap sort."""
+    while high - low + 1 > INSERTION_SORT_THRESHOLD:
+        if depth_limit == 0:
+            # The pivots were bad too many times in a row (an adversarial input):
+            # heap sort is O(n log n) whatever the input, and sorts the range in place
+            heap_sort(arr, low, high)
+            return
+        depth_limit -= 1
+
+        # Partition the array: arr[lt:gt + 1] are equal to the pivot, and already in place
+        lt, gt = partition(arr, low, high)
+
+        # Recursively sort the smaller side, and loop on the larger one:
+        # each call gets at most half the elements of its caller
+        if lt - low < high - gt:
+            introsort(arr, low, lt - 1, depth_limit)
+            low = gt + 1
+        else:
+            introsort(arr, gt + 1, high, depth_limit)
+            high = lt - 1
+
+    insertion_sort(arr, low, high)
 
 def partition(arr, low, high):
-    # Median-of-three to choose a pivot
-    mid = (low + high) // 2
-    pivot = median_of_three(arr, low, mid, high)
-    
-    # Partition the array around the pivot
-    # moving all the smaller element to the left of the pivot.
-    i = low - 1
-    for j in range(low, high):
-        if arr[j] < pivot:
+    """
+    Three-way partition of arr[low:high + 1] around the pivot, Bentley and
+    McIlroy's solution of the Dutch national flag problem. Returns (lt, gt)
+    such that:
+    - arr[low:lt] < pivot
+    - arr[lt:gt + 1] == pivot
+    - arr[gt + 1:high + 1] > pivot
+    Keys equal to the pivot are left out of both sides, so many duplicates
+    make the partitions smaller instead of unbalanced.
+
+    The two scans are Hoare's: about one comparison per element, and a swap
+    only for pairs on the wrong side. Keys equal to the pivot met on the way
+    are swapped to the ends of the range, then into the middle at the end.
+    """
+    pivot_index = choose_pivot(arr, low, high)
+    arr[low], arr[pivot_index] = arr[pivot_index], arr[low]
+    pivot = arr[low]
+
+    # arr[low:p + 1] == pivot, arr[p + 1:i] < pivot, arr[j + 1:q] > pivot, arr[q:high + 1] == pivot
+    i, j = low, high + 1
+    p, q = low, high + 1
+    while True:
+        i += 1
+        while arr[i] < pivot:
+            if i == high:
+                break
             i += 1
-            arr[i], arr[j] = arr[j], arr[i]
-    
-    # Replace the pivot in his new position
-    arr[i + 1], arr[high] = arr[high], arr[i + 1]
-    return i + 1
-
-def median_of_three(arr, low, mid, high):
-    # Sort the three elements and return the median as pivot
-    if arr[low] > arr[mid]:
-        arr[low], arr[mid] = arr[mid], arr[low]
-    if arr[low] > arr[high]:
-        arr[low], arr[high] = arr[high], arr[low]
-    if arr[mid] > arr[high]:
-        arr[mid], arr[high] = arr[high], arr[mid]
-    
-    # Use the middle element as the pivot
-    arr[mid], arr[high] = arr[high], arr[mid]
-    return arr[high]
+        j -= 1
+        while pivot < arr[j]:  # Stops at arr[low], the pivot, at the latest
+            j -= 1
+
+        if i >= j:
+            if i == j and not arr[i] < pivot:  # arr[i] stopped both scans: equal to the pivot
+                p += 1
+                arr[p], arr[i] = arr[i], arr[p]
+            break
+
+        arr[i], arr[j] = arr[j], arr[i]
+        # Now arr[i] <= pivot and arr[j] >= pivot: one comparison tells if they are equal
+        if not arr[i] < pivot:
+            p += 1
+            arr[p], arr[i] = arr[i], arr[p]
+        if not pivot < arr[j]:
+            q -= 1
+            arr[q], arr[j] = arr[j], arr[q]
+
+    # Swap the keys equal to the pivot from the ends to the middle
+    i = j + 1
+    for k in range(low, p + 1):
+        arr[k], arr[j] = arr[j], arr[k]
+        j -= 1
+    for k in range(high, q - 1, -1):
+        arr[k], arr[i] = arr[i], arr[k]
+        i += 1
+    return j + 1, i - 1
+
+def choose_pivot(arr, low, high):
+    """
+    Returns the index of the pivot: the median of the first, middle and last
+    elements or, from NINTHER_THRESHOLD elements, Tukey's ninther, the median
+    of three such medians. Sorted, reversed and organ-pipe inputs get a pivot
+    near the true median.
+    """
+    mid = (low + high) // 2
+    if high - low + 1 < NINTHER_THRESHOLD:
+        return median_of_three(arr, low, mid, high)
+    step = (high - low + 1) // 8
+    return median_of_three(
+        arr,
+        median_of_three(arr, low, low + step, low + 2 * step),
+        median_of_three(arr, mid - step, mid, mid + step),
+        median_of_three(arr, high - 2 * step, high - step, high),
+    )
+
+def median_of_three(arr, a, b, c):
+    # Return the index of the median of the three elements, without moving them
+    if arr[a] < arr[b]:
+        if arr[b] < arr[c]:
+            return b
+        return c if arr[a] < arr[c] else a
+    if arr[a] < arr[c]:
+        return a
+    return c if arr[b] < arr[c] else b
+
+def heap_sort(arr, low, high):
+    """Sorts arr[low:high + 1] in place with a max-heap rooted at arr[low], comparing with < only."""
+    n = high - low + 1
+    for root in range(n // 2 - 1, -1, -1):
+        sift_down(arr, low, root, n)
+    for end in range(n - 1, 0, -1):
+        # Move the largest element after the heap, which shrinks by one
+        arr[low], arr[low + end] = arr[low + end], arr[low]
+        sift_down(arr, low, 0, end)
+
+def sift_down(arr, low, root, n):
+    # Move arr[low + root] down the heap arr[low:low + n] until no child is larger
+    value = arr[low + root]
+    child = 2 * root + 1
+    while child < n:
+        if child + 1 < n and arr[low + child] < arr[low + child + 1]:
+            child += 1
+        if not value < arr[low + child]:
+            break
+        arr[low + root] = arr[low + child]
+        root, child = child, 2 * child + 1
+    arr[low + root] = value
+
+def insertion_sort(arr, low, high):
+    # Sort the small range arr[low:high + 1], shifting larger elements right
+    for i in range(low + 1, high + 1):
+        value = arr[i]
+        j = i - 1
+        while j >= low and value < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = value
 
 # Test
-my_list = [64, 5, 25, 12, 22, 11, 90]
-quick_sort_in_place(my_list, 0, len(my_list) - 1)
-print("Sorted array:", my_list)
+if __name__ == "__main__":
+    my_list = [64, 5, 25, 12, 22, 11, 90]
+    quick_sort_in_place(my_list, 0, len(my_list) - 1)
+    print("Sorted array:", my_list)
+
+    events = [("login", 3), ("click", 1), ("logout", 3), ("view", 1)]
+    quick_sort_in_place(events, 0, len(events) - 1, key=lambda event: event[1])
+    print(events)  # Output: [('click', 1), ('view', 1), ('login', 3), ('logout', 3)]
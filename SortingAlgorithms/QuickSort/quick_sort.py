@@ -1,4 +1,21 @@
-def quick_sort(arr):
+try:
+    from ..sort_keys import sort_by_key
+except ImportError:  # Run as a script, or imported from its own directory: run ../sort_keys.py
+    import os
+    from runpy import run_path
+    sort_by_key = run_path(os.path.join(os.path.dirname(__file__), os.pardir, "sort_keys.py"))["sort_by_key"]
+
+
+def quick_sort(arr, key=None, reverse=False):
+    """
+    Returns a new sorted list; arr is left unchanged.
+
+    Stable: each partition keeps the input order of its elements.
+    key and reverse work as in sorted(), see sort_keys.py.
+    """
+    if key is not None or reverse:
+        return sort_by_key(quick_sort, arr, key, reverse)
+
     # Base case: a list of 1 or 0 elements is already sorted
     if len(arr) <= 1:
         return arr
@@ -15,6 +32,10 @@ def quick_sort(arr):
     return quick_sort(left) + middle + quick_sort(right)
 
 # Test
-my_list = [64, 5, 25, 12, 22, 11, 90]
-sorted_list = quick_sort(my_list)
-print("Sorted array:", sorted_list)
\ No newline at end of file
+if __name__ == "__main__":
+    my_list = [64, 5, 25, 12, 22, 11, 90]
+    sorted_list = quick_sort(my_list)
+    print("Sorted array:", sorted_list)
+
+    scores = {"ann": 71, "ben": 93, "cat": 85}
+    print(quick_sort(list(scores), key=scores.get, reverse=True))  # Output: ['ben', 'cat', 'ann']
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, Callable, List, Optional
 
 def counting_sort(arr: List[int], exp: int) -> None:
     """
@@ -29,13 +29,48 @@ def counting_sort(arr: List[int], exp: int) -> None:
     for i in range(n):
         arr[i] = output[i]
 
-def radix_sort(arr: List[int]) -> None:
+def counting_sort_order(order: List[int], keys: List[int], exp: int, reverse: bool) -> List[int]:
+    """
+    Returns the indexes of order, stably sorted by the digit of their key at 'exp' place:
+    from 9 to 0 when reverse is True.
+    """
+    count = [0] * 10
+    digits = [(keys[i] // exp) % 10 for i in order]
+    if reverse:
+        digits = [9 - digit for digit in digits]
+    for digit in digits:
+        count[digit] += 1
+    for i in range(1, 10):
+        count[i] += count[i - 1]
+
+    output = [0] * len(order)
+    for i in range(len(order) - 1, -1, -1):
+        count[digits[i]] -= 1
+        output[count[digits[i]]] = order[i]
+    return output
+
+def radix_sort(arr: List[Any], key: Optional[Callable[[Any], int]] = None, reverse: bool = False) -> None:
     """
     Main function to sort an array using Radix Sort algorithm.
+
+    The elements, or their key, are non-negative integers. Stable, reverse=True
+    included. With key or reverse, the keys are computed once and the digit
+    passes sort a list of indexes; the elements are moved once, at the end.
     """
     if not arr:
         return
 
+    if key is not None or reverse:
+        keys = arr if key is None else [key(item) for item in arr]
+        order = list(range(len(arr)))
+        max_key = max(keys)
+        exp = 1
+        while max_key // exp > 0:
+            order = counting_sort_order(order, keys, exp, reverse)
+            exp *= 10
+        arr[:] = [arr[i] for i in order]
+        return
+
     # Find the maximum number to determine the number of digits
     max_num = max(arr)
     
@@ -46,6 +81,12 @@ def radix_sort(arr: List[int]) -> None:
         exp *= 10
 
 # Example usage
-arr = [64, 5, 25, 12, 22, 11, 90, 329, 457, 657, 839, 436, 720, 355]
-radix_sort(arr)
-print("Sorted array:", arr)
\ No newline at end of file
+if __name__ == "__main__":
+    arr = [64, 5, 25, 12, 22, 11, 90, 329, 457, 657, 839, 436, 720, 355]
+    radix_sort(arr)
+    print("Sorted array:", arr)
+
+    # Files by size, largest first
+    files = [("a.log", 4096), ("b.txt", 12), ("c.bin", 65536), ("d.txt", 12)]
+    radix_sort(files, key=lambda file: file[1], reverse=True)
+    print(files)  # Output: [('c.bin', 65536), ('a.log', 4096), ('b.txt', 12), ('d.txt', 12)]
@@ -0,0 +1,289 @@
+import math
+import os
+import random
+from array import array
+from bisect import bisect_right
+from functools import partial
+from multiprocessing import Pool, shared_memory
+
+try:
+    from ..TimSort.tim_sort import tim_sort
+except ImportError:  # Run as a script, or imported from its own directory: run ../TimSort/tim_sort.py
+    from runpy import run_path
+    tim_sort = run_path(os.path.join(os.path.dirname(__file__), os.pardir, "TimSort", "tim_sort.py"))["tim_sort"]
+
+try:
+    import numpy as np
+except ImportError:  # Lists only
+    np = None
+
+BUCKETS_PER_WORKER = 4  # More buckets than workers, so that a slow bucket does not hold the others up
+OVERSAMPLING = 32  # Sample elements per bucket: more give more even buckets
+MAX_REFINEMENTS = 3  # Times an oversized bucket can be split again
+CLASSIFY_BLOCK = 1 << 20  # Elements classified per task: small temporaries, reused from one task to the next
+
+# Input and output buffers of the sort, attached once by each worker process
+_segment = None
+_elements = None
+
+
+def _attach(name, dtype, length):
+    """Pool initializer: maps the shared buffers into the worker, without copying them."""
+    global _segment, _elements
+    _segment = shared_memory.SharedMemory(name=name)
+    _elements = np.frombuffer(_segment.buf, dtype=dtype, count=length)
+
+
+def _touch(low, high):
+    """Writes zeros to _elements[low:high], so that the workers take the page faults of the fresh buffer in parallel."""
+    _elements[low:high] = 0
+
+
+def _classify(low, high, splitters):
+    """
+    Reorders the input block _elements[low:high] by bucket, keeping the order
+    of the elements of a bucket, and returns the size of each bucket in it.
+    """
+    block = _elements[low:high]
+    buckets = bucket_numbers(block, splitters)
+    block[:] = block[np.argsort(buckets, kind="stable")]
+    return np.bincount(buckets, minlength=2 * len(splitters) + 1)
+
+
+def _gather(pieces, out, sort):
+    """
+    Copies the pieces of one bucket, (low, high) bounds in the classified
+    input blocks, one after the other from _elements[out], then sorts them.
+    """
+    start = out
+    for low, high in pieces:
+        _elements[out:out + high - low] = _elements[low:high]
+        out += high - low
+    if sort:
+        _elements[start:out].sort()
+
+
+def _sort_range(low, high):
+    """Sorts the bucket _elements[low:high] in place."""
+    _elements[low:high].sort()
+
+
+def _sort_list(bucket, sort):
+    """Sorts a bucket sent to the worker, with tim_sort if sort is None, and sends it back."""
+    (sort or tim_sort)(bucket)
+    return bucket
+
+
+def choose_splitters(sample, oversampling):
+    """
+    Returns the distinct elements at every oversampling-th position of the
+    sorted sample: about len(sample) / oversampling - 1 splitters, which cut
+    the input into buckets of similar size.
+    """
+    candidates = sample[oversampling::oversampling]
+    return [value for k, value in enumerate(candidates) if k == 0 or candidates[k - 1] < value]
+
+
+def split_list(values, target, oversampling, rng, depth=0):
+    """
+    Returns the elements of values grouped into buckets, in order, as a list
+    of (bucket, is_sorted): splitting a bucket that has over twice target
+    elements again, at most MAX_REFINEMENTS times.
+
+    Elements equal to a splitter go to a bucket of their own, which is sorted
+    already: on skewed inputs, with a few values repeated many times, those
+    values do not pile up into one huge bucket. The buckets keep the input
+    order of their elements, so a stable sort of each keeps the whole sort stable.
+    """
+    bucket_count = math.ceil(len(values) / target)
+    sample = sorted(rng.choices(values, k=bucket_count * oversampling))
+    splitters = choose_splitters(sample, oversampling)
+
+    # Bucket 2i: between splitters i - 1 and i; bucket 2i + 1: equal to splitter i
+    buckets = [[] for _ in range(2 * len(splitters) + 1)]
+    for value in values:
+        i = bisect_right(splitters, value)
+        if i and not splitters[i - 1] < value:
+            buckets[2 * i - 1].append(value)
+        else:
+            buckets[2 * i].append(value)
+
+    result = []
+    for index, bucket in enumerate(buckets):
+        if index % 2 == 0 and len(bucket) > 2 * target and depth < MAX_REFINEMENTS:
+            result.extend(split_list(bucket, target, oversampling, rng, depth + 1))
+        elif bucket:
+            result.append((bucket, index % 2 == 1 or len(bucket) == 1))
+    return result
+
+
+def array_splitters(values, bucket_count, oversampling, rng):
+    """choose_splitters for a NumPy array: at most 2 ** 14, so that bucket numbers fit 16 bits."""
+    sample = np.sort(rng.choice(values, min(bucket_count, 2 ** 14) * oversampling))
+    return np.array(choose_splitters(sample, oversampling), dtype=values.dtype)
+
+
+def bucket_numbers(values, splitters):
+    """
+    Returns the bucket of each element of values, as in split_list: 2i between
+    splitters i - 1 and i, 2i + 1 equal to splitter i. One vectorized binary
+    search per element finds the first splitter not below it; a gather tells
+    if they are equal.
+    """
+    buckets = np.searchsorted(splitters, values, side="left")
+    equal = splitters.take(buckets, mode="clip") == values
+    buckets *= 2
+    buckets += equal
+    return buckets.astype(np.uint16)
+
+
+def split_array(values, out, start, target, oversampling, rng, depth=0):
+    """
+    The NumPy version of split_list: moves the elements of values, grouped
+    into buckets, to out[start:start + len(values)]. Returns the (low, high)
+    bounds in out of the buckets left to sort.
+
+    A stable argsort of the bucket numbers, a radix sort on 16-bit integers
+    in NumPy, gives the order in which to move the elements.
+    """
+    splitters = array_splitters(values, math.ceil(len(values) / target), oversampling, rng)
+    buckets = bucket_numbers(values, splitters)
+    out[start:start + len(values)] = values[np.argsort(buckets, kind="stable")]
+
+    bounds = start + np.concatenate(([0], np.cumsum(np.bincount(buckets, minlength=2 * len(splitters) + 1))))
+    ranges = []
+    for index in range(0, len(bounds) - 1, 2):  # Equal buckets are sorted already
+        low, high = int(bounds[index]), int(bounds[index + 1])
+        if high - low > 2 * target and depth < MAX_REFINEMENTS:
+            ranges.extend(split_array(out[low:high].copy(), out, low, target, oversampling, rng, depth + 1))
+        elif high - low > 1:
+            ranges.append((low, high))
+    return ranges
+
+
+def sample_sort(data, workers=None, oversampling=OVERSAMPLING, sort=tim_sort):
+    """
+    Sorts data, a list, array.array or one-dimensional NumPy array, in place,
+    with a pool of worker processes.
+
+    1. Splitters are picked from a sorted random sample of the data, with
+       oversampling elements per bucket, and cut the data into
+       workers * BUCKETS_PER_WORKER buckets of about the same size.
+       Oversized buckets get splitters of their own (split_list, split_array).
+    2. The workers sort the buckets, largest first: each bucket's elements
+       are all larger than the previous bucket's, so the sorted buckets
+       placed one after the other are the sorted data.
+
+    A NumPy array is copied into a shared memory buffer, where the workers
+    classify blocks of it with vectorized searches; then each worker gathers
+    the pieces of a bucket from all the blocks into an output buffer, in the
+    same segment, and sorts the bucket there with NumPy. Other sequences are
+    partitioned in Python, and each bucket is pickled to a worker, sorted
+    with sort and written back into data at its offset. That path compares
+    elements with < only, and is stable if sort is.
+
+    Args:
+        data: The elements to sort.
+        workers: Number of processes, os.cpu_count() by default.
+        oversampling: Sample elements per bucket.
+        sort: Function that sorts a list in place, for the buckets of a list:
+            tim_sort, or list.sort, which is written in C and much faster.
+            It runs in the workers, so it must be picklable.
+    """
+    n = len(data)
+    workers = workers or os.cpu_count() or 1
+    target = max(1, n // (workers * BUCKETS_PER_WORKER))  # Elements per bucket
+    if n < workers * BUCKETS_PER_WORKER * oversampling:
+        # Too small to be worth a pool
+        if np is not None and isinstance(data, np.ndarray):
+            data.sort()
+        else:
+            sorted_data = list(data)
+            sort(sorted_data)
+            data[:] = sorted_data if isinstance(data, list) else array(data.typecode, sorted_data)
+        return
+
+    if np is not None and isinstance(data, np.ndarray):
+        _sample_sort_array(data, workers, target, oversampling)
+        return
+
+    # Preallocated output: each sorted bucket is written at its final offset
+    output = [None] * n
+    buckets = split_list(list(data), target, oversampling, random.Random())
+    offsets = [0]
+    for bucket, _ in buckets:
+        offsets.append(offsets[-1] + len(bucket))
+    unsorted = sorted((k for k, (_, is_sorted) in enumerate(buckets) if not is_sorted),
+                      key=lambda k: -len(buckets[k][0]))
+    with Pool(workers) as pool:
+        for k, (bucket, is_sorted) in enumerate(buckets):
+            if is_sorted:
+                output[offsets[k]:offsets[k + 1]] = bucket
+        # tim_sort is not pickled but looked up by the workers: run from its file, it has no importable module
+        worker_sort = None if sort is tim_sort else sort
+        for k, bucket in zip(unsorted, pool.imap(partial(_sort_list, sort=worker_sort), [buckets[k][0] for k in unsorted])):
+            output[offsets[k]:offsets[k + 1]] = bucket
+    data[:] = output if isinstance(data, list) else array(data.typecode, output)
+
+
+def _sample_sort_array(data, workers, target, oversampling):
+    n = len(data)
+    segment = shared_memory.SharedMemory(create=True, size=2 * data.nbytes)
+    elements = np.frombuffer(segment.buf, dtype=data.dtype, count=2 * n)  # The input, then the output
+    try:
+        with Pool(workers, initializer=_attach, initargs=(segment.name, data.dtype.str, 2 * n)) as pool:
+            pool.starmap(_touch, [(2 * n * k // workers, 2 * n * (k + 1) // workers) for k in range(workers)])
+            elements[:n] = data
+
+            # The workers classify the input, block by block
+            rng = np.random.default_rng()
+            splitters = array_splitters(data, workers * BUCKETS_PER_WORKER, oversampling, rng)
+            block = min(CLASSIFY_BLOCK, -(-n // workers))
+            blocks = [(low, min(low + block, n)) for low in range(0, n, block)]
+            counts = np.array(pool.starmap(_classify, [(low, high, splitters) for low, high in blocks]))
+
+            # counts[k, b] elements of bucket b in block k: where each piece is, and where it goes
+            piece_starts = np.array([low for low, _ in blocks])[:, None] + np.cumsum(counts, axis=1) - counts
+            sizes = counts.sum(axis=0)
+            bucket_starts = n + np.cumsum(sizes) - sizes
+            piece_outs = bucket_starts + np.cumsum(counts, axis=0) - counts
+
+            tasks, oversized = [], []
+            for b in np.argsort(-sizes, kind="stable"):  # Largest first
+                if sizes[b] == 0:
+                    break
+                pieces = [(int(piece_starts[k, b]), int(piece_starts[k, b] + counts[k, b]))
+                          for k in range(len(blocks)) if counts[k, b]]
+                refine = b % 2 == 0 and sizes[b] > 2 * target
+                if refine:
+                    oversized.append((int(bucket_starts[b]), int(bucket_starts[b] + sizes[b])))
+                tasks.append((pieces, int(piece_outs[0, b]), b % 2 == 0 and not refine))
+            pool.starmap(_gather, tasks, chunksize=1)
+
+            # Buckets that the sample underestimated get splitters of their own
+            ranges = []
+            for low, high in oversized:
+                ranges.extend(split_array(elements[low:high].copy(), elements, low, target, oversampling, rng, 1))
+            ranges.sort(key=lambda bounds: bounds[0] - bounds[1])
+            pool.starmap(_sort_range, ranges, chunksize=1)
+
+        data[...] = elements[n:]
+    finally:
+        # The segment can only be closed once no view of it is left
+        del elements
+        segment.close()
+        segment.unlink()
+
+
+# Example usage
+if __name__ == "__main__":
+    numbers = [random.randrange(1_000) for _ in range(50_000)]
+    expected = sorted(numbers)
+    sample_sort(numbers, workers=4)
+    print(numbers == expected)  # Output: True
+
+    # Skewed: half of the elements are 0, which gets a bucket of its own
+    skewed = [0] * 25_000 + [random.random() for _ in range(25_000)]
+    random.shuffle(skewed)
+    sample_sort(skewed, workers=4)
+    print(skewed == sorted(skewed))  # Output: True
@@ -0,0 +1,68 @@
+import os
+import random
+import sys
+import time
+
+from sample_sort import np, sample_sort, tim_sort
+
+
+def skewed(n, rng):
+    """Half of the elements are 0: sampling alone would make one bucket hold them all."""
+    return [0.0 if rng.random() < 0.5 else rng.random() for _ in range(n)]
+
+
+def heavy_tailed(n, rng):
+    """Pareto distributed: most elements are small, a few are huge."""
+    return [rng.paretovariate(1.0) for _ in range(n)]
+
+
+DISTRIBUTIONS = {
+    "uniform": lambda n, rng: [rng.random() for _ in range(n)],
+    "skewed": skewed,
+    "heavy_tailed": heavy_tailed,
+    "sorted": lambda n, rng: [i / n for i in range(n)],
+}
+
+
+def best_time(sort, data, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        copy = data.copy()
+        start = time.perf_counter()
+        sort(copy)
+        best = min(best, time.perf_counter() - start)
+    return best, copy
+
+
+#############
+# Benchmark #
+#############
+if __name__ == "__main__":
+    # Sizes of the lists, then of the NumPy arrays
+    list_size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    array_size = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000_000
+    workers = os.cpu_count()
+    rng = random.Random(0)
+    print(f"{workers} workers, {'NumPy ' + np.__version__ if np is not None else 'no NumPy'}")
+
+    print(f"\nlist of {list_size:,} floats")
+    print(f"{'distribution':>13} {'sorted()':>10} {'tim_sort buckets':>17} {'ratio':>7} {'list.sort buckets':>18} {'ratio':>7}")
+    for name, make in DISTRIBUTIONS.items():
+        data = make(list_size, rng)
+        builtin, expected = best_time(list.sort, data)
+        row = f"{name:>13} {builtin:>9.3f}s"
+        for sort, width in ((tim_sort, 17), (list.sort, 18)):
+            seconds, result = best_time(lambda values: sample_sort(values, sort=sort), data, repeat=1)
+            assert result == expected
+            row += f" {seconds:>{width - 1}.3f}s {builtin / seconds:>6.2f}x"
+        print(row)
+
+    if np is not None:
+        print(f"\nNumPy array of {array_size:,} float64")
+        print(f"{'distribution':>13} {'numpy.sort':>11} {'sample_sort':>12} {'ratio':>7}")
+        for name, make in DISTRIBUTIONS.items():
+            data = np.array(make(array_size, rng))
+            reference, expected = best_time(np.ndarray.sort, data)
+            seconds, result = best_time(sample_sort, data)
+            assert np.array_equal(result, expected)
+            print(f"{name:>13} {reference:>10.3f}s {seconds:>11.3f}s {reference / seconds:>6.2f}x")
@@ -1,4 +1,23 @@
-def selection_sort(arr):
+try:
+    from ..sort_keys import sort_by_key
+except ImportError:  # Run as a script, or imported from its own directory: run ../sort_keys.py
+    import os
+    from runpy import run_path
+    sort_by_key = run_path(os.path.join(os.path.dirname(__file__), os.pardir, "sort_keys.py"))["sort_by_key"]
+
+
+def selection_sort(arr, key=None, reverse=False):
+    """
+    Sorts arr in place.
+
+    Not stable: swapping the minimum to the front can move an element past
+    an equal one. With key or reverse, ties are broken by position, so the
+    result is stable; see sort_keys.py.
+    """
+    if key is not None or reverse:
+        arr[:] = sort_by_key(selection_sort, arr, key, reverse)
+        return
+
     n = len(arr)
     for i in range(n):
         # Assume the minimum element is the first unsorted element
@@ -13,6 +32,11 @@ def selection_sort(arr):
             arr[i], arr[min_index] = arr[min_index], arr[i]
 
 # Example usage
-my_list = [12, 11, 13, 5, 6]
-selection_sort(my_list)
-print("Sorted array:", my_list)
\ No newline at end of file
+if __name__ == "__main__":
+    my_list = [12, 11, 13, 5, 6]
+    selection_sort(my_list)
+    print("Sorted array:", my_list)
+
+    cards = [(5, "hearts"), (2, "spades"), (5, "clubs"), (2, "hearts")]
+    selection_sort(cards, key=lambda card: card[0])
+    print(cards)  # Output: [(2, 'spades'), (2, 'hearts'), (5, 'hearts'), (5, 'clubs')]
@@ -1,21 +1,38 @@
-from typing import List
+from typing import Any, Callable, List, Optional
 
-def shell_sort(arr: List[int]) -> None:
+try:
+    from ..sort_keys import sort_by_key
+except ImportError:  # Run as a script, or imported from its own directory: run ../sort_keys.py
+    import os
+    from runpy import run_path
+    sort_by_key = run_path(os.path.join(os.path.dirname(__file__), os.pardir, "sort_keys.py"))["sort_by_key"]
+
+
+def shell_sort(arr: List[Any], key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> None:
     """
     Perform Shell Sort on a given list.
 
+    Not stable: the gapped passes move elements past equal ones that sit
+    between them. With key or reverse, ties are broken by position, so the
+    result is stable.
+
     Args:
-        arr (List[int]): The list of elements to be sorted.
+        arr (List[Any]): The list of elements to be sorted.
+        key (Callable, optional): Computes the sort key of each element, once per element.
+        reverse (bool): Sorts in descending order.
 
     Returns:
         None: The list is sorted in-place.
     """
+    if key is not None or reverse:
+        arr[:] = sort_by_key(shell_sort, arr, key, reverse)
+        return
+
     n = len(arr)
     gap = n //2  # Initialize the gap size
 
     # Continue sorting until the gap reduces to 0
     while gap > 0:
-        print(f"\nGap:{gap}")
         # Perform a gapped insertion sort
         for i in range(gap, n):
             # Save the current element to be positioned
@@ -37,7 +54,11 @@ def shell_sort(arr: List[int]) -> None:
 
 
 # Example usage
-sample_array = [5, 2, 9, 1, 7, 3, 8, 4, 6]
-print("Original Array:", sample_array)
-shell_sort(sample_array)
-print("Sorted Array:", sample_array)
\ No newline at end of file
+if __name__ == "__main__":
+    sample_array = [5, 2, 9, 1, 7, 3, 8, 4, 6]
+    print("Original Array:", sample_array)
+    shell_sort(sample_array)
+    print("Sorted Array:", sample_array)
+
+    shell_sort(sample_array, reverse=True)
+    print("Descending:", sample_array)  # Output: Descending: [9, 8, 7, 6, 5, 4, 3, 2, 1]
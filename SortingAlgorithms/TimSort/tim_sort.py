@@ -1,64 +1,474 @@
-from typing import List
-
-MIN_RUN = 33
-
-def insertion_sort(array: List[int], left: int, right: int) -> None:
-    """Sort a section of the array using Insertion Sort."""
-    for i in range(left + 1, right + 1):
-        key = array[i]
-        j = i - 1
-        while j >= left and array[j] > key:
-            array[j + 1] = array[j]
-            j -= 1
-        array[j + 1] = key
-
-def merge(array: List[int], left: int, mid: int, right: int) -> None:
-    """Merge two sorted subarrays into one sorted segment."""
-    left_part = array[left:mid + 1]
-    right_part = array[mid + 1:right + 1]
-
-    i = j = 0
-    k = left
-    while i < len(left_part) and j < len(right_part):
-        if left_part[i] <= right_part[j]:
-            array[k] = left_part[i]
-            i += 1
+from typing import Any, Callable, List, Optional, Sequence
+
+try:
+    from ..sort_keys import sort_by_key
+except ImportError:  # Run as a script, or imported from its own directory: run ../sort_keys.py
+    import os
+    from runpy import run_path
+    sort_by_key = run_path(os.path.join(os.path.dirname(__file__), os.pardir, "sort_keys.py"))["sort_by_key"]
+
+MIN_MERGE = 64  # Shorter arrays are sorted by binary insertion alone
+MIN_GALLOP = 7  # Initial number of consecutive wins that switches a merge to galloping
+
+
+def compute_minrun(n: int) -> int:
+    """
+    Returns the minimum run length for an array of n elements, between 32 and 64.
+
+    It is chosen so that n / minrun is a power of two or slightly less, which
+    keeps the final merges balanced: n's 6 leading bits, plus 1 if any of
+    the bits shifted out is set.
+    """
+    remainder = 0
+    while n >= MIN_MERGE:
+        remainder |= n & 1
+        n >>= 1
+    return n + remainder
+
+
+def count_run(array: List[Any], low: int, high: int) -> int:
+    """
+    Returns the length of the run starting at array[low], within array[low:high].
+
+    A run is either non-descending or strictly descending; a descending run
+    is reversed in place. Strictness keeps the sort stable: reversing never
+    swaps equal elements.
+    """
+    run_high = low + 1
+    if run_high == high:
+        return 1
+    if array[run_high] < array[low]:
+        run_high += 1
+        while run_high < high and array[run_high] < array[run_high - 1]:
+            run_high += 1
+        array[low:run_high] = array[low:run_high][::-1]
+    else:
+        run_high += 1
+        while run_high < high and not array[run_high] < array[run_high - 1]:
+            run_high += 1
+    return run_high - low
+
+
+def binary_insertion_sort(array: List[Any], low: int, high: int, start: int) -> None:
+    """
+    Sorts array[low:high], whose prefix array[low:start] is already sorted.
+
+    A binary search finds where each element goes, in O(log n) comparisons,
+    then one slice assignment shifts the larger elements right. An element
+    goes after the elements equal to it, which keeps the sort stable.
+    """
+    for i in range(start, high):
+        pivot = array[i]
+        left, right = low, i
+        while left < right:
+            middle = (left + right) >> 1
+            if pivot < array[middle]:
+                right = middle
+            else:
+                left = middle + 1
+        if left < i:
+            array[left + 1:i + 1] = array[left:i]
+            array[left] = pivot
+
+
+def gallop_left(key: Any, array: Sequence[Any], base: int, length: int, hint: int) -> int:
+    """
+    Returns k in [0, length] such that array[base + k - 1] < key <= array[base + k],
+    in array[base:base + length] sorted. The search starts at base + hint and
+    doubles its steps from there, so it costs O(log d) for an answer d away.
+    """
+    last_offset, offset = 0, 1
+    if array[base + hint] < key:
+        # Gallop right until array[base + hint + last_offset] < key <= array[base + hint + offset]
+        max_offset = length - hint
+        while offset < max_offset and array[base + hint + offset] < key:
+            last_offset, offset = offset, (offset << 1) + 1
+        offset = min(offset, max_offset)
+        last_offset, offset = last_offset + hint, offset + hint
+    else:
+        # Gallop left until array[base + hint - offset] < key <= array[base + hint - last_offset]
+        max_offset = hint + 1
+        while offset < max_offset and not array[base + hint - offset] < key:
+            last_offset, offset = offset, (offset << 1) + 1
+        offset = min(offset, max_offset)
+        last_offset, offset = hint - offset, hint - last_offset
+
+    # array[base + last_offset] < key <= array[base + offset]: binary search in between
+    last_offset += 1
+    while last_offset < offset:
+        middle = last_offset + ((offset - last_offset) >> 1)
+        if array[base + middle] < key:
+            last_offset = middle + 1
         else:
-            array[k] = right_part[j]
-            j += 1
-        k += 1
-
-    while i < len(left_part):
-        array[k] = left_part[i]
-        i += 1
-        k += 1
-
-    while j < len(right_part):
-        array[k] = right_part[j]
-        j += 1
-        k += 1
-
-def tim_sort(array: List[int]) -> None:
-    """Sort the array using TimSort algorithm."""
+            offset = middle
+    return offset
+
+
+def gallop_right(key: Any, array: Sequence[Any], base: int, length: int, hint: int) -> int:
+    """
+    Like gallop_left, but returns k such that array[base + k - 1] <= key < array[base + k]:
+    after the elements equal to key rather than before them.
+    """
+    last_offset, offset = 0, 1
+    if key < array[base + hint]:
+        # Gallop left until array[base + hint - offset] <= key < array[base + hint - last_offset]
+        max_offset = hint + 1
+        while offset < max_offset and key < array[base + hint - offset]:
+            last_offset, offset = offset, (offset << 1) + 1
+        offset = min(offset, max_offset)
+        last_offset, offset = hint - offset, hint - last_offset
+    else:
+        # Gallop right until array[base + hint + last_offset] <= key < array[base + hint + offset]
+        max_offset = length - hint
+        while offset < max_offset and not key < array[base + hint + offset]:
+            last_offset, offset = offset, (offset << 1) + 1
+        offset = min(offset, max_offset)
+        last_offset, offset = last_offset + hint, offset + hint
+
+    last_offset += 1
+    while last_offset < offset:
+        middle = last_offset + ((offset - last_offset) >> 1)
+        if key < array[base + middle]:
+            offset = middle
+        else:
+            last_offset = middle + 1
+    return offset
+
+
+class _MergeState:
+    """
+    The stack of pending runs of one sort, and the merges between them.
+
+    Runs are pushed from left to right as (base, length). The lengths on the
+    stack keep decreasing at least as fast as the Fibonacci numbers, so the
+    stack holds O(log n) runs and every merge is between runs of similar size.
+    """
+
+    def __init__(self, array: List[Any]):
+        self.array = array
+        self.runs: List[List[int]] = []  # [base, length] of the pending runs
+        self.min_gallop = MIN_GALLOP
+
+    def push_run(self, base: int, length: int) -> None:
+        self.runs.append([base, length])
+
+    def merge_collapse(self) -> None:
+        """
+        Merges runs until the invariants hold again for the top of the stack:
+        1. runs[i - 2] > runs[i - 1] + runs[i]
+        2. runs[i - 1] > runs[i]
+        Checking the invariant one run deeper than the top three, as the
+        corrected CPython and Java versions do, keeps it true on the whole stack.
+        """
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if ((n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1])
+                    or (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1])):
+                if runs[n - 1][1] < runs[n + 1][1]:
+                    n -= 1
+            elif runs[n][1] > runs[n + 1][1]:
+                break
+            self.merge_at(n)
+
+    def merge_force_collapse(self) -> None:
+        """Merges all the runs left on the stack, once the whole array is split into runs."""
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+            self.merge_at(n)
+
+    def merge_at(self, i: int) -> None:
+        """Merges the adjacent runs i and i + 1 of the stack."""
+        array = self.array
+        base1, length1 = self.runs[i]
+        base2, length2 = self.runs[i + 1]
+        self.runs[i][1] = length1 + length2
+        del self.runs[i + 1]
+
+        # Elements of run 1 before the first of run 2 are already in place
+        k = gallop_right(array[base2], array, base1, length1, 0)
+        base1 += k
+        length1 -= k
+        if length1 == 0:
+            return
+        # Elements of run 2 after the last of run 1 are already in place
+        length2 = gallop_left(array[base1 + length1 - 1], array, base2, length2, length2 - 1)
+        if length2 == 0:
+            return
+
+        # Copy out only the smaller run
+        if length1 <= length2:
+            self.merge_low(base1, length1, base2, length2)
+        else:
+            self.merge_high(base1, length1, base2, length2)
+
+    def merge_low(self, base1: int, length1: int, base2: int, length2: int) -> None:
+        """
+        Merges two adjacent runs from left to right, with length1 <= length2.
+
+        Only run 1 is copied out; the merge fills its place, always behind the
+        unread part of run 2. The first element of run 2 goes first and the
+        last of run 1 goes last, as merge_at established.
+        """
+        array = self.array
+        temp = array[base1:base1 + length1]
+        cursor1, cursor2, destination = 0, base2, base1
+        array[destination] = array[cursor2]
+        destination += 1
+        cursor2 += 1
+        length2 -= 1
+        if length2 == 0:
+            array[destination:destination + length1] = temp[cursor1:cursor1 + length1]
+            return
+        if length1 == 1:
+            array[destination:destination + length2] = array[cursor2:cursor2 + length2]
+            array[destination + length2] = temp[cursor1]
+            return
+
+        min_gallop = self.min_gallop
+        done = False
+        while not done:
+            count1 = count2 = 0  # Consecutive wins of each run
+
+            # One element at a time, until a run wins min_gallop times in a row
+            while True:
+                if array[cursor2] < temp[cursor1]:
+                    array[destination] = array[cursor2]
+                    destination += 1
+                    cursor2 += 1
+                    count2 += 1
+                    count1 = 0
+                    length2 -= 1
+                    if length2 == 0:
+                        done = True
+                        break
+                else:
+                    array[destination] = temp[cursor1]
+                    destination += 1
+                    cursor1 += 1
+                    count1 += 1
+                    count2 = 0
+                    length1 -= 1
+                    if length1 == 1:
+                        done = True
+                        break
+                if count1 >= min_gallop or count2 >= min_gallop:
+                    break
+            if done:
+                break
+
+            # Galloping: search where the next element of each run goes, then move whole slices
+            while True:
+                count1 = gallop_right(array[cursor2], temp, cursor1, length1, 0)
+                if count1:
+                    array[destination:destination + count1] = temp[cursor1:cursor1 + count1]
+                    destination += count1
+                    cursor1 += count1
+                    length1 -= count1
+                    if length1 <= 1:
+                        done = True
+                        break
+                array[destination] = array[cursor2]
+                destination += 1
+                cursor2 += 1
+                length2 -= 1
+                if length2 == 0:
+                    done = True
+                    break
+
+                count2 = gallop_left(temp[cursor1], array, cursor2, length2, 0)
+                if count2:
+                    array[destination:destination + count2] = array[cursor2:cursor2 + count2]
+                    destination += count2
+                    cursor2 += count2
+                    length2 -= count2
+                    if length2 == 0:
+                        done = True
+                        break
+                array[destination] = temp[cursor1]
+                destination += 1
+                cursor1 += 1
+                length1 -= 1
+                if length1 == 1:
+                    done = True
+                    break
+
+                min_gallop -= 1  # Galloping pays off: stay longer next time
+                if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                    break
+            if done:
+                break
+            min_gallop = max(min_gallop, 0) + 2  # Penalty for leaving galloping mode
+        self.min_gallop = max(min_gallop, 1)
+
+        if length1 == 1:
+            array[destination:destination + length2] = array[cursor2:cursor2 + length2]
+            array[destination + length2] = temp[cursor1]
+        elif length1:
+            # Run 2 is exhausted: the rest of run 1 closes the merge
+            array[destination:destination + length1] = temp[cursor1:cursor1 + length1]
+
+    def merge_high(self, base1: int, length1: int, base2: int, length2: int) -> None:
+        """
+        Merges two adjacent runs from right to left, with length1 > length2.
+
+        The mirror image of merge_low: only run 2 is copied out, and the merge
+        fills the array from its end.
+        """
+        array = self.array
+        temp = array[base2:base2 + length2]
+        cursor1, cursor2, destination = base1 + length1 - 1, length2 - 1, base2 + length2 - 1
+        array[destination] = array[cursor1]
+        destination -= 1
+        cursor1 -= 1
+        length1 -= 1
+        if length1 == 0:
+            array[destination - length2 + 1:destination + 1] = temp[:length2]
+            return
+        if length2 == 1:
+            destination -= length1
+            cursor1 -= length1
+            array[destination + 1:destination + 1 + length1] = array[cursor1 + 1:cursor1 + 1 + length1]
+            array[destination] = temp[cursor2]
+            return
+
+        min_gallop = self.min_gallop
+        done = False
+        while not done:
+            count1 = count2 = 0
+
+            while True:
+                if temp[cursor2] < array[cursor1]:
+                    array[destination] = array[cursor1]
+                    destination -= 1
+                    cursor1 -= 1
+                    count1 += 1
+                    count2 = 0
+                    length1 -= 1
+                    if length1 == 0:
+                        done = True
+                        break
+                else:
+                    array[destination] = temp[cursor2]
+                    destination -= 1
+                    cursor2 -= 1
+                    count2 += 1
+                    count1 = 0
+                    length2 -= 1
+                    if length2 == 1:
+                        done = True
+                        break
+                if count1 >= min_gallop or count2 >= min_gallop:
+                    break
+            if done:
+                break
+
+            while True:
+                count1 = length1 - gallop_right(temp[cursor2], array, base1, length1, length1 - 1)
+                if count1:
+                    destination -= count1
+                    cursor1 -= count1
+                    length1 -= count1
+                    array[destination + 1:destination + 1 + count1] = array[cursor1 + 1:cursor1 + 1 + count1]
+                    if length1 == 0:
+                        done = True
+                        break
+                array[destination] = temp[cursor2]
+                destination -= 1
+                cursor2 -= 1
+                length2 -= 1
+                if length2 == 1:
+                    done = True
+                    break
+
+                count2 = length2 - gallop_left(array[cursor1], temp, 0, length2, length2 - 1)
+                if count2:
+                    destination -= count2
+                    cursor2 -= count2
+                    length2 -= count2
+                    array[destination + 1:destination + 1 + count2] = temp[cursor2 + 1:cursor2 + 1 + count2]
+                    if length2 <= 1:
+                        done = True
+                        break
+                array[destination] = array[cursor1]
+                destination -= 1
+                cursor1 -= 1
+                length1 -= 1
+                if length1 == 0:
+                    done = True
+                    break
+
+                min_gallop -= 1
+                if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                    break
+            if done:
+                break
+            min_gallop = max(min_gallop, 0) + 2
+        self.min_gallop = max(min_gallop, 1)
+
+        if length2 == 1:
+            destination -= length1
+            cursor1 -= length1
+            array[destination + 1:destination + 1 + length1] = array[cursor1 + 1:cursor1 + 1 + length1]
+            array[destination] = temp[cursor2]
+        elif length2:
+            # Run 1 is exhausted: the rest of run 2 opens the merge
+            array[destination - length2 + 1:destination + 1] = temp[:length2]
+
+
+def tim_sort(array: List[Any], key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> None:
+    """
+    Sort the array in place using the TimSort algorithm. The sort is stable.
+
+    The array is split into natural runs, extended to minrun elements by
+    binary insertion sort when shorter. The runs are merged as they are found,
+    keeping the run stack balanced. Sorted, reversed and otherwise presorted
+    inputs (a few runs) take O(n) comparisons; any input takes O(n log n).
+    Elements are only compared with <.
+
+    key and reverse work as in sorted(): each key is computed once, see sort_keys.py.
+    """
+    if key is not None or reverse:
+        array[:] = sort_by_key(tim_sort, array, key, reverse)
+        return
+
     n = len(array)
+    if n < 2:
+        return
+    if n < MIN_MERGE:
+        binary_insertion_sort(array, 0, n, count_run(array, 0, n))
+        return
+
+    state = _MergeState(array)
+    minrun = compute_minrun(n)
+    low = 0
+    while low < n:
+        run = count_run(array, low, n)
+        if run < minrun:
+            forced = min(minrun, n - low)
+            binary_insertion_sort(array, low, low + forced, low + run)
+            run = forced
+        state.push_run(low, run)
+        state.merge_collapse()
+        low += run
+    state.merge_force_collapse()
 
-    # Divide the array into runs of size MIN_RUN and sort each run
-    for start in range(0, n, MIN_RUN):
-        end = min(start + MIN_RUN - 1, n - 1)
-        insertion_sort(array, start, end)
-
-    # Merge runs iteratively
-    size = MIN_RUN
-    while size < n:
-        for left in range(0, n, 2 * size):
-            mid = min(left + size - 1, n - 1)
-            right = min(left + 2 * size - 1, n - 1)
-            if mid < right:
-                merge(array, left, mid, right)
-        size *= 2
 
 # Example usage
 if __name__ == "__main__":
     arr = [5, 2, 3, 8, 7, 6, 1, 4]
     tim_sort(arr)
-    print(arr)  # Output: [1, 2, 3, 4, 5, 6, 7, 8]
\ No newline at end of file
+    print(arr)  # Output: [1, 2, 3, 4, 5, 6, 7, 8]
+
+    # Presorted data: two ascending runs and a descending one, merged in a few steps
+    log = list(range(0, 100, 2)) + list(range(1, 100, 2)) + list(range(150, 100, -1))
+    tim_sort(log)
+    print(log == sorted(log), compute_minrun(len(log)))  # Output: True 38
+
+    # Log records by timestamp, newest first; records with the same timestamp keep their order
+    records = [(12, "start"), (15, "retry"), (12, "connect"), (19, "done")]
+    tim_sort(records, key=lambda record: record[0], reverse=True)
+    print(records)  # Output: [(19, 'done'), (15, 'retry'), (12, 'start'), (12, 'connect')]
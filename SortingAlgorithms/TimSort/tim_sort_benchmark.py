@@ -0,0 +1,62 @@
+import os
+import random
+import sys
+import time
+
+from tim_sort import tim_sort
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from instrumentation import count_operations
+
+
+def late_arrivals(n, rng):
+    """Log timestamps: ascending, but each record may arrive up to 16 ticks late."""
+    return [i + rng.randrange(16) for i in range(n)]
+
+
+def merged_streams(n, rng, streams=8):
+    """The sorted logs of several servers, concatenated."""
+    return [value for _ in range(streams) for value in sorted(rng.randrange(n) for _ in range(n // streams))]
+
+
+def appended(n, rng):
+    """A sorted log with 1% of new, unsorted records appended."""
+    tail = max(1, n // 100)
+    return list(range(n - tail)) + [rng.randrange(n) for _ in range(tail)]
+
+
+DISTRIBUTIONS = {
+    "sorted": lambda n, rng: list(range(n)),
+    "reversed": lambda n, rng: list(range(n, 0, -1)),
+    "late_arrivals": late_arrivals,
+    "merged_streams": merged_streams,
+    "appended": appended,
+    "random": lambda n, rng: [rng.random() for _ in range(n)],
+}
+
+
+def best_time(sort, data, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        copy = list(data)
+        start = time.perf_counter()
+        sort(copy)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+#############
+# Benchmark #
+#############
+if __name__ == "__main__":
+    sizes = [int(size) for size in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    rng = random.Random(0)
+    print(f"{'distribution':>15} {'n':>10} {'ns/element':>11} {'compares/n':>11} {'list.sort ns/el':>16}")
+    for name, make in DISTRIBUTIONS.items():
+        for n in sizes:
+            data = make(n, rng)
+            seconds = best_time(tim_sort, data)
+            builtin = best_time(list.sort, data)
+            comparisons = count_operations(tim_sort, data)["comparisons"] if n <= 1_000_000 else None
+            print(f"{name:>15} {n:>10,} {seconds / n * 1e9:>11.0f} "
+                  f"{'-' if comparisons is None else format(comparisons / n, '.2f'):>11} {builtin / n * 1e9:>16.1f}")
@@ -0,0 +1,99 @@
+"""
+Operation counts for the sorting algorithms.
+
+The sorts themselves are not instrumented, so they run at full speed: the
+counting happens in the data. Elements are wrapped in Counted, which counts
+every comparison between them, inside a CountingList, which counts every
+write into it (the moves of an in-place sort):
+
+    counters = count_operations(shell_sort, [5, 2, 9, 1, 7])
+    print(counters)  # Counter({'comparisons': ..., 'moves': ...})
+
+Non-comparison sorts (counting, radix, bucket) do arithmetic on the values
+and cannot run on wrapped elements.
+"""
+from collections import Counter
+from typing import Any, Callable, Iterable
+
+
+class Counted:
+    """Wraps a value and counts every comparison made with another wrapped value."""
+    __slots__ = ("value", "counters")
+
+    def __init__(self, value, counters: Counter):
+        self.value = value
+        self.counters = counters
+
+    def __lt__(self, other):
+        self.counters["comparisons"] += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        self.counters["comparisons"] += 1
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        self.counters["comparisons"] += 1
+        return self.value > other.value
+
+    def __ge__(self, other):
+        self.counters["comparisons"] += 1
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        self.counters["comparisons"] += 1
+        return self.value == other.value
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Counted({self.value!r})"
+
+
+class CountingList(list):
+    """A list that counts the element writes made into it in counters["moves"]."""
+
+    def __init__(self, iterable: Iterable = (), counters: Counter = None):
+        super().__init__(iterable)
+        self.counters = Counter() if counters is None else counters
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self.counters["moves"] += len(value)
+        else:
+            self.counters["moves"] += 1
+        super().__setitem__(index, value)
+
+
+def count_operations(sort: Callable[[list], Any], data: Iterable) -> Counter:
+    """
+    Runs a sort on a copy of data and returns its counters: "comparisons",
+    and "moves" when the sort works in place (a sort that builds a new list
+    writes nothing into its input).
+    """
+    counters = Counter()
+    counted = CountingList((Counted(value, counters) for value in data), counters)
+    result = sort(counted)
+    if result is not None and result is not counted:
+        counters.pop("moves", None)
+    else:
+        counters["moves"] += 0  # Present, even when the input was already sorted
+    return counters
+
+
+# Example usage
+if __name__ == "__main__":
+    from random import Random
+
+    def insertion_sort(arr):
+        for i in range(1, len(arr)):
+            key, j = arr[i], i - 1
+            while j >= 0 and arr[j] > key:
+                arr[j + 1] = arr[j]
+                j -= 1
+            arr[j + 1] = key
+
+    data = Random(0).sample(range(1000), 100)
+    print(count_operations(insertion_sort, data))  # Output: Counter({'moves': 2730, 'comparisons': 2726})
+    print(count_operations(sorted, data))  # Output: Counter({'comparisons': 538})
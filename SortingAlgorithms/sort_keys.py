@@ -0,0 +1,46 @@
+"""
+key= and reverse= for the comparison sorts of SortingAlgorithms.
+
+The sorts compare elements directly. To sort by a derived key, the key of
+every element is computed once into a list of (key, index) pairs; the sort
+runs on the pairs, then the elements are permuted by the sorted indexes:
+
+- an expensive key function runs n times, not once per comparison;
+- no two pairs are equal, so equal keys keep their input order and the
+  result is stable, even when the algorithm itself is not (heap sort);
+- reverse=True sorts the reversed input and reverses the result: equal keys
+  still keep their input order, as with sorted(reverse=True).
+
+Comparing pairs costs a little more than comparing bare elements, so the
+sorts take this path only when key or reverse is given.
+"""
+from typing import Any, Callable, List, Optional, Sequence
+
+
+def sort_by_key(sort: Callable[[list], Optional[list]], items: Sequence[Any],
+                key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> List[Any]:
+    """
+    Returns a new list of items, sorted by key with sort, stably.
+
+    sort receives a list of (key, index) pairs and either sorts it in place
+    or returns it sorted. items is left unchanged.
+    """
+    if reverse:
+        items = items[::-1]
+    if key is None:
+        pairs = [(item, index) for index, item in enumerate(items)]
+    else:
+        pairs = [(key(item), index) for index, item in enumerate(items)]
+    result = sort(pairs)
+    if result is not None:
+        pairs = result
+    if reverse:
+        pairs.reverse()
+    return [items[index] for _, index in pairs]
+
+
+# Example usage
+if __name__ == "__main__":
+    orders = [("bob", 30), ("amy", 10), ("cal", 30), ("dan", 20)]
+    by_amount = sort_by_key(list.sort, orders, key=lambda order: order[1], reverse=True)
+    print(by_amount)  # Output: [('bob', 30), ('cal', 30), ('dan', 20), ('amy', 10)]
@@ -0,0 +1,411 @@
+"""
+Benchmark suite for every sort in SortingAlgorithms.
+
+Each sort runs on every input distribution at growing sizes. A run records
+wall time, peak memory (tracemalloc) and, for comparison sorts, comparison
+and move counts. Every sort is also run with key= and reverse= on records
+with duplicate keys, to check that it sorts them stably, and every sort
+module is imported from its own directory, to check that it needs no
+sys.path setup. Results go to JSON and/or CSV, and can be compared with a
+stored baseline to catch regressions:
+
+    python sorting_benchmark.py --sizes 10 1000 100000 --json results.json
+    python sorting_benchmark.py --baseline results.json --json new.json
+"""
+import argparse
+import bisect
+import contextlib
+import csv
+import functools
+import glob
+import importlib.util
+import io
+import itertools
+import json
+import operator
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from instrumentation import count_operations
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+DISTRIBUTIONS = ("random", "sorted", "reversed", "sawtooth", "few_unique", "nearly_sorted", "zipf")
+SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+RESULT_FIELDS = ("sort", "distribution", "size", "status", "seconds", "peak_bytes", "comparisons", "moves")
+
+
+def load(relative_path, name):
+    """Loads a function from a sort module: each sort lives in its own directory."""
+    module_name = os.path.splitext(relative_path)[0].replace("/", "_")  # For example "MergeSort_merge_sort"
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(ROOT, relative_path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, name)
+
+
+def make_input(distribution, n, rng):
+    """Returns n non-negative integers below max(n, 10) with the given shape."""
+    if distribution == "random":
+        return [rng.randrange(n) for _ in range(n)]
+    if distribution == "sorted":
+        return list(range(n))
+    if distribution == "reversed":
+        return list(range(n - 1, -1, -1))
+    if distribution == "sawtooth":
+        tooth = max(2, int(n ** 0.5))  # About sqrt(n) ascending runs
+        return [i % tooth for i in range(n)]
+    if distribution == "few_unique":
+        return [rng.randrange(10) for _ in range(n)]
+    if distribution == "nearly_sorted":
+        data = list(range(n))
+        for _ in range(max(1, n // 100)):  # Swap 1% of the elements
+            i, j = rng.randrange(n), rng.randrange(n)
+            data[i], data[j] = data[j], data[i]
+        return data
+    if distribution == "zipf":
+        # Value k is drawn with probability proportional to 1 / (k + 1) ** 1.1
+        cumulative = list(itertools.accumulate(1 / (k + 1) ** 1.1 for k in range(n)))
+        total = cumulative[-1]
+        return [bisect.bisect_left(cumulative, rng.random() * total) for _ in range(n)]
+    raise ValueError(f"Unknown distribution: {distribution}")
+
+
+def returns_list(function):
+    return lambda data: function(data)
+
+
+def in_place(function):
+    def run(data):
+        function(data)
+        return data
+    return run
+
+
+def in_place_bounds(function):
+    def run(data):
+        function(data, 0, len(data) - 1)
+        return data
+    return run
+
+
+def bucket_sort_run(function):
+    # bucket_sort expects floats in [0, 1)
+    def prepare(data):
+        scale = max(data) + 1
+        return [value / scale for value in data]
+    return prepare, returns_list(function)
+
+
+def external_sort_run(function):
+    """external_sort sorts the lines of a file, with temporary run files in the current directory."""
+    def prepare(data):
+        width = len(str(max(data)))
+        return [str(value).zfill(width) for value in data]  # Zero padding: text order is numeric order
+
+    def run(lines):
+        previous = os.getcwd()
+        with tempfile.TemporaryDirectory() as directory:
+            os.chdir(directory)
+            try:
+                with open("input.txt", "w") as file:
+                    file.write("\n".join(lines) + "\n")
+                function("input.txt", "output.txt", max(1, len(lines) // 16))
+                with open("output.txt") as file:
+                    return file.read().split()
+            finally:
+                os.chdir(previous)
+    return prepare, run
+
+
+# name: (module, function, runner, is a comparison sort, is quadratic)
+SORTS = {
+    "bubble": ("BubbleSort/bubble_sort.py", "bubble_sort", in_place, True, True),
+    "insertion": ("InsertionSort/insertion_sort.py", "insertion_sort", in_place, True, True),
+    "selection": ("SelectionSort/selection_sort.py", "selection_sort", in_place, True, True),
+    "shell": ("ShellSort/shell_sort.py", "shell_sort", in_place, True, False),
+    "heap": ("HeapSort/heap_sort.py", "heap_sort", in_place, True, False),
+    "merge": ("MergeSort/merge_sort.py", "merge_sort", returns_list, True, False),
+    "best_merge": ("MergeSort/best_merge_sort.py", "merge_sort", in_place_bounds, True, False),
+    "quick": ("QuickSort/quick_sort.py", "quick_sort", returns_list, True, False),
+    "best_quick": ("QuickSort/best_quick_sort.py", "quick_sort_in_place", in_place_bounds, True, False),
+    "tim": ("TimSort/tim_sort.py", "tim_sort", in_place, True, False),
+    "counting": ("CountingSort/counting_sort.py", "counting_sort", returns_list, False, False),
+    "radix": ("RadixSort/radix_sort.py", "radix_sort", in_place, False, False),
+    "bucket": ("BucketSort/bucket_sort.py", "bucket_sort", bucket_sort_run, False, False),
+    "external": ("ExternalSort/external_sort.py", "external_sort", external_sort_run, False, False),
+    "builtin": (None, None, None, True, False),  # Python's sorted(), as a reference
+}
+
+
+def get_runner(name, **keywords):
+    """
+    Returns (prepare, run): prepare turns the integers into the sort's input, outside the timing.
+    keywords, such as key and reverse, are passed to the sort on every call.
+    """
+    path, function_name, runner, _, _ = SORTS[name]
+    if path is None:
+        function, runner = sorted, returns_list
+    else:
+        function = load(path, function_name)
+    result = runner(functools.partial(function, **keywords) if keywords else function)
+    if isinstance(result, tuple):
+        return result
+    return list, result
+
+
+def keyed_records(name, data):
+    """
+    Returns (records, key): one record per integer of data, whose key is that
+    integer, converted to the sort's input type, plus the position of the record
+    to tell equal keys apart.
+    """
+    if name == "bucket":
+        scale = max(data) + 1
+        return [(value / scale, i) for i, value in enumerate(data)], operator.itemgetter(0)
+    if name == "external":
+        # Lines "<zero padded key>:<position>": key is the part before the colon
+        width = len(str(max(data)))
+        return [f"{value:0{width}d}:{i}" for i, value in enumerate(data)], lambda line: line[:width]
+    return [(value, i) for i, value in enumerate(data)], operator.itemgetter(0)
+
+
+def check_keys(name, size, seed):
+    """
+    Sorts records with few distinct keys by key, with reverse False then True,
+    and compares the results with sorted(). Returns a record per run, whose
+    status is "ok", "wrong output" (keys out of order) or "unstable" (equal keys
+    out of their input order).
+    """
+    records, key = keyed_records(name, make_input("few_unique", size, random.Random(f"{seed}-keys")))
+    checks = []
+    for reverse in (False, True):
+        _, run = get_runner(name, key=key, reverse=reverse)
+        expected = sorted(records, key=key, reverse=reverse)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = run(list(records))
+        except (RecursionError, MemoryError) as error:
+            status = type(error).__name__
+        else:
+            if [key(record) for record in result] != [key(record) for record in expected]:
+                status = "wrong output"
+            elif result != expected:
+                status = "unstable"
+            else:
+                status = "ok"
+        checks.append({"sort": name, "size": size, "reverse": reverse, "status": status})
+    return checks
+
+
+def measure(name, runner, distribution, size, rng, args):
+    """Runs one sort on one input; returns a result record."""
+    prepare, run = runner
+    record = dict.fromkeys(RESULT_FIELDS)
+    record.update(sort=name, distribution=distribution, size=size)
+    data = prepare(make_input(distribution, size, rng))
+    expected = sorted(data)
+
+    try:
+        best = None
+        for _ in range(args.repeat):
+            copy = list(data)
+            with contextlib.redirect_stdout(io.StringIO()):  # Some sorts print their progress
+                start = time.perf_counter()
+                result = run(copy)
+                elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        record["seconds"] = best
+        if result != expected:
+            record["status"] = "wrong output"
+            return record
+
+        if size <= args.memory_max_size:
+            copy = list(data)
+            with contextlib.redirect_stdout(io.StringIO()):
+                tracemalloc.start()
+                run(copy)
+                record["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+
+        if SORTS[name][3] and size <= args.count_max_size:
+            with contextlib.redirect_stdout(io.StringIO()):
+                counters = count_operations(run, data)
+                record["comparisons"], record["moves"] = counters["comparisons"], counters.get("moves")
+    except (RecursionError, MemoryError) as error:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        record["status"] = type(error).__name__
+        return record
+    record["status"] = "ok"
+    return record
+
+
+def run_suite(args):
+    results = []
+    header = f"{'sort':>11} {'distribution':>13} {'size':>10} {'status':>14} {'seconds':>10} {'peak KiB':>10} {'comparisons':>12} {'moves':>12}"
+    print(header)
+    for name in args.sorts:
+        quadratic = SORTS[name][4]
+        runner = get_runner(name)
+        for distribution in args.distributions:
+            last = None  # (size, seconds) of the last completed run
+            stopped = False
+            for size in sorted(args.sizes):
+                rng = random.Random(f"{args.seed}-{distribution}-{size}")  # Same input for every sort
+                if stopped:
+                    record = dict.fromkeys(RESULT_FIELDS)
+                    record.update(sort=name, distribution=distribution, size=size, status="skipped")
+                elif last and last[1] * (size / last[0]) ** (2 if quadratic else 1.2) > args.time_cap:
+                    # The estimate from the last size exceeds the time cap: skip this size and larger ones
+                    stopped = True
+                    record = dict.fromkeys(RESULT_FIELDS)
+                    record.update(sort=name, distribution=distribution, size=size, status="skipped")
+                else:
+                    record = measure(name, runner, distribution, size, rng, args)
+                    if record["status"] == "ok":
+                        last = (size, record["seconds"])
+                    else:
+                        stopped = True  # An error or a wrong output only gets worse with the size
+                results.append(record)
+                print(format_record(record))
+    return results
+
+
+def run_key_checks(args):
+    """Runs check_keys for every sort; returns the checks."""
+    print(f"\nkey= and reverse= on {args.key_check_size:,} records with 10 distinct keys")
+    checks = []
+    for name in args.sorts:
+        results = check_keys(name, args.key_check_size, args.seed)
+        print(f"{name:>11}  " + "  ".join(f"reverse={check['reverse']!s:<5} {check['status']}" for check in results))
+        checks.extend(results)
+    return checks
+
+
+def check_imports():
+    """
+    Imports every sort module in a fresh interpreter started in the module's
+    own directory, as a script there would, and checks that sys.path is left
+    unchanged. Returns the modules that failed.
+    """
+    failed = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "*", "*sort.py"))):
+        module = os.path.splitext(os.path.basename(path))[0]
+        code = f"import sys; before = list(sys.path); import {module}; assert sys.path == before, 'sys.path changed'"
+        result = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(path), capture_output=True, text=True)
+        if result.returncode:
+            failed.append(os.path.relpath(path, ROOT))
+            print(f"import {os.path.relpath(path, ROOT)} failed: {result.stderr.strip().splitlines()[-1]}")
+    return failed
+
+
+def format_record(record):
+    def show(value, scale=1, digits=0):
+        return "-" if value is None else f"{value / scale:,.{digits}f}"
+    return (
+        f"{record['sort']:>11} {record['distribution']:>13} {record['size']:>10,} {record['status']:>14} "
+        f"{show(record['seconds'], digits=4):>10} {show(record['peak_bytes'], 1024):>10} "
+        f"{show(record['comparisons']):>12} {show(record['moves']):>12}"
+    )
+
+
+def write_json(path, results, key_checks, args):
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "seed": args.seed,
+        "results": results,
+        "key_checks": key_checks,
+    }
+    with open(path, "w") as file:
+        json.dump(report, file, indent=1)
+
+
+def write_csv(path, results):
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def compare_with_baseline(path, results, tolerance, noise_floor=0.001):
+    """
+    Prints the runs slower than the baseline by more than tolerance (a fraction),
+    or making more comparisons, and returns how many there are.
+
+    Runs under noise_floor seconds in both reports are too short to time reliably.
+    Comparison counts are deterministic for a given seed, so any increase is reported.
+    """
+    with open(path) as file:
+        baseline = {
+            (record["sort"], record["distribution"], record["size"]): record
+            for record in json.load(file)["results"]
+        }
+    regressions = 0
+    print(f"\nComparison with {path} (tolerance {tolerance:.0%})")
+    for record in results:
+        old = baseline.get((record["sort"], record["distribution"], record["size"]))
+        if old is None or old["status"] != "ok":
+            continue
+        where = f"{record['sort']} / {record['distribution']} / {record['size']:,}"
+        if record["status"] != "ok":
+            print(f"REGRESSION {where}: {record['status']} (baseline ok)")
+            regressions += 1
+            continue
+        if max(record["seconds"], old["seconds"]) >= noise_floor and record["seconds"] > old["seconds"] * (1 + tolerance):
+            print(f"REGRESSION {where}: {old['seconds']:.4f}s -> {record['seconds']:.4f}s "
+                  f"({record['seconds'] / old['seconds']:.2f}x)")
+            regressions += 1
+        if None not in (record["comparisons"], old["comparisons"]) and record["comparisons"] > old["comparisons"]:
+            print(f"REGRESSION {where}: {old['comparisons']:,} -> {record['comparisons']:,} comparisons")
+            regressions += 1
+    print(f"{regressions} regression(s)")
+    return regressions
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Benchmark the sorts of SortingAlgorithms.")
+    parser.add_argument("--sorts", nargs="+", choices=SORTS, default=list(SORTS))
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS, default=list(DISTRIBUTIONS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(SIZES))
+    parser.add_argument("--time-cap", type=float, default=10.0,
+                        help="Skip a size when the estimate from the previous size exceeds this many seconds.")
+    parser.add_argument("--repeat", type=int, default=3, help="Keep the best time of this many runs.")
+    parser.add_argument("--memory-max-size", type=int, default=100_000,
+                        help="Largest size measured with tracemalloc, which slows allocations down.")
+    parser.add_argument("--count-max-size", type=int, default=10_000,
+                        help="Largest size whose comparisons and moves are counted.")
+    parser.add_argument("--key-check-size", type=int, default=1_000,
+                        help="Number of records sorted with key= and reverse=, to check stability.")
+    parser.add_argument("--seed", default="0")
+    parser.add_argument("--json", help="Write the results to this JSON file.")
+    parser.add_argument("--csv", help="Write the results to this CSV file.")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare with.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown before a regression.")
+    return parser.parse_args(argv)
+
+
+#############
+# Benchmark #
+#############
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    results = run_suite(args)
+    key_checks = run_key_checks(args)
+    if args.json:
+        write_json(args.json, results, key_checks, args)
+    if args.csv:
+        write_csv(args.csv, results)
+    failed = sum(check["status"] != "ok" for check in key_checks)
+    if failed:
+        print(f"{failed} key check(s) failed")
+    failed += len(check_imports())
+    if (args.baseline and compare_with_baseline(args.baseline, results, args.tolerance)) or failed:
+        sys.exit(1)
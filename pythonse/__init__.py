@@ -0,0 +1,117 @@
+"""
+PythonSE: the algorithms and data structures of this repository as one package.
+
+Nothing is imported up front: `import pythonse` only reads this file, and a
+name such as `pythonse.BTree` imports its module the first time it is used.
+Worker processes that need a single structure do not pay for the others.
+
+    import pythonse
+    tree = pythonse.BTree(order=64)  # Imports DataStructures/BTree/b_tree.py now
+
+The directories are subpackages too, for the names not listed here:
+
+    from pythonse.SortingAlgorithms.MergeSort.best_merge_sort import merge_sort
+"""
+import importlib
+import os
+
+# Installed, the directories sit inside this package; in a source checkout
+# they are next to it
+if not os.path.isdir(os.path.join(__path__[0], "DataStructures")):
+    __path__.append(os.path.dirname(__path__[0]))
+
+SUBPACKAGES = ("DataStructures", "DynamicProgramming", "SortingAlgorithms")
+
+# name: module it is defined in, relative to this package
+_EXPORTS = {
+    # Data structures
+    "AVLTree": "DataStructures.AVLTree.avl_tree",
+    "CountingAVLTree": "DataStructures.AVLTree.avl_tree",
+    "AVLMap": "DataStructures.AVLTree.avl_map",
+    "CountingAVLMap": "DataStructures.AVLTree.avl_map",
+    "IntervalTree": "DataStructures.AVLTree.interval_tree",
+    "BTree": "DataStructures.BTree.b_tree",
+    "DiskBTree": "DataStructures.BTree.disk_b_tree",
+    "BinarySearchTree": "DataStructures.BinaryTree.binary_tree",
+    "BloomFilter": "DataStructures.BloomFilter.bloom_filter",
+    "FenwickTree": "DataStructures.FenwickTree.fenwick_tree",
+    "HashTable": "DataStructures.HashTable.hash_table",
+    "CountingHashTable": "DataStructures.HashTable.hash_table",
+    "Heap": "DataStructures.Heap.heap",
+    "nsmallest": "DataStructures.Heap.heap",
+    "nlargest": "DataStructures.Heap.heap",
+    "MaxHeap": "DataStructures.Heap.max_heap",
+    "MinHeap": "DataStructures.Heap.min_heap",
+    "ARCCache": "DataStructures.LinkedList.arc_cache",
+    "CircularLinkedList": "DataStructures.LinkedList.circular_linked_list",
+    "DoublyLinkedList": "DataStructures.LinkedList.double_linked_list",
+    "LFUCache": "DataStructures.LinkedList.lfu_cache",
+    "SinglyLinkedList": "DataStructures.LinkedList.linked_list",
+    "LRUCache": "DataStructures.LinkedList.lru_cache",
+    "ThreadSafeCache": "DataStructures.LinkedList.lru_cache",
+    "UnrolledLinkedList": "DataStructures.LinkedList.unrolled_linked_list",
+    "CircularQueue": "DataStructures.Queue.cirular_queue",
+    "TypedCircularQueue": "DataStructures.Queue.cirular_queue",
+    "BlockingPriorityQueue": "DataStructures.Queue.concurrent_priority_queue",
+    "AsyncPriorityQueue": "DataStructures.Queue.concurrent_priority_queue",
+    "PriorityQueue": "DataStructures.Queue.priority_queue",
+    "StandardQueue": "DataStructures.Queue.queue",
+    "QueueClosed": "DataStructures.Queue.queue",
+    "BlockingQueue": "DataStructures.Queue.queue",
+    "SharedCircularQueue": "DataStructures.Queue.shared_circular_queue",
+    "WorkStealingQueues": "DataStructures.Queue.work_stealing_queue",
+    "RedBlackTree": "DataStructures.RedBlackTree.red_black_tree",
+    "CountingRedBlackTree": "DataStructures.RedBlackTree.red_black_tree",
+    "SegmentTree": "DataStructures.SegmentTree.segment_tree",
+    "SkipList": "DataStructures.SkipList.skiplist",
+    "CountingSkipList": "DataStructures.SkipList.skiplist",
+    "BlockSparseTable": "DataStructures.SparseTable.block_sparse_table",
+    "SparseTable": "DataStructures.SparseTable.sparse_table",
+    "Stack": "DataStructures.Stack.stack",
+    # Dynamic programming
+    "edit_distance": "DynamicProgramming.EditDistance.edit_distance",
+    "weighted_interval_scheduling": "DynamicProgramming.IntervalScheduling.interval_scheduling",
+    "knapsack": "DynamicProgramming.KnapsackProblem.knapsack_problem",
+    "longest_common_subsequence": "DynamicProgramming.LongestCommonSubsequence.longest_common_subsequence",
+    "GridPathSolver": "DynamicProgramming.ShortestPathGrid.shortest_path_grid",  # Needs numpy
+    "minimum_total": "DynamicProgramming.TriangleMinimumPath.triangle_minimum_path",
+    "word_break": "DynamicProgramming.WordBreakProblem.word_break_problem",
+    # Sorting algorithms
+    "bubble_sort": "SortingAlgorithms.BubbleSort.bubble_sort",
+    "bucket_sort": "SortingAlgorithms.BucketSort.bucket_sort",
+    "counting_sort": "SortingAlgorithms.CountingSort.counting_sort",
+    "external_sort": "SortingAlgorithms.ExternalSort.external_sort",
+    "heap_sort": "SortingAlgorithms.HeapSort.heap_sort",
+    "insertion_sort": "SortingAlgorithms.InsertionSort.insertion_sort",
+    "merge_sort": "SortingAlgorithms.MergeSort.merge_sort",
+    "parallel_merge_sort": "SortingAlgorithms.MergeSort.parallel_merge_sort",
+    "quick_sort": "SortingAlgorithms.QuickSort.quick_sort",
+    "quick_sort_in_place": "SortingAlgorithms.QuickSort.best_quick_sort",
+    "radix_sort": "SortingAlgorithms.RadixSort.radix_sort",
+    "sample_sort": "SortingAlgorithms.SampleSort.sample_sort",
+    "selection_sort": "SortingAlgorithms.SelectionSort.selection_sort",
+    "shell_sort": "SortingAlgorithms.ShellSort.shell_sort",
+    "tim_sort": "SortingAlgorithms.TimSort.tim_sort",
+    "Counted": "SortingAlgorithms.instrumentation",
+    "CountingList": "SortingAlgorithms.instrumentation",
+    "count_operations": "SortingAlgorithms.instrumentation",
+    "sort_by_key": "SortingAlgorithms.sort_keys",
+}
+
+__all__ = list(SUBPACKAGES) + list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Imports the module of a name on first access, then caches the name here."""
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module("." + _EXPORTS[name], __name__), name)
+    elif name in SUBPACKAGES:
+        value = importlib.import_module("." + name, __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
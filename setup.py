@@ -0,0 +1,17 @@
+"""
+The package layout lives here because it does not fit pyproject.toml: the
+directories of the repository become subpackages of pythonse, so that
+DataStructures/BTree/b_tree.py installs as pythonse.DataStructures.BTree.b_tree.
+"""
+from setuptools import find_packages, setup
+
+DIRECTORIES = ("DataStructures", "DynamicProgramming", "SortingAlgorithms")
+
+packages = ["pythonse"]
+package_dir = {"pythonse": "pythonse"}
+for directory in DIRECTORIES:
+    for package in [directory] + [f"{directory}.{name}" for name in find_packages(directory)]:
+        packages.append(f"pythonse.{package}")
+        package_dir[f"pythonse.{package}"] = package.replace(".", "/")
+
+setup(packages=packages, package_dir=package_dir)